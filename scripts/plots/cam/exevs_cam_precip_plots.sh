@@ -43,6 +43,30 @@ fi
 # Run All CAM precip/plots Jobs
 chmod u+x ${DATA}/${VERIF_CASE}/${STEP}/plotting_job_scripts/*
 ncount_job=$(ls -l ${DATA}/${VERIF_CASE}/${STEP}/plotting_job_scripts/job* |wc -l)
+# Read the model stat files of each plotting job in parallel on the
+# cores the plotting jobs would leave idle; on WCOSS2 each POE task then
+# gets CREATE_DF_NPROC cores, and there are that many fewer tasks
+node_ncpu=${ncpu:-$nproc}
+if [ -z "$CREATE_DF_NPROC" ]; then
+    if [ $USE_CFP = YES ]; then
+        export CREATE_DF_NPROC=1
+        if [ $machine = WCOSS2 ] && [ $ncount_job -gt 0 ]; then
+            export CREATE_DF_NPROC=$((nproc/ncount_job))
+        fi
+    else
+        export CREATE_DF_NPROC=$node_ncpu
+    fi
+fi
+if [ $CREATE_DF_NPROC -gt $node_ncpu ]; then
+    export CREATE_DF_NPROC=$node_ncpu
+fi
+# POE tasks must share the cores of a node evenly
+while [ $CREATE_DF_NPROC -gt 1 ] && [ $((node_ncpu % CREATE_DF_NPROC)) -ne 0 ]; do
+    export CREATE_DF_NPROC=$((CREATE_DF_NPROC-1))
+done
+if [ $CREATE_DF_NPROC -lt 1 ]; then
+    export CREATE_DF_NPROC=1
+fi
 nc=1
 if [ $USE_CFP = YES ]; then
     ncount_poe=$(ls -l ${DATA}/${VERIF_CASE}/${STEP}/plotting_job_scripts/poe* |wc -l)
@@ -52,7 +76,7 @@ if [ $USE_CFP = YES ]; then
         export MP_PGMMODEL=mpmd
         export MP_CMDFILE=${poe_script}
         if [ $machine = WCOSS2 ]; then
-            launcher="mpiexec -np $nproc -ppn $ncpu --cpu-bind verbose,depth cfp"
+            launcher="mpiexec -np $((nproc/CREATE_DF_NPROC)) -ppn $((node_ncpu/CREATE_DF_NPROC)) --cpu-bind verbose,depth --depth $CREATE_DF_NPROC cfp"
         elif [$machine = HERA -o $machine = ORION -o $machine = S4 -o $machine = JET ]; then
             export SLURM_KILL_BAD_EXIT=0
             launcher="srun --export=ALL --multi-prog"
@@ -31,24 +31,19 @@ nws_logo() {
   return $error
 }
 
+#--- plot the Hits/False Alarms Distribution for all basins and models
+#  /lfs/h2/emc/ptmp/jiayi.peng/com/evs/1.0/hurricane_global_det/tcgen/stats
+cd ${DATA}
+python ${USHevs}/${COMPONENT}/tcgen_space_plots.py
+export err=$?; err_chk
+
 for basin in $basinlist; do
 ### basin do loop start
 for model in $modellist; do
 ### model do loop start
 
 export OUTPUT=${DATA}/${basin}_${model}
-if [ ! -d ${OUTPUT} ]; then mkdir -p ${OUTPUT}; fi
-
-#--- plot the Hits/False Alarms Distribution
-#  /lfs/h2/emc/ptmp/jiayi.peng/com/evs/1.0/hurricane_global_det/tcgen/stats
 cd ${OUTPUT}
-cp ${USHevs}/hurricane/plots/hits_${basin}.py .
-cp ${COMINstats}/tc_gen_${YEAR}_genmpr_${basin}_${model}.txt tc_gen_${YEAR}_genmpr.txt 
-grep "00    FYOY" tc_gen_${YEAR}_genmpr.txt > tc_gen_hits.txt
-export hitfile="tc_gen_hits.txt"
-python hits_${basin}.py
-convert TC_genesis.png tcgen_hits_${basin}_${model}.gif
-
 # Attach NOAA logo
 export gif_name=tcgen_hits_${basin}_${model}.gif
 TargetImageName=$gif_name
@@ -61,16 +56,6 @@ TargetImageName=$gif_name
 nws_logo $TargetImageName
 error=$?
 
-rm -f TC_genesis.png
-
-cp ${USHevs}/${COMPONENT}/false_${basin}.py .
-grep "00    FYON" tc_gen_${YEAR}_genmpr.txt > tc_gen_false.txt
-grep "NA    FYON" tc_gen_${YEAR}_genmpr.txt >> tc_gen_false.txt
-export falsefile="tc_gen_false.txt"
-python false_${basin}.py
-convert TC_genesis.png tcgen_falseAlarm_${basin}_${model}.gif
-rm -f TC_genesis.png
-
 # Attach NOAA logo
 export gif_name1=tcgen_falseAlarm_${basin}_${model}.gif
 TargetImageName=$gif_name1
@@ -83,11 +68,6 @@ TargetImageName=$gif_name1
 nws_logo $TargetImageName
 error=$?
 
-cp ${USHevs}/${COMPONENT}/tcgen_space_${basin}.py .
-python tcgen_space_${basin}.py
-convert TC_genesis.png tcgen_HitFalse_${basin}_${model}.gif
-rm -f TC_genesis.png
-
 # Attach NOAA logo
 export gif_name2=tcgen_HitFalse_${basin}_${model}.gif
 TargetImageName=$gif_name2
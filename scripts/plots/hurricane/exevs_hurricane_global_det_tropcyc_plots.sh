@@ -4,6 +4,7 @@ export PS4=' + exevs_hurricane_global_det_tropcyc_plots.sh line $LINENO: '
 
 export stormYear=${YYYY}
 export basinlist="al ep wp"
+rm -f ${DATA}/tropcyc_plot_batch_list ${DATA}/tropcyc_plot_storm_list ${DATA}/tropcyc_plot_basin_list
 export numlist="01 02 03 04 05 06 07 08 09 10 11 12 13 14 15 16 17 18 19 20 \
 	        21 22 23 24 25 26 27 28 29 30 31 32 33 34 35 36 37 38 39 40"
 
@@ -68,41 +69,11 @@ stormName=$(sed "s/ //g" <<< $VARIABLE2)
 echo "Name_${stormName}_Name"
 echo "${stormBasin}, ${stormNumber}, ${stormYear}, ${stormName}"
 
-#---Storm Plots 
-export LOGOroot=${FIXevs}/logos
-export PLOTDATA=${STORMroot}
-#export RUN="tropcyc"
-export img_quality="low"
-
-export fhr_list="0,12,24,36,48,60,72,84,96,108,120,132,144,156,168"
-export model_tmp_atcf_name_list="MD01,MD02,MD03,MD04"
-export model_plot_name_list="GFS,ECMWF,CMC,UKM"
-export plot_CI_bars="NO"
+#---Storm Plots, made for all storms and basins at once below
 export under="_"
 export tc_name=${stbasin}${under}${stormYear}${under}${stormName}
-export basin=${stbasin}
-export tc_num=${stormNumber}
-export tropcyc_model_type="global"
-python ${USHevs}/${COMPONENT}/plot_tropcyc_lead_average.py
-
-#/lfs/h2/emc/ptmp/jiayi.peng/metTC/wp02/plot/WP_2022_MALAKAS/images
-nimgs=$(ls ${STORMroot}/plot/${tc_name}/images/* |wc -l)
-if [ $nimgs -ne 0 ]; then
-  cd ${STORMroot}/plot/${tc_name}/images
-  convert ABSAMAX_WIND-BMAX_WIND_fhrmean_${tc_name}_global.png ABSAMAX_WIND-BMAX_WIND_fhrmean_${tc_name}_global.gif
-  convert AMAX_WIND-BMAX_WIND_fhrmean_${tc_name}_global.png AMAX_WIND-BMAX_WIND_fhrmean_${tc_name}_global.gif
-  convert ABSTK_ERR_fhrmean_${tc_name}_global.png ABSTK_ERR_fhrmean_${tc_name}_global.gif
-  convert ALTK_ERR_fhrmean_${tc_name}_global.png ALTK_ERR_fhrmean_${tc_name}_global.gif
-  convert CRTK_ERR_fhrmean_${tc_name}_global.png CRTK_ERR_fhrmean_${tc_name}_global.gif
-  rm -f *.png
-  if [ "$SENDCOM" = 'YES' ]; then
-    cp ${STORMroot}/plot/${tc_name}/images/ABSAMAX_WIND-BMAX_WIND_fhrmean_${tc_name}_global.gif ${comoutroot}/evs.hurricane_global_det.abswind_err.${stormBasin}.${stormYear}.${stormName}${stormNumber}.png
-    cp ${STORMroot}/plot/${tc_name}/images/AMAX_WIND-BMAX_WIND_fhrmean_${tc_name}_global.gif ${comoutroot}/evs.hurricane_global_det.wind_bias.${stormBasin}.${stormYear}.${stormName}${stormNumber}.png 
-    cp ${STORMroot}/plot/${tc_name}/images/ABSTK_ERR_fhrmean_${tc_name}_global.gif ${comoutroot}/evs.hurricane_global_det.abstk_err.${stormBasin}.${stormYear}.${stormName}${stormNumber}.png
-    cp ${STORMroot}/plot/${tc_name}/images/ALTK_ERR_fhrmean_${tc_name}_global.gif ${comoutroot}/evs.hurricane_global_det.altk_bias.${stormBasin}.${stormYear}.${stormName}${stormNumber}.png
-    cp ${STORMroot}/plot/${tc_name}/images/CRTK_ERR_fhrmean_${tc_name}_global.gif ${comoutroot}/evs.hurricane_global_det.crtk_bias.${stormBasin}.${stormYear}.${stormName}${stormNumber}.png
-  fi
-fi
+echo "${STORMroot} ${stbasin} ${tc_name} ${stormNumber}" >> ${DATA}/tropcyc_plot_batch_list
+echo "${STORMroot} ${tc_name} ${comoutroot} ${stormBasin} ${stormNumber} ${stormName}" >> ${DATA}/tropcyc_plot_storm_list
 
 ### two ifs end
 fi
@@ -135,9 +106,16 @@ elif [ ${stormBasin} = "wp" ]; then
   cp $metTCcomout/tc_stat/tc_stat_basin.out $metTCcomout/tc_stat/tc_stat.out
 fi
 
-#--- Basin-Storms Plots 
+#--- Basin-Storms Plots, made for all storms and basins at once below
+export stormNameB=Basin
+export tc_name=${stbasin}${under}${stormYear}${under}${stormNameB}
+echo "${metTCcomout} ${stbasin} ${tc_name}" >> ${DATA}/tropcyc_plot_batch_list
+echo "${metTCcomout} ${tc_name} ${comoutbas} ${stormBasin}" >> ${DATA}/tropcyc_plot_basin_list
+### bas do loop end
+done
+
+#--- Plot all storms and basins in one run
 export LOGOroot=${FIXevs}/logos
-export PLOTDATA=${metTCcomout}
 #export RUN="tropcyc"
 export img_quality="low"
 
@@ -145,13 +123,42 @@ export fhr_list="0,12,24,36,48,60,72,84,96,108,120,132,144,156,168"
 export model_tmp_atcf_name_list="MD01,MD02,MD03,MD04"
 export model_plot_name_list="GFS,ECMWF,CMC,UKM"
 export plot_CI_bars="NO"
-export stormNameB=Basin
-export tc_name=${stbasin}${under}${stormYear}${under}${stormNameB}
-export basin=${stbasin}
-export tc_num= 
 export tropcyc_model_type="global"
-python ${USHevs}/${COMPONENT}/plot_tropcyc_lead_average.py
+export tc_plot_batch_file=${DATA}/tropcyc_plot_batch_list
+export tc_plot_nproc=${tc_plot_nproc:-1}
+if [ -s ${tc_plot_batch_file} ]; then
+  python ${USHevs}/${COMPONENT}/plot_tropcyc_lead_average.py
+fi
+
+if [ -s ${DATA}/tropcyc_plot_storm_list ]; then
+while read STORMroot tc_name comoutroot stormBasin stormNumber stormName; do
+### storm do loop start
+#/lfs/h2/emc/ptmp/jiayi.peng/metTC/wp02/plot/WP_2022_MALAKAS/images
+nimgs=$(ls ${STORMroot}/plot/${tc_name}/images/* |wc -l)
+if [ $nimgs -ne 0 ]; then
+  cd ${STORMroot}/plot/${tc_name}/images
+  convert ABSAMAX_WIND-BMAX_WIND_fhrmean_${tc_name}_global.png ABSAMAX_WIND-BMAX_WIND_fhrmean_${tc_name}_global.gif
+  convert AMAX_WIND-BMAX_WIND_fhrmean_${tc_name}_global.png AMAX_WIND-BMAX_WIND_fhrmean_${tc_name}_global.gif
+  convert ABSTK_ERR_fhrmean_${tc_name}_global.png ABSTK_ERR_fhrmean_${tc_name}_global.gif
+  convert ALTK_ERR_fhrmean_${tc_name}_global.png ALTK_ERR_fhrmean_${tc_name}_global.gif
+  convert CRTK_ERR_fhrmean_${tc_name}_global.png CRTK_ERR_fhrmean_${tc_name}_global.gif
+  rm -f *.png
+  if [ "$SENDCOM" = 'YES' ]; then
+    cp ${STORMroot}/plot/${tc_name}/images/ABSAMAX_WIND-BMAX_WIND_fhrmean_${tc_name}_global.gif ${comoutroot}/evs.hurricane_global_det.abswind_err.${stormBasin}.${stormYear}.${stormName}${stormNumber}.png
+    cp ${STORMroot}/plot/${tc_name}/images/AMAX_WIND-BMAX_WIND_fhrmean_${tc_name}_global.gif ${comoutroot}/evs.hurricane_global_det.wind_bias.${stormBasin}.${stormYear}.${stormName}${stormNumber}.png 
+    cp ${STORMroot}/plot/${tc_name}/images/ABSTK_ERR_fhrmean_${tc_name}_global.gif ${comoutroot}/evs.hurricane_global_det.abstk_err.${stormBasin}.${stormYear}.${stormName}${stormNumber}.png
+    cp ${STORMroot}/plot/${tc_name}/images/ALTK_ERR_fhrmean_${tc_name}_global.gif ${comoutroot}/evs.hurricane_global_det.altk_bias.${stormBasin}.${stormYear}.${stormName}${stormNumber}.png
+    cp ${STORMroot}/plot/${tc_name}/images/CRTK_ERR_fhrmean_${tc_name}_global.gif ${comoutroot}/evs.hurricane_global_det.crtk_bias.${stormBasin}.${stormYear}.${stormName}${stormNumber}.png
+  fi
+fi
+
+### storm do loop end
+done < ${DATA}/tropcyc_plot_storm_list
+fi
 
+if [ -s ${DATA}/tropcyc_plot_basin_list ]; then
+while read metTCcomout tc_name comoutbas stormBasin; do
+### basin do loop start
 bimgs=$(ls ${metTCcomout}/plot/${tc_name}/images/* |wc -l)
 if [ $bimgs -ne 0 ]; then
   cd ${metTCcomout}/plot/${tc_name}/images
@@ -169,5 +176,6 @@ if [ $bimgs -ne 0 ]; then
     cp -r ${metTCcomout}/plot/${tc_name}/images/CRTK_ERR_fhrmean_${tc_name}_global.gif ${comoutbas}/evs.hurricane_global_det.crtk_bias.${stormBasin}.${stormYear}.season.png
   fi
 fi
-### bas do loop end
-done
+### basin do loop end
+done < ${DATA}/tropcyc_plot_basin_list
+fi
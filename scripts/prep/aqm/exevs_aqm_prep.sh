@@ -58,21 +58,27 @@ echo $model1
 let ic=0
 let endvhr=23
 conf_dir=${PARMevs}/metplus_config/${STEP}/${COMPONENT}/${VERIF_CASE}
+airnow_valid_list=""
 while [ ${ic} -le ${endvhr} ]; do
     vldhr=$(printf %2.2d ${ic})
     checkfile=${DCOMIN}/${VDATE}/airnow/${HOURLY_INPUT_TYPE}_${VDATE}${vldhr}.dat
     if [ -s ${checkfile} ]; then
-        export VHOUR=${vldhr}
-	if [ -s ${conf_dir}/Ascii2Nc_hourly_obsAIRNOW.conf ]; then
-            run_metplus.py ${conf_dir}/Ascii2Nc_hourly_obsAIRNOW.conf ${PARMevs}/metplus_config/machine.conf
-	    export err=$?; err_chk
-	    if [ ${SENDCOM} = "YES" ]; then
-                cpfile=${PREP_SAVE_DIR}/airnow_hourly_aqobs_${VDATE}${VHOUR}.nc 
-                if [ -s ${cpfile} ]; then cp -v ${cpfile} ${COMOUTproc}; fi
-	    fi
+        if [ "${airnow_hourly_type}" == "aqobs" ]; then
+            ## All available hours are converted in one METplus run below
+            airnow_valid_list="${airnow_valid_list:+${airnow_valid_list}, }${VDATE}${vldhr}"
         else
-            echo "WARNING: can not find ${conf_dir}/Ascii2Nc_hourly_obsAIRNOW.conf"
-	fi
+            export VHOUR=${vldhr}
+	    if [ -s ${conf_dir}/Ascii2Nc_hourly_obsAIRNOW.conf ]; then
+                run_metplus.py ${conf_dir}/Ascii2Nc_hourly_obsAIRNOW.conf ${PARMevs}/metplus_config/machine.conf
+	        export err=$?; err_chk
+	        if [ ${SENDCOM} = "YES" ]; then
+                    cpfile=${PREP_SAVE_DIR}/airnow_${HOURLY_OUTPUT_TYPE}_${VDATE}${VHOUR}.nc
+                    if [ -s ${cpfile} ]; then cp -v ${cpfile} ${COMOUTproc}; fi
+	        fi
+            else
+                echo "WARNING: can not find ${conf_dir}/Ascii2Nc_hourly_obsAIRNOW.conf"
+	    fi
+        fi
     else
         if [ ${SENDMAIL} = "YES" ]; then
             export subject="AIRNOW ASCII Hourly Data Missing for EVS ${COMPONENT}"
@@ -88,6 +94,25 @@ while [ ${ic} -le ${endvhr} ]; do
     ((ic++))
 done
 ##
+## HourlyAQObs files are read by python embedding, which parses the whole
+## day once, so all hours are converted in a single METplus run
+##
+if [ -n "${airnow_valid_list}" ]; then
+    export AIRNOW_VALID_LIST="${airnow_valid_list}"
+    if [ -s ${conf_dir}/Ascii2Nc_pyembed_hourly_obsAIRNOW.conf ]; then
+        run_metplus.py ${conf_dir}/Ascii2Nc_pyembed_hourly_obsAIRNOW.conf ${PARMevs}/metplus_config/machine.conf
+        export err=$?; err_chk
+        if [ ${SENDCOM} = "YES" ]; then
+            for vldhr in $(echo ${airnow_valid_list} | tr -d ','); do
+                cpfile=${PREP_SAVE_DIR}/airnow_${HOURLY_OUTPUT_TYPE}_${vldhr}.nc
+                if [ -s ${cpfile} ]; then cp -v ${cpfile} ${COMOUTproc}; fi
+            done
+        fi
+    else
+        echo "WARNING: can not find ${conf_dir}/Ascii2Nc_pyembed_hourly_obsAIRNOW.conf"
+    fi
+fi
+##
 ## Daily (MAX/AVG) AirNOW observation
 ##
 checkfile=${DCOMIN}/${VDATE}/airnow/daily_data_v2.dat
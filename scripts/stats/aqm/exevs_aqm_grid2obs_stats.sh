@@ -90,10 +90,10 @@ for outtyp in awpozcon pm25; do
     
   case ${outtyp} in
       awpozcon) point_stat_conf_file=PointStat_fcstOZONE_obsAIRNOW.conf
-                stat_analysis_conf_file=StatAnalysis_fcstOZONE_obsAIRNOW_GatherByDay.conf
+                gather_obtype=AIRNOW_HOURLY_AQOBS
                 stat_output_index=ozone;;
       pm25)     point_stat_conf_file=PointStat_fcstPM2p5_obsAIRNOW.conf
-                stat_analysis_conf_file=StatAnalysis_fcstPM_obsANOWPM_GatherByDay.conf
+                gather_obtype=AIRNOW_HOURLY_AQOBS
                 stat_output_index=pm25;;
   esac
 
@@ -181,10 +181,10 @@ for outtyp in awpozcon pm25; do
       if [ ${stat_file_count} -ne 0 ]; then
         cpreq ${COMOUTsmall}/*${outtyp}${bcout}* ${finalstat}
         cd ${finalstat}
-        run_metplus.py ${conf_file_dir}/${stat_analysis_conf_file} ${PARMevs}/metplus_config/machine.conf
+        cpfile=${finalstat}/evs.${STEP}.${COMPONENT}${bcout}.${RUN}.${VERIF_CASE}_${stat_output_index}.v${VDATE}.stat
+        python ${USHevs}/${COMPONENT}/gather_stat_files.py ${VDATE}00 ${VDATE}23 ${gather_obtype} "${model1}:${finalstat}/*${outtyp}${bcout}*:${cpfile}"
         export err=$?; err_chk
         if [ ${SENDCOM} = "YES" ]; then
-          cpfile=${finalstat}/evs.${STEP}.${COMPONENT}${bcout}.${RUN}.${VERIF_CASE}_${stat_output_index}.v${VDATE}.stat
           if [ -s ${cpfile} ]; then cp -v ${cpfile} ${COMOUTfinal}; fi
         fi
       fi
@@ -216,7 +216,7 @@ if [ ${vhr} = 11 ]; then
 
   export outtyp=OZMAX8
   point_stat_conf_file=PointStat_fcstOZONEMAX_obsAIRNOW.conf
-  stat_analysis_conf_file=StatAnalysis_fcstOZONEMAX_obsAIRNOW_GatherByDay.conf
+  gather_obtype=AIRNOW_DAILY_V2
 
   fcstmax=48
 
@@ -290,10 +290,10 @@ if [ ${vhr} = 11 ]; then
     stat_file_count=$(find ${COMOUTsmall} -name "*${outtyp}${bcout}*" | wc -l)
     if [ ${stat_file_count} -ne 0 ]; then
       cpreq ${COMOUTsmall}/*${outtyp}${bcout}* ${finalstat}
-      run_metplus.py ${conf_file_dir}/${stat_analysis_conf_file} ${PARMevs}/metplus_config/machine.conf
+      cpfile=${finalstat}/evs.${STEP}.${COMPONENT}${bcout}.${RUN}.${VERIF_CASE}_ozmax8.v${VDATE}.stat
+      python ${USHevs}/${COMPONENT}/gather_stat_files.py ${VDATE}00 ${VDATE}23 ${gather_obtype} "${model1}:${finalstat}/*${outtyp}${bcout}*:${cpfile}"
       export err=$?; err_chk
       if [ ${SENDCOM} = "YES" ]; then
-        cpfile=${finalstat}/evs.${STEP}.${COMPONENT}${bcout}.${RUN}.${VERIF_CASE}_ozmax8.v${VDATE}.stat
         if [ -s ${cpfile} ]; then cp -v ${cpfile} ${COMOUTfinal}; fi
       fi
     fi
@@ -307,7 +307,7 @@ if [ ${vhr} = 04 ]; then
 
   export outtyp=PMAVE
   point_stat_conf_file=PointStat_fcstPMAVE_obsANOWPM.conf
-  stat_analysis_conf_file=StatAnalysis_fcstPMAVE_obsANOWPM_GatherByDay.conf
+  gather_obtype=AIRNOW_DAILY_V2
 
   fcstmax=48
   for biastyp in raw bc; do
@@ -383,10 +383,10 @@ if [ ${vhr} = 04 ]; then
     stat_file_count=$(find ${COMOUTsmall} -name "*${outtyp}${bcout}*" | wc -l)
     if [ ${stat_file_count} -ne 0 ]; then
       cpreq ${COMOUTsmall}/*${outtyp}${bcout}* ${finalstat}
-      run_metplus.py ${conf_file_dir}/${stat_analysis_conf_file} ${PARMevs}/metplus_config/machine.conf
+      cpfile=${finalstat}/evs.${STEP}.${COMPONENT}${bcout}.${RUN}.${VERIF_CASE}_pmave.v${VDATE}.stat
+      python ${USHevs}/${COMPONENT}/gather_stat_files.py ${VDATE}00 ${VDATE}23 ${gather_obtype} "${model1}:${finalstat}/*${outtyp}${bcout}*:${cpfile}"
       export err=$?; err_chk
       if [ ${SENDCOM} = "YES" ]; then
-        cpfile=${finalstat}/evs.${STEP}.${COMPONENT}${bcout}.${RUN}.${VERIF_CASE}_pmave.v${VDATE}.stat
         if [ -s ${cpfile} ]; then cp -v ${cpfile} ${COMOUTfinal}; fi
       fi
     fi
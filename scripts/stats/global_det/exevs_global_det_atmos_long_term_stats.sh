@@ -30,6 +30,15 @@ if [ $SENDCOM = YES ]; then
             fi
         done
     done
+    for MODEL_PATH in $DATA/monthly/grid2grid/daily_partial_sums/*; do
+        MODEL_SUBDIR=$(echo ${MODEL_PATH##*/})
+        mkdir -p $COMOUTpartialsums/$MODEL_SUBDIR
+        for FILE in $DATA/monthly/grid2grid/daily_partial_sums/$MODEL_SUBDIR/*; do
+            if [ -f $FILE ]; then
+                cp -v $FILE $COMOUTpartialsums/$MODEL_SUBDIR/.
+            fi
+        done
+    done
     if [ $VDATEmm = 12 ]; then
         for MODEL_PATH in $DATA/yearly/grid2grid/yearly_means/*; do
             MODEL_SUBDIR=$(echo ${MODEL_PATH##*/})
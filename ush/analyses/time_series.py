@@ -21,7 +21,6 @@ import numpy as np
 import math
 import pandas as pd
 import logging
-from functools import reduce
 import matplotlib
 matplotlib.use('agg')
 import matplotlib.pyplot as plt
@@ -287,20 +286,19 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
         # Remove data if they exist for some but not all models at some value of 
         # the indep. variable. Otherwise plot_util.calculate_stat will throw an 
         # error
-        df_split = [
-            df_aggregated.xs(str(model)) for model in model_list
-        ]
-        df_reduced = reduce(
-            lambda x,y: pd.merge(
-                x, y, on=str(date_type).upper(), how='inner'
-            ), 
-            df_split
+        agg_models = df_aggregated.index.get_level_values('MODEL')
+        agg_dates = df_aggregated.index.get_level_values(
+            str(date_type).upper()
         )
-    
-        df_aggregated = df_aggregated[
-            df_aggregated.index.get_level_values(str(date_type).upper())
-            .isin(df_reduced.index)
+        model_list_str = [str(model) for model in model_list]
+        in_model_list = agg_models.isin(model_list_str)
+        n_models_per_date = pd.Series(
+            agg_models[in_model_list]
+        ).groupby(agg_dates[in_model_list]).nunique()
+        shared_dates = n_models_per_date.index[
+            n_models_per_date == len(set(model_list_str))
         ]
+        df_aggregated = df_aggregated[agg_dates.isin(shared_dates)]
     if df_aggregated.empty:
         logger.warning(f"Empty Dataframe. Continuing onto next plot...")
         plt.close(num)
@@ -658,6 +656,10 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
     else:
         handles = []
         labels = []
+    # Average each model's time series all at once
+    pivot_metric1_mean = pivot_metric1.mean()
+    if metric2_name is not None:
+        pivot_metric2_mean = pivot_metric2.mean()
     n_mods = 0
     for m in range(len(mod_setting_dicts)):
         if model_list[m] in model_colors.model_alias:
@@ -669,10 +671,10 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
         if str(model_list[m]) not in pivot_metric1:
             continue
         y_vals_metric1 = pivot_metric1[str(model_list[m])].values
-        y_vals_metric1_mean = np.nanmean(y_vals_metric1)
+        y_vals_metric1_mean = pivot_metric1_mean[str(model_list[m])]
         if metric2_name is not None:
             y_vals_metric2 = pivot_metric2[str(model_list[m])].values
-            y_vals_metric2_mean = np.nanmean(y_vals_metric2)
+            y_vals_metric2_mean = pivot_metric2_mean[str(model_list[m])]
         if confidence_intervals:
             y_vals_ci_lower1 = pivot_ci_lower1[
                 str(model_list[m])
@@ -0,0 +1,308 @@
+#! /usr/bin/env python3
+
+import sys
+import os
+import glob
+import datetime
+
+import numpy
+import pandas
+
+# set to true to output more info
+DEBUG = False
+
+# constant values that will be used for every observation
+ELEVATION = 'NA'
+QC_STRING = '1'
+
+# message types MET ascii2nc uses for the AirNow formats
+HOURLY_MESSAGE_TYPE = 'AIRNOW_HOURLY_AQOBS'
+DAILY_MESSAGE_TYPE = 'AIRNOW_DAILY_V2'
+
+# hourly AQObs value columns and the column flagging
+# measured (1) or AQI derived (0) values
+HOURLY_AQOBS_VARS = {
+    'OZONE': 'OZONE_Measured',
+    'PM25': 'PM25_Measured',
+    'PM10': 'PM10_Measured',
+    'NO2': 'NO2_Measured',
+    'CO': None,
+    'SO2': None,
+}
+
+# column names of the pipe delimited daily_data_v2.dat file
+DAILY_V2_COLS = ['ValidDate', 'AQSID', 'SiteName', 'ParameterName',
+                 'ReportingUnits', 'Value', 'AveragingPeriod', 'DataSource',
+                 'AQI', 'Category', 'Latitude', 'Longitude', 'FullAQSID']
+
+"""Read a whole day of EPA AirNow observations and format them as the
+input 11-column observations for ASCII2NC python embedding:
+(1)  string:  Message_Type
+(2)  string:  Station_ID
+(3)  string:  Valid_Time(YYYYMMDD_HHMMSS)
+(4)  numeric: Lat(Deg North)
+(5)  numeric: Lon(Deg East)
+(6)  numeric: Elevation(msl)
+(7)  string:  Var_Name(or GRIB_Code)
+(8)  numeric: Level
+(9)  numeric: Height(msl or agl)
+(10) string:  QC_String
+(11) numeric: Observation_Value
+
+Usage:
+    read_airnow_metplus.py hourly_aqobs AIRNOW_DIR YYYYmmddHH
+        reads all HourlyAQObs_YYYYmmdd??.dat files in AIRNOW_DIR
+        and returns the observations of hour HH
+    read_airnow_metplus.py daily_v2 DAILY_FILE YYYYmmdd
+        reads DAILY_FILE (daily_data_v2.dat)
+
+The parsed day is kept as a binary table in $AIRNOW_CACHE_DIR
+(default $DATA/airnow_cache) so later runs for the same day,
+e.g. the other hours, read the table instead of the text files.
+"""
+
+
+def get_source_info(input_files):
+    """!Get a string identifying the input files and their state, used to
+    decide if a cached table is still good.
+
+    @param input_files list of input files
+    @returns string of file names, sizes and modification times
+    """
+    source_info = []
+    for input_file in input_files:
+        file_stat = os.stat(input_file)
+        source_info.append(f'{os.path.abspath(input_file)}:'
+                           f'{file_stat.st_size}:{file_stat.st_mtime_ns}')
+    return '\n'.join(source_info)
+
+
+def read_cache(cache_file, source_info):
+    """!Read a cached table of a day's observations.
+
+    @param cache_file path to the cached table
+    @param source_info string from get_source_info for the input files
+    @returns dictionary of column arrays or None if no good cache exists
+    """
+    if not os.path.exists(cache_file):
+        return None
+    with numpy.load(cache_file) as cache_data:
+        if str(cache_data['source_info']) != source_info:
+            return None
+        table = {key: cache_data[key] for key in cache_data.files}
+    print(f'Read cached observations: {cache_file}')
+    return table
+
+
+def write_cache(cache_file, source_info, table):
+    """!Write a table of a day's observations so later runs can reuse it.
+    The file is written to a temporary name first so concurrent runs
+    never read a partial table.
+
+    @param cache_file path to the cached table
+    @param source_info string from get_source_info for the input files
+    @param table dictionary of column arrays
+    """
+    cache_dir = os.path.dirname(cache_file)
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir, exist_ok=True)
+    tmp_cache_file = f'{cache_file}.{os.getpid()}.tmp.npz'
+    numpy.savez(tmp_cache_file, source_info=numpy.array(source_info),
+                **table)
+    os.replace(tmp_cache_file, cache_file)
+    print(f'Wrote cached observations: {cache_file}')
+
+
+def read_hourly_aqobs(input_files):
+    """!Read HourlyAQObs files in one pass and apply the quality control
+    checks to whole columns. The conditions to skip data are as follows:
+    1) If the value or the station latitude/longitude is missing.
+    2) If the latitude/longitude is out of range.
+    3) If the {var_name}_Measured flag is not 1, meaning the value was
+    derived from the AQI and not measured.
+    Negative values are kept, PointStat censors them to 0.
+
+    @param input_files list of HourlyAQObs files
+    @returns dictionary of column arrays
+    """
+    hourly_df = pandas.concat(
+        [pandas.read_csv(input_file, dtype={'AQSID': str},
+                         skipinitialspace=True)
+         for input_file in input_files],
+        ignore_index=True
+    )
+    valid_dt = pandas.to_datetime(
+        hourly_df['ValidDate'].astype(str)+' '
+        +hourly_df['ValidTime'].astype(str),
+        format='%m/%d/%Y %H:%M', errors='coerce'
+    )
+    valid_dt = valid_dt.fillna(pandas.to_datetime(
+        hourly_df['ValidDate'].astype(str)+' '
+        +hourly_df['ValidTime'].astype(str),
+        format='%m/%d/%y %H:%M', errors='coerce'
+    ))
+    lat = pandas.to_numeric(hourly_df['Latitude'], errors='coerce')
+    lon = pandas.to_numeric(hourly_df['Longitude'], errors='coerce')
+    elev = pandas.to_numeric(
+        hourly_df.get('Elevation', pandas.Series(numpy.nan,
+                                                 index=hourly_df.index)),
+        errors='coerce'
+    )
+    station_ok = (valid_dt.notna() & lat.between(-90., 90.)
+                  & lon.between(-180., 360.))
+    table_list = []
+    for var_idx, (var_name, measured_col) in enumerate(
+            HOURLY_AQOBS_VARS.items()):
+        if var_name not in hourly_df.columns:
+            continue
+        value = pandas.to_numeric(hourly_df[var_name], errors='coerce')
+        keep = station_ok & value.notna()
+        if measured_col is not None and measured_col in hourly_df.columns:
+            keep &= pandas.to_numeric(hourly_df[measured_col],
+                                      errors='coerce') == 1
+        if DEBUG:
+            print(f'{var_name}: keep {int(keep.sum())} of {len(keep)}')
+        table_list.append({
+            'sid': hourly_df['AQSID'][keep].to_numpy(dtype=str),
+            'valid': valid_dt[keep].to_numpy(dtype='datetime64[s]'),
+            'lat': lat[keep].to_numpy(dtype=numpy.float64),
+            'lon': lon[keep].to_numpy(dtype=numpy.float64),
+            'elev': elev[keep].to_numpy(dtype=numpy.float32),
+            'var': numpy.full(int(keep.sum()), var_idx, dtype=numpy.int16),
+            'level': numpy.ones(int(keep.sum()), dtype=numpy.float32),
+            'value': value[keep].to_numpy(dtype=numpy.float64),
+        })
+    if not table_list:
+        print('ERROR: No observation columns found in HourlyAQObs files')
+        sys.exit(1)
+    table = {col: numpy.concatenate([t[col] for t in table_list])
+             for col in table_list[0]}
+    table['var_names'] = numpy.array(list(HOURLY_AQOBS_VARS.keys()))
+    return table
+
+
+def read_daily_v2(input_file):
+    """!Read a daily_data_v2.dat file in one pass and apply the quality
+    control checks to whole columns. The conditions to skip data are as
+    follows:
+    1) If the value, averaging period or latitude/longitude is missing.
+    2) If the latitude/longitude is out of range.
+    Negative values are kept, like the MET AirNow reader keeps them.
+    The valid time is the start of the valid date.
+
+    @param input_file daily_data_v2.dat file
+    @returns dictionary of column arrays
+    """
+    daily_df = pandas.read_csv(input_file, sep='|', header=None,
+                               names=DAILY_V2_COLS, dtype=str,
+                               keep_default_na=False)
+    valid_dt = pandas.to_datetime(daily_df['ValidDate'], format='%m/%d/%y',
+                                  errors='coerce')
+    lat = pandas.to_numeric(daily_df['Latitude'], errors='coerce')
+    lon = pandas.to_numeric(daily_df['Longitude'], errors='coerce')
+    value = pandas.to_numeric(daily_df['Value'], errors='coerce')
+    level = pandas.to_numeric(daily_df['AveragingPeriod'], errors='coerce')
+    keep = (valid_dt.notna() & lat.between(-90., 90.)
+            & lon.between(-180., 360.) & value.notna() & level.notna())
+    if DEBUG:
+        print(f'keep {int(keep.sum())} of {len(keep)}')
+    var_names, var_codes = numpy.unique(
+        daily_df['ParameterName'][keep].to_numpy(dtype=str),
+        return_inverse=True
+    )
+    return {
+        'sid': daily_df['AQSID'][keep].to_numpy(dtype=str),
+        'valid': valid_dt[keep].to_numpy(dtype='datetime64[s]'),
+        'lat': lat[keep].to_numpy(dtype=numpy.float64),
+        'lon': lon[keep].to_numpy(dtype=numpy.float64),
+        'elev': numpy.full(int(keep.sum()), numpy.nan, dtype=numpy.float32),
+        'var': var_codes.astype(numpy.int16),
+        'level': level[keep].to_numpy(dtype=numpy.float32),
+        'value': value[keep].to_numpy(dtype=numpy.float64),
+        'var_names': var_names,
+    }
+
+
+def get_point_data(table, message_type, valid_dt=None):
+    """!Format the observations of a table as 11-column point data.
+
+    @param table dictionary of column arrays
+    @param message_type message type of the observations
+    @param valid_dt (optional) only return observations valid at this
+    datetime. Defaults to None which returns all observations
+    @returns list of 11-column observations
+    """
+    keep = numpy.ones(len(table['value']), dtype=bool)
+    if valid_dt is not None:
+        keep = table['valid'] == numpy.datetime64(valid_dt, 's')
+    valid_str = numpy.datetime_as_string(table['valid'][keep], unit='s')
+    valid_str = numpy.char.replace(
+        numpy.char.replace(numpy.char.replace(valid_str, '-', ''), ':', ''),
+        'T', '_'
+    )
+    elev = [ELEVATION if numpy.isnan(elev) else float(elev)
+            for elev in table['elev'][keep]]
+    var_names = table['var_names'][table['var'][keep]]
+    return [
+        [message_type, str(sid), str(valid), float(lat), float(lon), elev,
+         str(var_name), float(level), elev, QC_STRING, float(value)]
+        for sid, valid, lat, lon, elev, var_name, level, value in zip(
+            table['sid'][keep], valid_str, table['lat'][keep],
+            table['lon'][keep], elev, var_names, table['level'][keep],
+            table['value'][keep]
+        )
+    ]
+
+
+args = [arg for arg in sys.argv[1:] if not arg.endswith('debug')]
+if len(args) != len(sys.argv[1:]):
+    print('Debugging output turned on')
+    DEBUG = True
+
+if len(args) != 3 or args[0] not in ['hourly_aqobs', 'daily_v2']:
+    print(f"ERROR: {__file__} - Must provide input type (hourly_aqobs or "
+          "daily_v2), input path and valid time arguments")
+    sys.exit(1)
+
+input_type, input_path, valid_time = args
+input_path = os.path.expandvars(input_path)
+cache_dir = os.environ.get(
+    'AIRNOW_CACHE_DIR',
+    os.path.join(os.environ.get('DATA', os.getcwd()), 'airnow_cache')
+)
+
+if input_type == 'hourly_aqobs':
+    valid_dt = datetime.datetime.strptime(valid_time, '%Y%m%d%H')
+    input_files = sorted(glob.glob(os.path.join(
+        input_path, f"HourlyAQObs_{valid_dt:%Y%m%d}??.dat"
+    )))
+    message_type = HOURLY_MESSAGE_TYPE
+else:
+    valid_dt = None
+    input_files = [input_path]
+    message_type = DAILY_MESSAGE_TYPE
+
+input_files = [input_file for input_file in input_files
+               if os.path.exists(input_file)]
+if not input_files:
+    print(f'ERROR: No {input_type} input files found for {input_path}')
+    sys.exit(1)
+
+print(f'Number of input files: {len(input_files)}')
+
+cache_file = os.path.join(
+    cache_dir, f"airnow_{input_type}_{valid_time[0:8]}.npz"
+)
+source_info = get_source_info(input_files)
+table = read_cache(cache_file, source_info)
+if table is None:
+    if input_type == 'hourly_aqobs':
+        table = read_hourly_aqobs(input_files)
+    else:
+        table = read_daily_v2(input_files[0])
+    write_cache(cache_file, source_info, table)
+
+point_data = get_point_data(table, message_type, valid_dt)
+
+print("     point_data: Data Length:\t" + repr(len(point_data)))
+print("     point_data: Data Type:\t" + repr(type(point_data)))
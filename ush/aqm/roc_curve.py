@@ -294,43 +294,41 @@ def plot_performance_diagram(df: pd.DataFrame, logger: logging.Logger,
         logger.info("========================================")
         return None
 
-    # Calculate desired metric
-    metric_long_names = []
-    for metric_name in [metric1_name, metric2_name]:
-        stat_output = plot_util.calculate_stat(
-            logger, df_aggregated, str(metric_name).lower()
-        )
-        df_aggregated[str(metric_name).upper()] = stat_output[0]
-        metric_long_names.append(stat_output[2])
+    # Calculate the ROC points and the area under the curve for all models
+    # and thresholds at once
+    metric_long_names = [
+        plot_util.get_stat_plot_name(logger, str(metric_name).lower())
+        for metric_name in [metric1_name, metric2_name]
+    ]
+    df_roc, df_auc, ci_status = plot_util.calculate_roc_curve(
+        logger,
+        df[df['FCST_THRESH_VALUE'].isin(
+            df_aggregated.index.get_level_values('FCST_THRESH_VALUE')
+        )],
+        [str(metric1_name).lower(), str(metric2_name).lower()],
+        confidence_intervals=confidence_intervals, bs_method=bs_method,
+        nrepl=bs_nrep, level=ci_lev, bs_min_samp=bs_min_samp
+    )
+    if confidence_intervals and ci_status == 1:
+        logger.warning(f"Failed attempt to compute bootstrap"
+                       + f" confidence intervals.  Sample size"
+                       + f" for one or more groups is too small."
+                       + f" Minimum sample size can be changed"
+                       + f" in settings.py.")
+        logger.warning(f"Confidence intervals will not be"
+                       + f" plotted.")
+        confidence_intervals = False
+    df_aggregated = df_aggregated.join(df_roc)
+    for model in df_auc.index:
+        auc = df_auc['AUC'][model]
         if confidence_intervals:
-            ci_output = df_groups.apply(
-                lambda x: plot_util.calculate_bootstrap_ci(
-                    logger, bs_method, x, str(metric_name).lower(), bs_nrep,
-                    ci_lev, bs_min_samp
-                )
+            logger.info(
+                f"{model} area under the ROC curve: {auc:.3f}"
+                + f" ({auc+df_auc['AUC_BLERR'][model]:.3f} to"
+                + f" {auc+df_auc['AUC_BUERR'][model]:.3f})"
             )
-            if any(ci_output['STATUS'] == 1):
-                logger.warning(f"Failed attempt to compute bootstrap"
-                               + f" confidence intervals.  Sample size"
-                               + f" for one or more groups is too small."
-                               + f" Minimum sample size can be changed"
-                               + f" in settings.py.")
-                logger.warning(f"Confidence intervals will not be"
-                               + f" plotted.")
-                confidence_intervals = False
-                continue
-            ci_output = ci_output.reset_index(level=2, drop=True)
-            ci_output = (
-                ci_output
-                .reindex(df_aggregated.index)
-                .reindex(ci_output.index)
-            )
-            df_aggregated[str(metric_name).upper()+'_BLERR'] = ci_output[
-                'CI_LOWER'
-            ].values
-            df_aggregated[str(metric_name).upper()+'_BUERR'] = ci_output[
-                'CI_UPPER'
-            ].values
+        else:
+            logger.info(f"{model} area under the ROC curve: {auc:.3f}")
     df_aggregated[str(metric1_name).upper()] = (
         df_aggregated[str(metric1_name).upper()]
     ).astype(float).tolist()
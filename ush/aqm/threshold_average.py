@@ -210,11 +210,16 @@ def plot_threshold_average(df: pd.DataFrame, logger: logging.Logger,
         logger.error("Quitting ...")
         raise ValueError(e+"\nQuitting ...")
     
-    df_thresh_symbol, df_thresh_letter = list(
-        zip(*[plot_util.format_thresh(t) for t in df['FCST_THRESH']])
+    # format_thresh() once per threshold rather than once per line
+    df_thresh_dict = {
+        t: plot_util.format_thresh(t) for t in df['FCST_THRESH'].unique()
+    }
+    df['FCST_THRESH_SYMBOL'] = df['FCST_THRESH'].map(
+        {t: item[0] for t, item in df_thresh_dict.items()}
+    )
+    df['FCST_THRESH_VALUE'] = df['FCST_THRESH'].map(
+        {t: str(item[1])[2:] for t, item in df_thresh_dict.items()}
     )
-    df['FCST_THRESH_SYMBOL'] = df_thresh_symbol
-    df['FCST_THRESH_VALUE'] = [str(item)[2:] for item in df_thresh_letter]
     df = df[df['FCST_THRESH_SYMBOL'].isin(requested_thresh_symbol)]
     thresholds_removed = (
         np.array(requested_thresh_symbol)[
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# =============================================================================
+#
+# NAME: cam_prep_mrms_util.py
+# CONTRIBUTOR(S): Logan C. Dawson, logan.dawson@noaa.gov, NOAA/NWS/NCEP/EMC-VPPPGB
+# PURPOSE: Utilities for staging MRMS radar files for EVS CAM Verification
+#
+# =============================================================================
+
+import os
+import gzip
+import shutil
+import bisect
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# MRMS products to stage for each domain, with the file level tag and the
+# input/output file name heads
+MRMS_PRODUCTS = {
+    'conus': ['MergedReflectivityQCComposite', 'SeamlessHSR', 'EchoTop'],
+    'alaska': ['MergedReflectivityQCComposite'],
+}
+MRMS_PRODUCT_INFO = {
+    'MergedReflectivityQCComposite': {
+        'level': '_00.50_',
+        'input_file_head': 'MergedReflectivityQCComposite',
+        'output_file_head': 'MergedReflectivityQCComposite',
+    },
+    'MergedReflectivityQComposite': {
+        'level': '_00.50_',
+        'input_file_head': 'MergedReflectivityQComposite',
+        'output_file_head': 'MergedReflectivityQComposite',
+    },
+    'SeamlessHSR': {
+        'level': '_00.00_',
+        'input_file_head': 'SeamlessHSR',
+        'output_file_head': 'SeamlessHSR',
+    },
+    'EchoTop': {
+        'level': '_00.50_',
+        'input_file_head': 'EchoTop_18',
+        'output_file_head': 'EchoTop18',
+    },
+}
+
+# Cache of sorted (timestamp, file name) lists keyed on
+# (product directory, input file head)
+_TIME_INDEX_CACHE = {}
+
+
+def get_time_index(product_dir, input_file_head):
+    """! Build a sorted index of the MRMS file timestamps in a directory
+
+         Args:
+             product_dir     - path to MRMS product directory (string)
+             input_file_head - leading part of the MRMS file names (string)
+
+         Returns:
+             time_index - sorted timestamps (list of datetime) and
+                          matching file names (list of string)
+    """
+    try:
+        dir_mtime = os.stat(product_dir).st_mtime_ns
+    except FileNotFoundError:
+        return [], []
+    cache_key = (product_dir, input_file_head)
+    if cache_key in _TIME_INDEX_CACHE \
+            and _TIME_INDEX_CACHE[cache_key][0] == dir_mtime:
+        return _TIME_INDEX_CACHE[cache_key][1]
+    time_file_list = []
+    with os.scandir(product_dir) as dir_entries:
+        for dir_entry in dir_entries:
+            name = dir_entry.name
+            if not name.startswith(input_file_head) \
+                    or not name.endswith('.gz'):
+                continue
+            # File names end in _YYYYmmdd-HHMMSS.grib2.gz
+            try:
+                timestamp = datetime.datetime.strptime(
+                    name[-24:-9], '%Y%m%d-%H%M%S'
+                )
+            except ValueError:
+                continue
+            time_file_list.append((timestamp, name))
+    time_file_list.sort()
+    time_index = (
+        [time_file[0] for time_file in time_file_list],
+        [time_file[1] for time_file in time_file_list]
+    )
+    _TIME_INDEX_CACHE[cache_key] = (dir_mtime, time_index)
+    return time_index
+
+
+def find_closest_file(time_index, valid, max_diff_seconds=900):
+    """! Find the MRMS file closest to a valid time
+
+         Args:
+             time_index       - sorted timestamps and file names
+                                (tuple of lists)
+             valid            - valid time (datetime)
+             max_diff_seconds - maximum allowed difference between the
+                                file time and the valid time (integer)
+
+         Returns:
+             closest_file - file name closest to the valid time, None if
+                            no file is within max_diff_seconds (string)
+    """
+    datetime_list, file_list = time_index
+    if not datetime_list:
+        return None
+    i = bisect.bisect_left(datetime_list, valid)
+    candidates = range(max(0, i-1), min(len(datetime_list), i+2))
+    closest_i = min(candidates, key=lambda j: abs(valid - datetime_list[j]))
+    difference = abs(datetime_list[closest_i] - valid)
+    if difference.total_seconds() <= max_diff_seconds:
+        return file_list[closest_i]
+    return None
+
+
+def gunzip_file(input_file, output_file):
+    """! Decompress a gzipped file directly to its destination
+
+         Args:
+             input_file  - path to gzipped file (string)
+             output_file - path to write decompressed file (string)
+    """
+    tmp_output_file = output_file+'.tmp'
+    try:
+        with gzip.open(input_file, 'rb') as input_file_obj, \
+                open(tmp_output_file, 'wb') as output_file_obj:
+            shutil.copyfileobj(input_file_obj, output_file_obj, 1024*1024)
+    except (OSError, EOFError):
+        if os.path.exists(tmp_output_file):
+            os.remove(tmp_output_file)
+        raise
+    os.replace(tmp_output_file, output_file)
+
+
+def stage_mrms_files(mrms_dir, data_dir, valid_list, domains=None,
+                     nthreads=4):
+    """! Copy and unzip the MRMS files closest to each valid time
+
+         Args:
+             mrms_dir   - path to MRMS data with domain
+                          subdirectories (string)
+             data_dir   - path to working directory (string)
+             valid_list - valid times (list of datetime)
+             domains    - domains to stage, defaults to all in
+                          MRMS_PRODUCTS (list of string)
+             nthreads   - number of decompression threads (integer)
+
+         Returns:
+             staged_files  - staged output file paths (list of string)
+             missing_files - (domain, product, valid time) combinations
+                             with no file within 15 minutes (list of tuple)
+    """
+    if domains is None:
+        domains = list(MRMS_PRODUCTS.keys())
+    stage_jobs = []
+    missing_files = []
+    for domain in domains:
+        tmp_dir = os.path.join(data_dir, 'MRMS_'+domain+'_tmp')
+        if not os.path.exists(tmp_dir):
+            os.makedirs(tmp_dir)
+        for mrms_product in MRMS_PRODUCTS[domain]:
+            product_info = MRMS_PRODUCT_INFO[mrms_product]
+            product_dir = os.path.join(mrms_dir, domain, mrms_product)
+            time_index = get_time_index(
+                product_dir, product_info['input_file_head']
+            )
+            for valid in valid_list:
+                print('Copying and unzipping '+valid.strftime('%Y%m%d%H')
+                      +' MRMS '+mrms_product+' data')
+                closest_file = find_closest_file(time_index, valid)
+                if closest_file is None:
+                    print('No '+mrms_product+' file found within 15 minutes '
+                          +'of '+valid.strftime('%HZ %m/%d/%Y')+'. '
+                          +'Skipping this time.')
+                    missing_files.append((domain, mrms_product, valid))
+                    continue
+                output_file = os.path.join(
+                    tmp_dir,
+                    product_info['output_file_head']+product_info['level']
+                    +valid.strftime('%Y%m%d-%H')+'0000.grib2'
+                )
+                stage_jobs.append(
+                    (os.path.join(product_dir, closest_file), output_file)
+                )
+    staged_files = []
+    with ThreadPoolExecutor(max_workers=max(1, int(nthreads))) as executor:
+        futures = [
+            executor.submit(gunzip_file, input_file, output_file)
+            for input_file, output_file in stage_jobs
+        ]
+        for future, stage_job in zip(futures, stage_jobs):
+            try:
+                future.result()
+                staged_files.append(stage_job[1])
+            except (OSError, EOFError) as e:
+                print('WARNING: Could not unzip '+stage_job[0]+': '+str(e))
+    return staged_files, missing_files
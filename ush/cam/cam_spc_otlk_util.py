@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# =============================================================================
+#
+# NAME: cam_spc_otlk_util.py
+# CONTRIBUTOR(S): Marcel Caron, marcel.caron@noaa.gov, NOAA/NWS/NCEP/EMC-VPPPGB
+# PURPOSE: Read SPC Outlook shapefiles and generate verification masks of the
+#          outlook areas in-process for EVS CAM Verification
+#
+# =============================================================================
+
+import os
+import struct
+import numpy as np
+import netCDF4 as netcdf
+
+# Shapefile shape types that hold polygon rings
+SHP_POLYGON_TYPES = [5, 15, 25]
+
+# In-process cache of rasterized outlook masks keyed on
+# (shapefile, shapefile modification time, grid file)
+_OTLK_MASK_CACHE = {}
+
+
+def read_dbf_records(dbf_file):
+    """! Read all records of a dBASE (.dbf) file
+
+         Args:
+             dbf_file - path to dbf file (string)
+
+         Returns:
+             field_names - names of the record fields (list of string)
+             records     - field values for each record not flagged
+                           as deleted (list of list)
+             record_idxs - position in the file of each record kept,
+                           matching the shp record order (list of int)
+    """
+    with open(dbf_file, 'rb') as dbf:
+        header = dbf.read(32)
+        n_records, header_len, record_len = struct.unpack(
+            '<IHH', header[4:12]
+        )
+        field_names = []
+        field_lens = []
+        while dbf.tell() < header_len - 1:
+            field_desc = dbf.read(32)
+            if field_desc[0:1] == b'\r':
+                break
+            field_names.append(
+                field_desc[0:11].split(b'\x00')[0].decode('ascii').strip()
+            )
+            field_lens.append(field_desc[16])
+        dbf.seek(header_len)
+        records = []
+        record_idxs = []
+        for rec in range(n_records):
+            record = dbf.read(record_len)
+            if len(record) < record_len:
+                break
+            # First byte is the deletion flag
+            if record[0:1] == b'*':
+                continue
+            values = []
+            pos = 1
+            for field_len in field_lens:
+                values.append(
+                    record[pos:pos+field_len].decode('latin-1').strip()
+                )
+                pos+=field_len
+            records.append(values)
+            record_idxs.append(rec)
+    return field_names, records, record_idxs
+
+
+def read_shp_polygons(shp_file):
+    """! Read the polygon rings of every record in a shapefile (.shp)
+
+         Args:
+             shp_file - path to shp file (string)
+
+         Returns:
+             polygons - rings of each record as (N,2) lon/lat arrays;
+                        empty for null shapes (list of list)
+    """
+    polygons = []
+    with open(shp_file, 'rb') as shp:
+        shp_data = shp.read()
+    file_len = struct.unpack('>i', shp_data[24:28])[0] * 2
+    pos = 100
+    while pos + 8 <= min(file_len, len(shp_data)):
+        content_len = struct.unpack('>ii', shp_data[pos:pos+8])[1] * 2
+        content = shp_data[pos+8:pos+8+content_len]
+        pos+=8+content_len
+        shape_type = struct.unpack('<i', content[0:4])[0]
+        if shape_type not in SHP_POLYGON_TYPES:
+            polygons.append([])
+            continue
+        n_parts, n_points = struct.unpack('<ii', content[36:44])
+        parts = np.frombuffer(
+            content, dtype='<i4', count=n_parts, offset=44
+        )
+        points = np.frombuffer(
+            content, dtype='<f8', count=2*n_points, offset=44+4*n_parts
+        ).reshape(n_points, 2)
+        part_ends = np.append(parts[1:], n_points)
+        polygons.append([
+            points[part_start:part_end]
+            for part_start, part_end in zip(parts, part_ends)
+        ])
+    return polygons
+
+
+def read_spc_otlk_shapefile(shp_file, name_field='LABEL'):
+    """! Read the record names and polygons of an SPC Outlook shapefile
+         in one pass
+
+         Args:
+             shp_file   - path to shp file, with the matching dbf file
+                          in the same directory (string)
+             name_field - dbf field holding the outlook category name,
+                          falls back to the fifth field (string)
+
+         Returns:
+             names    - outlook category name of each record
+                        (list of string)
+             polygons - rings of each record (list of list)
+    """
+    field_names, records, record_idxs = read_dbf_records(
+        os.path.splitext(shp_file)[0]+'.dbf'
+    )
+    if name_field in field_names:
+        name_idx = field_names.index(name_field)
+    else:
+        name_idx = min(4, len(field_names)-1)
+    polygons = read_shp_polygons(shp_file)
+    # Pair by record position since deleted dbf records are skipped
+    names = []
+    record_polygons = []
+    for record, record_idx in zip(records, record_idxs):
+        if record_idx >= len(polygons):
+            break
+        names.append(record[name_idx])
+        record_polygons.append(polygons[record_idx])
+    return names, record_polygons
+
+
+def points_in_rings(lon, lat, rings):
+    """! Test which points fall inside a set of polygon rings using the
+         even-odd rule, so inner rings act as holes
+
+         Args:
+             lon   - point longitudes (array)
+             lat   - point latitudes (array)
+             rings - polygon rings as (N,2) lon/lat arrays (list)
+
+         Returns:
+             inside - True where the point is inside (boolean array)
+    """
+    lon_flat = np.ravel(lon)
+    lat_flat = np.ravel(lat)
+    inside = np.zeros(lon_flat.shape, dtype=bool)
+    lat_order = np.argsort(lat_flat, kind='stable')
+    lat_sorted = lat_flat[lat_order]
+    for ring in rings:
+        if len(ring) < 3:
+            continue
+        x0, y0 = ring[:-1,0], ring[:-1,1]
+        x1, y1 = ring[1:,0], ring[1:,1]
+        if not np.array_equal(ring[0], ring[-1]):
+            x0 = np.append(x0, ring[-1,0])
+            y0 = np.append(y0, ring[-1,1])
+            x1 = np.append(x1, ring[0,0])
+            y1 = np.append(y1, ring[0,1])
+        # Only points with latitude in [min(y0,y1), max(y0,y1)) can cross
+        # an edge, found with a binary search on the sorted latitudes
+        start_idx = np.searchsorted(lat_sorted, np.minimum(y0, y1), 'left')
+        end_idx = np.searchsorted(lat_sorted, np.maximum(y0, y1), 'left')
+        for e in np.nonzero(end_idx > start_idx)[0]:
+            idx = lat_order[start_idx[e]:end_idx[e]]
+            x_cross = (
+                x0[e] + (lat_flat[idx]-y0[e]) * (x1[e]-x0[e]) / (y1[e]-y0[e])
+            )
+            crossed = idx[lon_flat[idx] < x_cross]
+            inside[crossed] = ~inside[crossed]
+    return inside.reshape(np.shape(lon))
+
+
+def read_grid(grid_file):
+    """! Read the latitudes and longitudes of a MET netCDF grid file
+
+         Args:
+             grid_file - path to netCDF file on the verification
+                         grid (string)
+
+         Returns:
+             lat - latitudes (2D array)
+             lon - longitudes in [-180, 180) (2D array)
+    """
+    with netcdf.Dataset(grid_file) as grid_data:
+        lat = np.asarray(grid_data.variables['lat'][:], dtype=float)
+        lon = np.asarray(grid_data.variables['lon'][:], dtype=float)
+    if lat.ndim == 1:
+        lon, lat = np.meshgrid(lon, lat)
+    lon = ((lon + 180.) % 360.) - 180.
+    return lat, lon
+
+
+def get_otlk_masks(shp_file, grid_file, cache_dir=None):
+    """! Rasterize every record of an SPC Outlook shapefile onto a grid,
+         reusing masks already made for the same shapefile and grid
+
+         Args:
+             shp_file  - path to shp file (string)
+             grid_file - path to netCDF file on the verification
+                         grid (string)
+             cache_dir - directory to keep rasterized masks for reuse
+                         across jobs, optional (string)
+
+         Returns:
+             names - outlook category name of each record (list of string)
+             masks - mask of each record on the grid (list of array)
+    """
+    shp_mtime = os.stat(shp_file).st_mtime_ns
+    cache_key = (os.path.abspath(shp_file), shp_mtime,
+                 os.path.abspath(grid_file))
+    if cache_key in _OTLK_MASK_CACHE:
+        return _OTLK_MASK_CACHE[cache_key]
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = os.path.join(
+            cache_dir,
+            os.path.splitext(os.path.basename(shp_file))[0]+'.'
+            +os.path.splitext(os.path.basename(grid_file))[0]+'.'
+            +str(shp_mtime)+'.npz'
+        )
+        if os.path.isfile(cache_file):
+            with np.load(cache_file) as cache_data:
+                names = list(cache_data['names'])
+                masks = list(cache_data['masks'])
+            _OTLK_MASK_CACHE[cache_key] = (names, masks)
+            return names, masks
+    names, polygons = read_spc_otlk_shapefile(shp_file)
+    lat, lon = read_grid(grid_file)
+    masks = [points_in_rings(lon, lat, rings) for rings in polygons]
+    _OTLK_MASK_CACHE[cache_key] = (names, masks)
+    if cache_file is not None and names:
+        # Jobs for other valid hours share the cache directory, so write
+        # to a temporary name unique to this process; the cache is only
+        # a speedup and a failed write must not stop the job
+        tmp_cache_file = f"{cache_file}.{os.getpid()}.tmp.npz"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.savez_compressed(
+                tmp_cache_file, names=np.array(names), masks=np.array(masks)
+            )
+            os.replace(tmp_cache_file, cache_file)
+        except OSError as e:
+            print("WARNING: Could not write SPC Outlook mask cache "
+                  +f"{cache_file}: {e}")
+            if os.path.exists(tmp_cache_file):
+                try:
+                    os.remove(tmp_cache_file)
+                except OSError:
+                    pass
+    return names, masks
+
+
+def write_mask_file(output_file, grid_file, mask, mask_name):
+    """! Write a mask to a netCDF file laid out like the GenVxMask output
+         on the verification grid
+
+         Args:
+             output_file - path to write mask file (string)
+             grid_file   - path to netCDF mask file on the verification
+                           grid, used for the grid definition (string)
+             mask        - mask on the grid (boolean array)
+             mask_name   - name of the mask variable (string)
+    """
+    tmp_output_file = output_file+'.tmp'
+    with netcdf.Dataset(grid_file) as grid_data, \
+            netcdf.Dataset(tmp_output_file, 'w') as mask_data:
+        mask_data.setncatts(
+            {attr: grid_data.getncattr(attr) for attr in grid_data.ncattrs()}
+        )
+        for dim_name, dim in grid_data.dimensions.items():
+            mask_data.createDimension(dim_name, len(dim))
+        template_var = None
+        for var_name, var in grid_data.variables.items():
+            if var_name in ['lat', 'lon']:
+                out_var = mask_data.createVariable(
+                    var_name, var.dtype, var.dimensions
+                )
+                out_var.setncatts(
+                    {attr: var.getncattr(attr) for attr in var.ncattrs()}
+                )
+                out_var[:] = var[:]
+            elif template_var is None and len(var.dimensions) == 2:
+                template_var = var
+        mask_var = mask_data.createVariable(
+            mask_name, template_var.dtype, template_var.dimensions
+        )
+        mask_var.setncatts({
+            attr: template_var.getncattr(attr)
+            for attr in template_var.ncattrs() if attr != '_FillValue'
+        })
+        mask_var.long_name = mask_name
+        mask_var[:] = mask.astype(template_var.dtype)
+    os.replace(tmp_output_file, output_file)
+
+
+def gen_spc_otlk_masks(otlk_list, grid_file, output_dir, cache_dir=None,
+                       skip_if_output_exists=True):
+    """! Generate verification masks for all records of all SPC Outlook
+         shapefiles in one call
+
+         Args:
+             otlk_list             - outlooks to process; each entry is a
+                                     dictionary with the shp file path
+                                     ('shp_file') and output file name
+                                     ('mask_fname') and mask variable name
+                                     ('mask_name') formats containing
+                                     {NAME} (list of dictionary)
+             grid_file             - path to netCDF mask file on the
+                                     verification grid (string)
+             output_dir            - directory to write masks to (string)
+             cache_dir             - directory to keep rasterized masks for
+                                     reuse across jobs, optional (string)
+             skip_if_output_exists - do not rewrite existing mask
+                                     files (boolean)
+
+         Returns:
+             output_file_list - mask files written or found
+                                (list of string)
+    """
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    output_file_list = []
+    for otlk in otlk_list:
+        names, masks = get_otlk_masks(
+            otlk['shp_file'], grid_file, cache_dir=cache_dir
+        )
+        print(f"Processing {len(names)} records in {otlk['shp_file']}")
+        for rec, (name, mask) in enumerate(zip(names, masks)):
+            print(f"Processing Record #{rec}: {name}")
+            output_file = os.path.join(
+                output_dir, otlk['mask_fname'].format(NAME=name)+'.nc'
+            )
+            if not (skip_if_output_exists and os.path.isfile(output_file)):
+                write_mask_file(
+                    output_file, grid_file, mask,
+                    otlk['mask_name'].format(NAME=name)
+                )
+            output_file_list.append(output_file)
+    return output_file_list
@@ -185,7 +185,6 @@ if job_type == 'reformat':
         'exports': ['FHR_END','FHR_INCR']
     }
     if NEST == 'spc_otlk':
-        job_env_vars_dict['metplus_launcher'] = metplus_launcher
         job_env_vars_dict['EVSINspcotlk'] = EVSINspcotlk
         job_env_vars_dict['GRID_POLY_LIST'] = GRID_POLY_LIST
     if NEST == 'firewx':
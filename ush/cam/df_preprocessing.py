@@ -13,15 +13,28 @@ import os
 import sys
 import shutil
 import uuid
+import resource
 import numpy as np
 import pandas as pd
 from datetime import timedelta as td
+from concurrent.futures import ProcessPoolExecutor
 
 SETTINGS_DIR = os.environ['USH_DIR']
 sys.path.insert(0, os.path.abspath(SETTINGS_DIR))
 from prune_stat_files import prune_data
 import plot_util
 
+# Rows of a pruned stat file read and filtered at a time
+READ_CHUNKSIZE = 200000
+# Number of processes create_df reads models with; 1 reads them serially
+CREATE_DF_NPROC = int(os.environ.get('CREATE_DF_NPROC', '1'))
+# Rough peak memory of reading a pruned stat file, as a multiple of its
+# size on disk, and share of the available memory parallel reads may use
+READ_MEMORY_FACTOR = 4
+READ_MEMORY_FRACTION = 0.5
+# Header columns plotting code groups by or maps to new columns, kept as
+# plain strings rather than categoricals
+STRING_COLNAMES = ['MODEL', 'FCST_THRESH', 'OBS_THRESH']
 
 # =================== FUNCTIONS =========================
 
@@ -92,24 +105,127 @@ def run_prune_data(logger, stats_dir, prune_dir, output_base_template, verif_cas
         raise OSError(e1+"\n"+e2)
     return pruned_data_dir
 
-def check_empty(df, logger, called_from):
+def check_empty(df, logger, called_from, quiet=False):
     if df.empty:
-        logger.warning(f"Called from {called_from}:")
-        logger.warning(f"Empty Dataframe encountered while filtering a subset"
-                       + f" of input statistics...")
-        logger.info("========================================")
+        if not quiet:
+            logger.warning(f"Called from {called_from}:")
+            logger.warning(f"Empty Dataframe encountered while filtering a subset"
+                           + f" of input statistics...")
+            logger.info("========================================")
         return True
     else:
         return False
 
+def get_peak_memory_usage():
+    # ru_maxrss is in kilobytes on Linux
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return f"Peak RAM memory used: {round(peak_memory/1024., 2)} MB"
+
+def read_pruned_stat_file(logger, fpath, met_version, line_type, verif_type,
+                          fcst_var_names, obs_var_names, interp, domain,
+                          date_type, date_range, date_hours,
+                          chunksize=READ_CHUNKSIZE):
+    # Header columns repeat the same few values on every row, so read them
+    # as categoricals, and filter each chunk before the next is read;
+    # chunks are filtered quietly and the file is checked once at the end
+    df_base_colnames = plot_util.get_stat_file_base_columns(met_version)
+    df_line_type_colnames = plot_util.get_stat_file_line_type_columns(
+        logger, met_version, str(line_type).upper(), df_base_colnames, fpath
+    )
+    df_colnames = np.concatenate((
+        df_base_colnames, df_line_type_colnames
+    ))
+    df_dtypes = {col_name: 'category' for col_name in df_base_colnames}
+    df_dtypes.update(
+        {col_name: np.float64 for col_name in df_line_type_colnames}
+    )
+    df_chunk_list = []
+    with pd.read_csv(
+            fpath, sep=r'\s+', header=None, skiprows=1,
+            names=df_colnames, dtype=df_dtypes, chunksize=chunksize
+        ) as df_reader:
+        for df_chunk in df_reader:
+            df_chunk = run_filters(
+                df_chunk, logger, verif_type, fcst_var_names, obs_var_names,
+                interp, domain, date_type, date_range, date_hours, quiet=True
+            )
+            if not df_chunk.empty or not df_chunk_list:
+                df_chunk_list.append(df_chunk)
+    if not df_chunk_list:
+        raise pd.errors.EmptyDataError("No columns to parse from file "+fpath)
+    if len(df_chunk_list) == 1:
+        check_empty(df_chunk_list[0], logger, 'read_pruned_stat_file')
+    return df_chunk_list
+
+def concat_typed_dfs(df_list):
+    # Keep header columns categorical through the concatenation. Plotting
+    # code groups and pivots by MODEL and maps the thresholds to new columns
+    # it groups by, so those are handed back as plain strings; grouping by
+    # a categorical would add a row for every unobserved category
+    df_list = [df_tmp for df_tmp in df_list if not df_tmp.empty] or df_list
+    category_colnames = [
+        col_name for col_name in df_list[0].columns
+        if isinstance(df_list[0][col_name].dtype, pd.CategoricalDtype)
+    ]
+    for col_name in category_colnames:
+        categories = pd.api.types.union_categoricals(
+            [df_tmp[col_name] for df_tmp in df_list]
+        ).categories
+        for df_tmp in df_list:
+            df_tmp[col_name] = df_tmp[col_name].cat.set_categories(categories)
+    df = pd.concat(df_list)
+    for col_name in STRING_COLNAMES:
+        if col_name in category_colnames:
+            df[col_name] = df[col_name].astype(object)
+    return df
+
+def get_available_memory():
+    # MemAvailable in /proc/meminfo is in kilobytes
+    try:
+        with open('/proc/meminfo', 'r') as meminfo:
+            for line in meminfo:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1])*1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+def get_read_nproc(logger, fpath_list, nproc):
+    # Memory guard: only read as many files at once as fit in the share of
+    # available memory set aside for it, assuming the largest file each time.
+    # Also never use more processes than the cores this process may run on,
+    # as a POE task is bound to its own cores
+    nproc = min(int(nproc), len(fpath_list), len(os.sched_getaffinity(0)))
+    if nproc <= 1:
+        return 1
+    available_memory = get_available_memory()
+    if available_memory is None:
+        logger.debug("Could not get available memory. Reading models"
+                     + " serially.")
+        return 1
+    max_read_memory = READ_MEMORY_FACTOR * max(
+        os.path.getsize(fpath) for fpath in fpath_list
+    )
+    read_nproc = int(
+        (READ_MEMORY_FRACTION*available_memory) // max(max_read_memory, 1)
+    )
+    if read_nproc < nproc:
+        logger.debug(f"Limiting processes reading models to"
+                     + f" {max(read_nproc, 1)} of {nproc} to fit in available"
+                     + f" memory ({round(available_memory/1024.**2, 2)} MB)")
+    return max(min(read_nproc, nproc), 1)
+
 def create_df(logger, stats_dir, pruned_data_dir, line_type, date_range, 
               model_list, met_version, clear_prune_dir, verif_type, 
               fcst_var_names, obs_var_names, interp, domain, date_type, 
-              date_hours):
+              date_hours, nproc=None):
+    if nproc is None:
+        nproc = CREATE_DF_NPROC
     model_list = [str(model) for model in model_list]
     # Create df combining pruned stats for all models in model_list
     start_string = date_range[0].strftime('%HZ %d %B %Y')
     end_string = date_range[1].strftime('%HZ %d %B %Y')
+    fpath_list = []
     for model in model_list:
         fpath = os.path.join(pruned_data_dir,f'{str(model)}.stat')
         if not os.path.isfile(fpath):
@@ -127,48 +243,51 @@ def create_df(logger, stats_dir, pruned_data_dir, line_type, date_range,
                 )
                 logger.warning("Continuing ...")
             continue
-        if not clear_prune_dir:
-            logger.debug(f"Creating dataframe using pruned data from {fpath}")
-        try:
-            df_colnames = plot_util.get_stat_file_base_columns(met_version)
-            df_line_type_colnames = plot_util.get_stat_file_line_type_columns(
-                logger, met_version, str(line_type).upper(), df_colnames, fpath
-            )
-            df_colnames = np.concatenate((
-                df_colnames, df_line_type_colnames
-            ))
-            df_tmp = pd.read_csv(
-                fpath, delim_whitespace=True, header=None, skiprows=1,
-                names=df_colnames, dtype=str
-            )
-            i = -1*len(df_line_type_colnames)
-            for col_name in df_colnames[i:]:
-                df_tmp[col_name] = df_tmp[col_name].astype(float)
-            df_tmp = run_filters(
-                df_tmp, logger, verif_type, fcst_var_names, obs_var_names,
-                interp, domain, date_type, date_range, date_hours
-            )
+        fpath_list.append(fpath)
+    read_args = (
+        met_version, line_type, verif_type, fcst_var_names, obs_var_names,
+        interp, domain, date_type, date_range, date_hours
+    )
+    read_nproc = get_read_nproc(logger, fpath_list, nproc)
+    executor = None
+    df_list = []
+    try:
+        if read_nproc > 1:
+            # Read models concurrently, collecting the results in model order
+            logger.debug(f"Reading {len(fpath_list)} models with {read_nproc}"
+                         + f" processes")
+            executor = ProcessPoolExecutor(max_workers=read_nproc)
+            read_futures = [
+                executor.submit(
+                    read_pruned_stat_file, logger, fpath, *read_args
+                )
+                for fpath in fpath_list
+            ]
+        for f, fpath in enumerate(fpath_list):
+            if not clear_prune_dir:
+                logger.debug(f"Creating dataframe using pruned data from {fpath}")
             try:
-                df = pd.concat([df, df_tmp])
-            except NameError:
-                df = df_tmp
-            except UnboundLocalError as e:
-                df = df_tmp
-            logger.debug(plot_util.get_memory_usage())
-            total_memory, _, _ = map(
-                int, os.popen('free -t -m').readlines()[-1].split()[1:]
-            )
-            logger.debug(f"RAM memory available: {total_memory}")
-        except pd.errors.EmptyDataError as e:
-            logger.warning(e)
-            logger.warning(f"The file in question:")
-            logger.warning(f"{fpath}")
-            logger.warning("Continuing ...")
-        except OSError as e:
-            logger.warning(e)
-            logger.warning(f"The file in question:")
-            logger.warning(f"{fpath}")
-            logger.warning("Continuing ...")
+                if executor is not None:
+                    df_list.extend(read_futures[f].result())
+                else:
+                    df_list.extend(read_pruned_stat_file(
+                        logger, fpath, *read_args
+                    ))
+                logger.debug(get_peak_memory_usage())
+            except pd.errors.EmptyDataError as e:
+                logger.warning(e)
+                logger.warning(f"The file in question:")
+                logger.warning(f"{fpath}")
+                logger.warning("Continuing ...")
+            except OSError as e:
+                logger.warning(e)
+                logger.warning(f"The file in question:")
+                logger.warning(f"{fpath}")
+                logger.warning("Continuing ...")
+    finally:
+        # Shut the pool down however the reads end
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
     if clear_prune_dir:
         try:
             shutil.rmtree(pruned_data_dir)
@@ -177,20 +296,19 @@ def create_df(logger, stats_dir, pruned_data_dir, line_type, date_range,
             logger.warning(f"The directory in question:")
             logger.warning(f"{pruned_data_dir}")
             logger.warning("Continuing ...")
-    try:
-        if check_empty(df, logger, 'create_df'):
-            return None
-        else:
-            df.reset_index(drop=True, inplace=True)
-            return df
-    except UnboundLocalError as e:
-        logger.warning(e)
+    if not df_list:
         logger.warning(
             "Nonexistent dataframe. Stats directory may be empty. Check the logfile for more details."
         )
         return None
+    df = concat_typed_dfs(df_list)
+    if check_empty(df, logger, 'create_df'):
+        return None
+    else:
+        df.reset_index(drop=True, inplace=True)
+        return df
 
-def filter_by_level_type(df, logger, verif_type):
+def filter_by_level_type(df, logger, verif_type, quiet=False):
     if df is None:
         return df
     if str(verif_type).lower() in ['pres', 'upper_air']:
@@ -204,77 +322,75 @@ def filter_by_level_type(df, logger, verif_type):
             ~(df['FCST_LEV'].str.startswith('P') 
             | df['OBS_LEV'].str.startswith('P'))
         ]
-    check_empty(df, logger, 'filter_by_level_type')
+    check_empty(df, logger, 'filter_by_level_type', quiet=quiet)
     return df
 
-def filter_by_var_name(df, logger, fcst_var_names, obs_var_names):
+def filter_by_var_name(df, logger, fcst_var_names, obs_var_names, quiet=False):
     if df is None:
         return df
     df = df[
         df['FCST_VAR'].isin(fcst_var_names) 
         & df['OBS_VAR'].isin(obs_var_names)
     ]
-    check_empty(df, logger, 'filter_by_var_name')
+    check_empty(df, logger, 'filter_by_var_name', quiet=quiet)
     return df
 
-def filter_by_interp(df, logger, interp):
+def filter_by_interp(df, logger, interp, quiet=False):
     if df is None:
         return df
     df = df[df['INTERP_MTHD'].eq(str(interp).upper())]
-    check_empty(df, logger, 'filter_by_interp')
+    check_empty(df, logger, 'filter_by_interp', quiet=quiet)
     return df
 
-def filter_by_domain(df, logger, domain):
+def filter_by_domain(df, logger, domain, quiet=False):
     if df is None:
         return df
     df = df[df['VX_MASK'].eq(str(domain))]
-    check_empty(df, logger, 'filter_by_domain')
+    check_empty(df, logger, 'filter_by_domain', quiet=quiet)
     return df
 
-def create_lead_hours(df, logger):
+def create_lead_hours(df, logger, quiet=False):
     df['LEAD_HOURS'] = np.array([int(lead[:-4]) for lead in df['FCST_LEAD']])
-    check_empty(df, logger, 'create_lead_hours')
+    check_empty(df, logger, 'create_lead_hours', quiet=quiet)
     return df
 
-def create_valid_datetime(df, logger):
+def create_valid_datetime(df, logger, quiet=False):
     df['VALID'] = pd.to_datetime(df['FCST_VALID_END'], format='%Y%m%d_%H%M%S')
-    check_empty(df, logger, 'create_valid_datetime')
+    check_empty(df, logger, 'create_valid_datetime', quiet=quiet)
     return df
 
-def create_init_datetime(df, logger):
+def create_init_datetime(df, logger, quiet=False):
     df.reset_index(drop=True, inplace=True)
-    df['INIT'] = [
-        df['VALID'][v] - pd.DateOffset(hours=int(hour)) 
-        for v, hour in enumerate(df['LEAD_HOURS'])
-    ]
-    check_empty(df, logger, 'create_init_datetime')
+    df['INIT'] = df['VALID'] - pd.to_timedelta(df['LEAD_HOURS'], unit='h')
+    check_empty(df, logger, 'create_init_datetime', quiet=quiet)
     return df
 
-def filter_by_date_range(df, logger, date_type, date_range):
+def filter_by_date_range(df, logger, date_type, date_range, quiet=False):
     if df is None:
         return df
     df = df.loc[
         (df[str(date_type).upper()] >= date_range[0]) 
         & (df[str(date_type).upper()] <= date_range[1])
     ]
-    check_empty(df, logger, 'filter_by_date_range')
+    check_empty(df, logger, 'filter_by_date_range', quiet=quiet)
     return df
 
-def filter_by_hour(df, logger, date_type, date_hours):
+def filter_by_hour(df, logger, date_type, date_hours, quiet=False):
     if df is None:
         return df
-    if check_empty(df, logger, 'filter_by_hour'):
+    if check_empty(df, logger, 'filter_by_hour', quiet=quiet):
         return df
     else:
         df = df.loc[[x in date_hours for x in df[str(date_type).upper()].dt.hour]]
-    check_empty(df, logger, 'filter_by_hour')
+    check_empty(df, logger, 'filter_by_hour', quiet=quiet)
     return df
 
 def get_preprocessed_data(logger, stats_dir, prune_dir, output_base_template, 
                           verif_case, verif_type, line_type, date_type, 
                           date_range, eval_period, date_hours, fleads, 
                           var_name, fcst_var_names, obs_var_names, model_list, 
-                          domain, interp, interp_pnts, met_version, clear_prune_dir):
+                          domain, interp, interp_pnts, met_version, clear_prune_dir,
+                          nproc=None):
     valid_range = get_valid_range(
         logger, date_type, date_range, date_hours, fleads
     )
@@ -286,21 +402,24 @@ def get_preprocessed_data(logger, stats_dir, prune_dir, output_base_template,
     df = create_df(
         logger, stats_dir, pruned_data_dir, line_type, date_range, model_list,
         met_version, clear_prune_dir, verif_type, fcst_var_names, obs_var_names, 
-        interp, domain, date_type, date_hours
+        interp, domain, date_type, date_hours, nproc=nproc
     )
     if df is not None and check_empty(df, logger, 'get_preprocessed_data'):
         df = None
     return df
 
 def run_filters(df, logger, verif_type, fcst_var_names, obs_var_names,
-                interp, domain, date_type, date_range, date_hours):
-    df = filter_by_level_type(df, logger, verif_type)
-    df = filter_by_var_name(df, logger, fcst_var_names, obs_var_names)
-    df = filter_by_interp(df, logger, interp)
-    df = filter_by_domain(df, logger, domain)
-    df = create_lead_hours(df, logger)
-    df = create_valid_datetime(df, logger)
-    df = create_init_datetime(df, logger)
-    df = filter_by_date_range(df, logger, date_type, date_range)
-    df = filter_by_hour(df, logger, date_type, date_hours)
+                interp, domain, date_type, date_range, date_hours,
+                quiet=False):
+    df = filter_by_level_type(df, logger, verif_type, quiet=quiet)
+    df = filter_by_var_name(
+        df, logger, fcst_var_names, obs_var_names, quiet=quiet
+    )
+    df = filter_by_interp(df, logger, interp, quiet=quiet)
+    df = filter_by_domain(df, logger, domain, quiet=quiet)
+    df = create_lead_hours(df, logger, quiet=quiet)
+    df = create_valid_datetime(df, logger, quiet=quiet)
+    df = create_init_datetime(df, logger, quiet=quiet)
+    df = filter_by_date_range(df, logger, date_type, date_range, quiet=quiet)
+    df = filter_by_hour(df, logger, date_type, date_hours, quiet=quiet)
     return df
@@ -41,53 +41,34 @@ fi
 if [ $get_gather = yes ] ; then
 
 #****************************************
-# Build a POE script to collect sub-jobs
+# Gather all models in one run
 #****************************************
->run_gather_all_poe.sh
-for MODL in $MODELS ; do
-
-    modl=`echo $MODL | tr '[A-Z]' '[a-z]'`
-
-#************************************************
-# Build sub-jobs
-#***********************************************
->run_gather_${verify}_${MODL}.sh
-
-    echo  "export output_base=${WORK}/gather" >> run_gather_${verify}_${MODL}.sh 
-    echo  "export verify=$verify" >> run_gather_${verify}_${MODL}.sh 
+if [ $verify = grid2obs ] || [ $verify = spcoutlook ] ; then
+  obtypes="ADPUPA,ADPSFC,SFCSHP,MSONET"
+elif [ $verify = precip ] ; then
+  obtypes="CCPA,MRMS,NOHRSC"
+fi
 
-
-    echo  "export vbeg=00" >> run_gather_${verify}_${MODL}.sh
-    echo  "export vend=23" >> run_gather_${verify}_${MODL}.sh
-    echo  "export valid_increment=3600" >>  run_gather_${verify}_${MODL}.sh
-    echo  "export model=$modnam" >> run_gather_${verify}_${MODL}.sh
-    echo  "export stat_file_dir=${COMOUTsmall}" >> run_gather_${verify}_${MODL}.sh
-    echo  "export gather_output_dir=${WORK}/gather " >> run_gather_${verify}_${MODL}.sh
-    echo  "export MODEL=${MODL}" >> run_gather_${verify}_${MODL}.sh
-    echo  "export modl=$modl" >> run_gather_${verify}_${MODL}.sh
-
-    if [ $verify = grid2obs ] || [ $verify = spcoutlook ] ; then 
-      echo  "${METPLUS_PATH}/ush/run_metplus.py -c ${PARMevs}/metplus_config/machine.conf -c ${GRID2OBS_CONF}/StatAnlysis_fcstHREF_obsPREPBUFR_GatherByDay.conf " >> run_gather_${verify}_${MODL}.sh
+gather_jobs=""
+for MODL in $MODELS ; do
+    if [ $verify = grid2obs ] || [ $verify = spcoutlook ] ; then
+      lookin="${COMOUTsmall}/*${MODL}*"
     elif [ $verify = precip ] ; then
-      echo  "${METPLUS_PATH}/ush/run_metplus.py -c ${PARMevs}/metplus_config/machine.conf -c ${PRECIP_CONF}/StatAnlysis_fcstHREF_obsAnalysis_GatherByDay.conf " >> run_gather_${verify}_${MODL}.sh
-   fi
-
-    echo "[[ $SENDCOM = YES  && -s ${WORK}/gather/${vday}/${MODL}_${verify}_${vday}.stat ]] && cp -v ${WORK}/gather/${vday}/${MODL}_${verify}_${vday}.stat  $COMOUTfinal/evs.stats.${modl}.${verify}.v${vday}.stat" >> run_gather_${verify}_${MODL}.sh
-
-    chmod +x run_gather_${verify}_${MODL}.sh
- 
-    echo "${DATA}/run_gather_${verify}_${MODL}.sh" >> run_gather_all_poe.sh    
-   
+      lookin="${COMOUTsmall}/${MODL}"
+    fi
+    gather_jobs="$gather_jobs ${MODL}:${lookin}:${WORK}/gather/${vday}/${MODL}_${verify}_${vday}.stat"
 done
 
-chmod 775 run_gather_all_poe.sh
-
-#*****************************
-#  Run the POE script
-#*****************************
-${DATA}/run_gather_all_poe.sh
+python $USHevs/cam/gather_stat_files.py ${vday}00 ${vday}23 $obtypes $gather_jobs
 export err=$?; err_chk
 
+for MODL in $MODELS ; do
+    modl=`echo $MODL | tr '[A-Z]' '[a-z]'`
+    if [[ $SENDCOM = YES  && -s ${WORK}/gather/${vday}/${MODL}_${verify}_${vday}.stat ]] ; then
+      cp -v ${WORK}/gather/${vday}/${MODL}_${verify}_${vday}.stat  $COMOUTfinal/evs.stats.${modl}.${verify}.v${vday}.stat
+    fi
+done
+
 else
   echo "NO stat files exsist in $COMOUTsmall directory" 
 fi 
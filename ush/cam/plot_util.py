@@ -2103,42 +2103,31 @@ def equalize_samples(logger, df, group_by):
             'FCST_THRESH_VALUE', 'OBS_LEV']
         if key in df.keys()
     ]
-    df_groups = df.groupby(group_by)
-    indexes = []
-    # List all of the independent variables that are found in the data
-    unique_indep_vars = np.unique(np.array(list(df_groups.groups.keys())).T[1])
-    for unique_indep_var in unique_indep_vars:
-        # Get all groups, in the form of DataFrames, that include the given 
-        # independent variable
-        dfs = [
-            df_groups.get_group(name)[cols_to_check]
-            for name in list(df_groups.groups.keys()) 
-            if str(name[1]) == str(unique_indep_var)
-        ]
-        # merge all of these DataFrames together according to 
-        # the columns in cols_to_check
-        for i, dfs_i in enumerate(dfs):
-            if i == 0:
-                df_merged = dfs_i
-            else:
-                df_merged = df_merged.merge(
-                    dfs_i, how='inner', indicator=False
-                )
-            # Reduce the size of the merged df as we go by removing duplicates
-            df_merged = df_merged.drop_duplicates()
-
-        # make sure to remove duplicate rows (looking only at the columns in 
-        # cols_to_check) to reduce comp time in the next in the next step
-        match_these = df_merged.drop_duplicates()
-        # Get all the indices for rows in each group that match the merged df
-        for dfs_i in dfs:
-            for idx, row in dfs_i.iterrows():
-                if (
-                        row.to_numpy()[1:].tolist() 
-                        in match_these.to_numpy()[:,1:].tolist()):
-                    indexes.append(idx)
-    # Select the matched rows by index among the rows in the original DataFrame
-    df_equalized = df.loc[indexes]
+    # Flag the rows whose cols_to_check values are found in every group
+    # with the same independent variable, all groups at once
+    group_num = df.groupby(group_by).ngroup()
+    in_group = (group_num >= 0).to_numpy()
+    df_keys = df[cols_to_check].reset_index(drop=True)
+    df_keys['GROUP_NUM'] = group_num.to_numpy()
+    df_keys['INDEP_VAR'] = df[group_by[1]].astype(str).to_numpy()
+    df_keys = df_keys[in_group]
+    n_indep_var_groups = df_keys.groupby('INDEP_VAR')['GROUP_NUM'].nunique()
+    in_all_groups = (
+        df_keys.groupby(['INDEP_VAR']+cols_to_check, dropna=False)
+        ['GROUP_NUM'].transform('nunique')
+        == df_keys['INDEP_VAR'].map(n_indep_var_groups)
+    )
+    # Keep all the rows in each group that match a row found in every group
+    match_cols = ['INDEP_VAR']+cols_to_check[1:]
+    match_these = pd.MultiIndex.from_frame(
+        df_keys.loc[in_all_groups, match_cols]
+    )
+    keep = np.zeros(len(df), dtype=bool)
+    keep[np.flatnonzero(in_group)] = pd.MultiIndex.from_frame(
+        df_keys[match_cols]
+    ).isin(match_these)
+    # Select the matched rows among the rows in the original DataFrame
+    df_equalized = df[keep]
     # Remove duplicates again, this time among both the columns 
     # in cols_to_check and the 'MODEL' column, which avoids, say, models with
     # repeated data from multiple entities
@@ -2154,11 +2143,9 @@ def equalize_samples(logger, df, group_by):
         df_groups_sizes.index = df_groups_sizes.index.set_levels(
             df_groups_sizes.index.levels[-1].astype(str), level=-1
         )
-        data_are_equalized = np.all([
-            np.unique(df_groups_sizes.xs(str(unique_indep_var), level=1)).size == 1
-            for unique_indep_var 
-            in np.unique(np.array(list(df_groups_sizes.keys())).T[1])
-        ])
+        data_are_equalized = bool((
+            df_groups_sizes.groupby(level=1).nunique() == 1
+        ).all())
     else:
         logger.info(
             "Sample equalization was successful but resulted in an empty"
@@ -11,6 +11,23 @@ import os
 from datetime import datetime, timedelta as td
 import numpy as np
 
+class LazySections():
+    '''
+    Base for settings classes with large tables that only some plotting
+    jobs use.  Each table named in lazy_sections is set by its method the
+    first time it is asked for, so creating the object stays cheap.
+    '''
+    lazy_sections = {}
+
+    def __getattr__(self, name):
+        lazy_sections = type(self).lazy_sections
+        if name in lazy_sections:
+            getattr(self, lazy_sections[name])()
+            return self.__dict__[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
 class Toggle():
     def __init__(self):
         
@@ -86,7 +103,9 @@ class Paths():
         self.logo_left_path = f"{os.environ['FIXevs']}/logos/noaa.png"
         self.logo_right_path = f"{os.environ['FIXevs']}/logos/nws.png"
 
-class Presets():
+class Presets(LazySections):
+    lazy_sections = {'date_presets': '_set_date_presets'}
+
     def __init__(self):
 
         self.level_presets = {
@@ -97,6 +116,7 @@ class Presets():
             'utrop': 'P500,P400,P300,P250,P200,P150,P100'
         }
 
+    def _set_date_presets(self):
         '''
         Evaluation periods that are requested regularly can be defined here 
         and then requested as the 'EVAL_PERIOD' variable in the plotting 
@@ -727,7 +747,14 @@ class ModelSpecs():
         color_dict = self.model_settings[name]
         return color_dict
 
-class Reference():
+class Reference(LazySections):
+    lazy_sections = {
+        'variable_translator': '_set_variable_translator',
+        'domain_translator': '_set_domain_translator',
+        'linetype_cols': '_set_linetype_cols',
+        'case_type': '_set_case_type',
+    }
+
     def __init__(self):
         '''
         Plotting jobs for the variables in this list will attempt to replace
@@ -789,6 +816,7 @@ class Reference():
             },
         }
 
+    def _set_variable_translator(self):
         '''
         Given a var_name, which is used to find the desired forecast field 
         in the MET .stat files, the plotting scripts will print the long name 
@@ -882,6 +910,7 @@ class Reference():
                                     'APCP_24_ENS_FREQ_gt25': 'APCP_24hr > 25 mm',
                                     'APCP_24_ENS_FREQ_gt50': 'APCP_24hr > 50 mm'}
 
+    def _set_domain_translator(self):
         '''
         Given a domain requested in the plotting configuration file, the
         plotting scripts will print the long name of that domain according
@@ -1249,6 +1278,8 @@ class Reference():
                                       'save_name': 'SEA_ICE_FREE_POLAR',
                                   },
         }
+
+    def _set_linetype_cols(self):
         self.linetype_cols = {'FHO':['TOTAL','F_RATE','H_RATE','O_RATE'],
                               'CTC':['TOTAL','FY_OY','FY_ON','FN_OY','FN_ON'],
                               'CTS':['TOTAL','BASER','BASER_NCL','BASER_NCU',
@@ -1402,6 +1433,7 @@ class Reference():
                                       'ZHU_OF','ZHU_MIN','ZHU_MAX','ZHU_MEAN'],
         }
 
+    def _set_case_type(self):
         '''
         Define plotting jobs that are allowed in order to draw attention to 
         configuration typos, to delineate the bounds of expected user
@@ -816,7 +816,6 @@ elif JOB_GROUP == 'make_plots':
         logger.error(plot+" not recongized")
         sys.exit(1)
 elif JOB_GROUP == 'tar_images':
-    cwd = os.getcwd()
     tar_file = os.path.join(
         DATA, f"{VERIF_CASE}_{STEP}", 'plot_output', 'tar_files',
         (f"{VERIF_CASE}_{VERIF_TYPE}_"
@@ -829,10 +828,8 @@ elif JOB_GROUP == 'tar_images':
     )
     if not os.path.exists(tar_file):
         if len(glob.glob(DATAjob+'/*')) != 0:
-            os.chdir(DATAjob)
             logger.debug(f"Making tar file {tar_file} from {DATAjob}")
-            gda_util.run_shell_command(['tar', '-cvf', tar_file, '*'])
-            os.chdir(cwd)
+            gda_util.tar_images(logger, tar_file, DATAjob)
         else:
             logger.debug(f"No images generated in {DATAjob}, "
                          +"cannot make tar file")
@@ -98,144 +98,95 @@ class LeadByLevel:
         )
         fcst_units = []
         # Make datafram for all levels and all forecast hours
+        fhr_valid_dates_dict = {}
+        for forecast_hour in self.date_info_dict['forecast_hours']:
+            # Get dates to plot
+            self.logger.debug("Making valid and init date arrays for "
+                              +f"forecast hour {forecast_hour}")
+            valid_dates, init_dates = gda_util.get_plot_dates(
+                self.logger,
+                self.date_info_dict['date_type'],
+                self.date_info_dict['start_date'],
+                self.date_info_dict['end_date'],
+                self.date_info_dict['valid_hr_start'],
+                self.date_info_dict['valid_hr_end'],
+                self.date_info_dict['valid_hr_inc'],
+                self.date_info_dict['init_hr_start'],
+                self.date_info_dict['init_hr_end'],
+                self.date_info_dict['init_hr_inc'],
+                forecast_hour
+            )
+            format_valid_dates = [
+                valid_dates[d].strftime('%Y%m%d_%H%M%S') \
+                for d in range(len(valid_dates))
+            ]
+            format_init_dates = [
+                init_dates[d].strftime('%Y%m%d_%H%M%S') \
+                for d in range(len(init_dates))
+            ]
+            if self.date_info_dict['date_type'] == 'VALID':
+                self.logger.debug("Based on date information, "
+                                  +"plot will display valid dates "
+                                  +', '.join(format_valid_dates)+" "
+                                  +"for forecast hour "
+                                  +f"{forecast_hour} with "
+                                  +"initialization dates "
+                                  +', '.join(format_init_dates))
+            elif self.date_info_dict['date_type'] == 'INIT':
+                self.logger.debug("Based on date information, "
+                                  +"plot will display "
+                                  +"initialization dates "
+                                  +', '.join(format_init_dates)+" "
+                                  +"for forecast hour "
+                                  +f"{forecast_hour} with valid dates "
+                                  +', '.join(format_valid_dates))
+            fhr_valid_dates_dict[forecast_hour] = format_valid_dates
+        level_input_dir_dict = {}
         for level in vert_profile_levels:
             vert_profile_levels_int[vert_profile_levels.index(level)] = (
                 level[1:]
             )
-            for forecast_hour in self.date_info_dict['forecast_hours']:
-                self.logger.info(f"Building data for level {level} "
-                                 +f"forecast hour {forecast_hour}")
-                # Get dates to plot
-                self.logger.debug("Making valid and init date arrays")
-                valid_dates, init_dates = gda_util.get_plot_dates(
-                    self.logger,
-                    self.date_info_dict['date_type'],
-                    self.date_info_dict['start_date'],
-                    self.date_info_dict['end_date'],
-                    self.date_info_dict['valid_hr_start'],
-                    self.date_info_dict['valid_hr_end'],
-                    self.date_info_dict['valid_hr_inc'],
-                    self.date_info_dict['init_hr_start'],
-                    self.date_info_dict['init_hr_end'],
-                    self.date_info_dict['init_hr_inc'],
-                    forecast_hour
-                )
-                format_valid_dates = [
-                    valid_dates[d].strftime('%Y%m%d_%H%M%S') \
-                    for d in range(len(valid_dates))
-                ]
-                format_init_dates = [
-                    init_dates[d].strftime('%Y%m%d_%H%M%S') \
-                    for d in range(len(init_dates))
-                ]
-                if self.date_info_dict['date_type'] == 'VALID':
-                    self.logger.debug("Based on date information, "
-                                      +"plot will display valid dates "
-                                      +', '.join(format_valid_dates)+" "
-                                      +"for forecast hour "
-                                      +f"{forecast_hour} with "
-                                      +"initialization dates "
-                                      +', '.join(format_init_dates))
-                    plot_dates = valid_dates
-                elif self.date_info_dict['date_type'] == 'INIT':
-                    self.logger.debug("Based on date information, "
-                                      +"plot will display "
-                                      +"initialization dates "
-                                      +', '.join(format_init_dates)+" "
-                                      +"for forecast hour "
-                                      +f"{forecast_hour} with valid dates "
-                                      +', '.join(format_valid_dates))
-                    plot_dates = init_dates
-                # Read in data
-                level_input_dir = os.path.join(
-                    self.input_dir, '..', '..',
-                    f"{self.plot_info_dict['fcst_var_name'].lower()}_"
-                    +f"{level.lower()}",
-                    (self.plot_info_dict['vx_mask'].lower()\
-                     .replace('global', 'glb').replace('conus', 'buk_conus'))
-                )
-                self.logger.info("Reading in model stat files from "
-                                 +f"{level_input_dir}")
-                all_model_df = gda_util.build_df(
-                    'make_plots', self.logger, level_input_dir, self.output_dir,
-                    self.model_info_dict, self.met_info_dict,
-                    self.plot_info_dict['fcst_var_name'],
-                    level,
-                    self.plot_info_dict['fcst_var_thresh'],
-                    self.plot_info_dict['obs_var_name'],
-                    level,
-                    self.plot_info_dict['obs_var_thresh'],
-                    self.plot_info_dict['line_type'],
-                    self.plot_info_dict['grid'],
-                    self.plot_info_dict['vx_mask'],
-                    self.plot_info_dict['interp_method'],
-                    self.plot_info_dict['interp_points'],
-                    self.date_info_dict['date_type'],
-                    plot_dates, format_valid_dates,
-                    str(forecast_hour)
-                )
-                fcst_units.extend(
-                    all_model_df['FCST_UNITS'].values.astype('str')\
-                    .tolist()
-                )
-                # Calculate statistic mean
-                self.logger.info("Calculating statstic "
-                                 +f"{self.plot_info_dict['stat']} "
-                                 +"from line type "
-                                 +f"{self.plot_info_dict['line_type']} "
-                                 +"average")
-                stat_df, stat_array = gda_util.calculate_stat(
-                    self.logger, all_model_df,
-                    self.plot_info_dict['line_type'],
-                    self.plot_info_dict['stat']
-                )
-                model_idx_list = (
-                    stat_df.index.get_level_values(0).unique().tolist()
-                )
-                if self.plot_info_dict['event_equalization'] == 'YES':
-                    self.logger.info("Doing event equalization")
-                    masked_stat_array = np.ma.masked_invalid(stat_array)
-                    stat_array = np.ma.mask_cols(masked_stat_array)
-                    stat_array = stat_array.filled(fill_value=np.nan)
-                    for model_idx in model_idx_list:
-                        model_idx_num = model_idx_list.index(model_idx)
-                        stat_df.loc[model_idx] = stat_array[model_idx_num,:]
-                        all_model_df.loc[model_idx] = (
-                            all_model_df.loc[model_idx].where(
-                                stat_df.loc[model_idx].notna()
-                        ).values)
-                if forecast_hour \
-                        == self.date_info_dict['forecast_hours'][0] \
-                        and level == vert_profile_levels[0]:
-                    stat_vert_prof_forecast_hours_avg_df = pd.DataFrame(
-                        np.nan, pd.MultiIndex.from_product(
-                            [model_idx_list,
-                             self.date_info_dict['forecast_hours']],
-                            names=['model', 'fhr']
-                        ),
-                        columns=vert_profile_levels
-                    )
-                for model_idx in model_idx_list:
-                    model_idx_num = model_idx_list.index(model_idx)
-                    if self.plot_info_dict['line_type'] in ['CNT', 'GRAD',
-                                                            'CTS',
-                                                            'NBRCTS',
-                                                            'NBRCNT',
-                                                            'VCNT']:
-                        avg_method = 'mean'
-                        calc_avg_df = stat_df.loc[model_idx]
-                    else:
-                        avg_method = 'aggregation'
-                        calc_avg_df = all_model_df.loc[model_idx]
-                    model_idx_forecast_hour_avg = gda_util.calculate_average(
-                       self.logger, avg_method,
-                       self.plot_info_dict['line_type'],
-                       self.plot_info_dict['stat'], calc_avg_df
-                    )
-                    if not np.isnan(model_idx_forecast_hour_avg):
-                        stat_vert_prof_forecast_hours_avg_df.loc[
-                            (model_idx, forecast_hour), level
-                        ] = model_idx_forecast_hour_avg
+            level_input_dir_dict[level] = os.path.join(
+                self.input_dir, '..', '..',
+                f"{self.plot_info_dict['fcst_var_name'].lower()}_"
+                +f"{level.lower()}",
+                (self.plot_info_dict['vx_mask'].lower()\
+                 .replace('global', 'glb').replace('conus', 'buk_conus'))
+            )
+        # Read in data for all levels and forecast hours at once
+        self.logger.info("Reading in model stat files for levels "
+                         +f"{', '.join(vert_profile_levels)}")
+        all_model_df = gda_util.build_level_lead_df(
+            self.logger, level_input_dir_dict,
+            self.model_info_dict, self.met_info_dict,
+            self.plot_info_dict['fcst_var_name'],
+            self.plot_info_dict['fcst_var_thresh'],
+            self.plot_info_dict['obs_var_name'],
+            self.plot_info_dict['obs_var_thresh'],
+            self.plot_info_dict['line_type'],
+            self.plot_info_dict['grid'],
+            self.plot_info_dict['vx_mask'],
+            self.plot_info_dict['interp_method'],
+            self.plot_info_dict['interp_points'],
+            fhr_valid_dates_dict
+        )
+        fcst_units.extend(
+            all_model_df['FCST_UNITS'].values.astype('str').tolist()
+        )
+        # Calculate statistic mean
+        self.logger.info("Calculating statstic "
+                         +f"{self.plot_info_dict['stat']} "
+                         +"from line type "
+                         +f"{self.plot_info_dict['line_type']} "
+                         +"average")
+        stat_vert_prof_forecast_hours_avg_df = (
+            gda_util.calculate_level_lead_average(
+                self.logger, all_model_df,
+                self.plot_info_dict['line_type'],
+                self.plot_info_dict['stat'],
+                self.plot_info_dict['event_equalization'] == 'YES'
+            )
+        )
         # Set up plot
         self.logger.info(f"Setting up plot")
         plot_specs_lbl = PlotSpecs(self.logger, 'lead_by_level')
@@ -115,6 +115,8 @@ class NOHRSCSpatialMap:
             sys.exit(1)
         make_png = False
         make_gif = False
+        gif_list = []
+        COMOUT_gif_name_dict = {}
         DATA_png_name = os.path.join(
             self.DATA_output_dir,
             'nohrsc.v'+valid_date_dt.strftime('%Y%m%d%H')+'.024h.'
@@ -296,20 +298,13 @@ class NOHRSCSpatialMap:
                 and not os.path.exists(DATA_gif_name):
             make_gif = True
         if make_gif:
-            # Convert png to gif, if possible
-            check_convert = subprocess.run(
-                ['which', 'convert'], stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-            if check_convert.returncode == 0:
-                self.logger.info(f"Converting {DATA_png_name} to "
-                                 +f"{DATA_gif_name}")
-                run_convert = subprocess.run(
-                    ['convert', DATA_png_name, DATA_gif_name]
-                )
-                gda_util.copy_file(DATA_gif_name, COMOUT_gif_name)
-            else:
-                self.logger.warning("convert executable not in PATH")
+            gif_list.append((DATA_png_name, DATA_gif_name))
+            COMOUT_gif_name_dict[DATA_gif_name] = COMOUT_gif_name
+        # Convert png to gif in process
+        for DATA_gif_name in gda_util.convert_images(self.logger,
+                                                     gif_list):
+            gda_util.copy_file(DATA_gif_name,
+                               COMOUT_gif_name_dict[DATA_gif_name])
 
 def main():
     # Need settings
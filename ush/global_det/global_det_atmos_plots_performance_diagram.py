@@ -20,9 +20,82 @@ import matplotlib
 matplotlib.use('agg')
 import matplotlib.pyplot as plt
 import matplotlib.dates as md
+import matplotlib.cm as cm
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import global_det_atmos_util as gda_util
 from global_det_atmos_plots_specs import PlotSpecs
 
+# Rendered performance diagram backgrounds, by style, axes size and dpi
+BACKGROUND_CACHE = {}
+
+def draw_performance_diagram_background(fig, ax, cmap_csi):
+    """! Draw the CSI contours and frequency bias lines behind a
+         performance diagram; they are the same on every diagram, so
+         they are rendered once per style, axes size and dpi
+
+         Args:
+             fig      - figure of the diagram (matplotlib Figure)
+             ax       - axes of the diagram (matplotlib Axes)
+             cmap_csi - colormap of the CSI contours (matplotlib
+                        Colormap)
+
+         Returns:
+             csi_mappable - stands in for the CSI contours in the
+                            colorbar (matplotlib ScalarMappable)
+    """
+    pd_min = 0.001
+    pd_max = 1.
+    pd_csi_clevs = np.arange(0., 1.1, 0.1)
+    x_min, x_max = ax.get_xlim()
+    y_min, y_max = ax.get_ylim()
+    ax_pos = ax.get_position()
+    fig_width, fig_height = fig.get_size_inches()
+    width = fig_width*ax_pos.width*(pd_max-pd_min)/(x_max-x_min)
+    height = fig_height*ax_pos.height*(pd_max-pd_min)/(y_max-y_min)
+    dpi = plt.rcParams['savefig.dpi']
+    if dpi == 'figure':
+        dpi = fig.dpi
+    cache_key = (tuple(cmap_csi.colors), round(width, 3), round(height, 3),
+                 dpi)
+    if cache_key not in BACKGROUND_CACHE:
+        fig_bg = Figure(figsize=(width, height), dpi=dpi)
+        canvas_bg = FigureCanvasAgg(fig_bg)
+        ax_bg = fig_bg.add_axes([0., 0., 1., 1.])
+        ax_bg.set_axis_off()
+        pd_ticks = np.arange(0.001, 1.001, 0.001)
+        pd_sr, pd_pod = np.meshgrid(pd_ticks, pd_ticks)
+        pd_bias = pd_pod / pd_sr
+        pd_csi = 1.0 / (1.0 / pd_sr + 1.0 / pd_pod - 1.0)
+        pd_bias_clevs = [0.1, 0.2, 0.4, 0.6, 0.8, 1.,
+                         1.2, 1.5, 2., 3., 5., 10.]
+        ax_bg.set_xlim(pd_min, pd_max)
+        ax_bg.set_ylim(pd_min, pd_max)
+        CBIAS = ax_bg.contour(pd_sr, pd_pod, pd_bias, pd_bias_clevs,
+                              colors='gray', linestyles='dashed')
+        radius = 0.75
+        CBIAS_label_loc = []
+        for bias_val in pd_bias_clevs:
+            x = np.sqrt(np.power(radius, 2)/(np.power(bias_val, 2)+1))
+            y = np.sqrt(np.power(radius, 2) - np.power(x, 2))
+            CBIAS_label_loc.append((x,y))
+        ax_bg.clabel(CBIAS, fmt='%1.1f', manual=CBIAS_label_loc)
+        ax_bg.contourf(pd_sr, pd_pod, pd_csi, pd_csi_clevs, cmap=cmap_csi,
+                       extend='neither')
+        canvas_bg.draw()
+        BACKGROUND_CACHE[cache_key] = np.asarray(
+            canvas_bg.buffer_rgba()
+        ).copy()
+    ax.imshow(BACKGROUND_CACHE[cache_key],
+              extent=(pd_min, pd_max, pd_min, pd_max), origin='upper',
+              aspect='auto', interpolation='none', zorder=0)
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(y_min, y_max)
+    return cm.ScalarMappable(
+        norm=matplotlib.colors.BoundaryNorm(pd_csi_clevs, cmap_csi.N),
+        cmap=cmap_csi
+    )
+
 class PerformanceDiagram:
     """
     Make a performance_diagram graphic
@@ -206,12 +279,6 @@ class PerformanceDiagram:
         csi_colors = ['#ffffff', '#f5f5f5', '#ececec', '#dfdfdf', '#cbcbcb',
                        '#b2b2b2','#8e8e8e', '#6f6f6f', '#545454', '#3f3f3f']
         cmap_csi = matplotlib.colors.ListedColormap(csi_colors)
-        pd_ticks = np.arange(0.001, 1.001, 0.001)
-        pd_sr, pd_pod = np.meshgrid(pd_ticks, pd_ticks)
-        pd_bias = pd_pod / pd_sr
-        pd_csi = 1.0 / (1.0 / pd_sr + 1.0 / pd_pod - 1.0)
-        pd_bias_clevs = [0.1, 0.2, 0.4, 0.6, 0.8, 1.,
-                         1.2, 1.5, 2., 3., 5., 10.]
         stat_plot_name = plot_specs_pd.get_stat_plot_name(
              self.plot_info_dict['stat']
         )
@@ -286,18 +353,7 @@ class PerformanceDiagram:
                 right_logo_img_array, right_logo_xpixel_loc,
                 right_logo_ypixel_loc, zorder=1, alpha=right_logo_alpha
             )
-        CBIAS = plt.contour(pd_sr, pd_pod, pd_bias, pd_bias_clevs,
-                            colors='gray', linestyles='dashed')
-        radius = 0.75
-        CBIAS_label_loc = []
-        for bias_val in pd_bias_clevs:
-            x = np.sqrt(np.power(radius, 2)/(np.power(bias_val, 2)+1))
-            y = np.sqrt(np.power(radius, 2) - np.power(x, 2))
-            CBIAS_label_loc.append((x,y))
-        plt.clabel(CBIAS, fmt='%1.1f', manual=CBIAS_label_loc)
-        CFCSI = plt.contourf(pd_sr, pd_pod, pd_csi,
-                             np.arange(0., 1.1, 0.1), cmap=cmap_csi,
-                             extend='neither')
+        CFCSI = draw_performance_diagram_background(fig, ax, cmap_csi)
         cbar_left = ax.get_position().x1 + 0.05
         cbar_bottom = ax.get_position().y0
         cbar_width = 0.01
@@ -306,7 +362,7 @@ class PerformanceDiagram:
             [cbar_left, cbar_bottom, cbar_width, cbar_height]
         )
         cbar = plt.colorbar(CFCSI, orientation='vertical', cax=cbar_ax,
-                            ticks=CFCSI.levels)
+                            ticks=np.arange(0., 1.1, 0.1))
         #cbar.dividers.set_color('black')
         #cbar.dividers.set_linewidth(2)
         cbar.set_label(CSI_plot_name)
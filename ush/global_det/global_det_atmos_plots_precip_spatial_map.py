@@ -18,7 +18,7 @@ import os
 import logging
 import sys
 import datetime
-import subprocess
+import hashlib
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 from cartopy.mpl.ticker import LongitudeFormatter, LatitudeFormatter
@@ -26,6 +26,135 @@ from cartopy import config
 import global_det_atmos_util as gda_util
 from global_det_atmos_plots_specs import PlotSpecs
 
+# Map extent and projection center for each verification mask
+PRECIP_SPATIAL_MAP_DOMAINS = {
+    'conus': {'extent': [-124,-70,18.0,50.0],
+              'central_lon': -97.6, 'central_lat': 35.4},
+    'alaska': {'extent': [-180,-110,45.0,75.0],
+               'central_lon': -145, 'central_lat': 60},
+    'prico': {'extent': [-75,-60,12.0,25.0],
+              'central_lon': -67.5, 'central_lat': 18.5},
+    'hawaii': {'extent': [-165,-150,15.0,25.0],
+               'central_lon': -157.5, 'central_lat': 20},
+}
+
+# Figures with the map background of a verification mask already drawn,
+# keyed on (verification mask, figure size, logo directory)
+_BASEMAP_CACHE = {}
+
+# Grid coordinates projected onto a verification mask map and cropped to
+# its extent, keyed on (verification mask, latitude checksum,
+# longitude checksum)
+_PROJECTED_GRID_CACHE = {}
+
+def get_basemap(vx_mask, plot_specs_psm, logo_dir):
+    """! Get the figure with the map background of a verification mask,
+         drawing it only the first time it is asked for
+
+         Args:
+             vx_mask        - verification mask (string)
+             plot_specs_psm - set up plot specs object (PlotSpecs)
+             logo_dir       - directory with logo images (string)
+
+         Returns:
+             basemap - figure ('fig'), grid spec ('gs'), map axes ('ax')
+                       and color bar axes ('cbar_ax') (dictionary)
+    """
+    basemap_key = (vx_mask, tuple(plot_specs_psm.fig_size), logo_dir)
+    if basemap_key in _BASEMAP_CACHE:
+        return _BASEMAP_CACHE[basemap_key]
+    domain = PRECIP_SPATIAL_MAP_DOMAINS[vx_mask]
+    fig = plt.figure(figsize=(plot_specs_psm.fig_size[0],
+                              plot_specs_psm.fig_size[1]))
+    gs_hspace, gs_wspace = 0, 0
+    gs_bottom, gs_top = 0.125, 0.85
+    gs = gridspec.GridSpec(1,1, bottom=gs_bottom, top=gs_top,
+                           hspace=gs_hspace, wspace=gs_wspace)
+    for logo_side, logo_name in [('left', 'noaa.png'), ('right', 'nws.png')]:
+        logo_path = os.path.join(logo_dir, logo_name)
+        if os.path.exists(logo_path):
+            logo_img_array = matplotlib.image.imread(logo_path)
+            logo_xpixel_loc, logo_ypixel_loc, logo_alpha = (
+                plot_specs_psm.get_logo_location(
+                    logo_side, plot_specs_psm.fig_size[0],
+                    plot_specs_psm.fig_size[1], plt.rcParams['figure.dpi']
+                )
+            )
+            fig.figimage(logo_img_array, logo_xpixel_loc, logo_ypixel_loc,
+                         zorder=1, alpha=logo_alpha)
+    myproj=ccrs.LambertConformal(central_longitude=domain['central_lon'],
+                                 central_latitude=domain['central_lat'],
+                                 false_easting=0.0,
+                                 false_northing=0.0,
+                                 globe=None)
+    ax1 = fig.add_subplot(gs[0], projection=myproj)
+    ax1.set_extent(domain['extent'])
+    ax1.add_feature(cfeature.COASTLINE.with_scale('50m'),
+                    zorder=2, linewidth=1)
+    ax1.add_feature(cfeature.BORDERS.with_scale('50m'),
+                    zorder=2, linewidth=1)
+    ax1.add_feature(cfeature.STATES.with_scale('50m'),
+                    zorder=2, linewidth=1)
+    cbar_left = gs.get_grid_positions(fig)[2][0]
+    cbar_width = (gs.get_grid_positions(fig)[3][-1]
+                  - gs.get_grid_positions(fig)[2][0])
+    cbar_bottom = 0.075
+    cbar_height = 0.03
+    cbar_ax = fig.add_axes(
+        [cbar_left, cbar_bottom, cbar_width, cbar_height]
+    )
+    _BASEMAP_CACHE[basemap_key] = {'fig': fig, 'gs': gs, 'ax': ax1,
+                                   'cbar_ax': cbar_ax}
+    return _BASEMAP_CACHE[basemap_key]
+
+def get_projected_grid(vx_mask, precip_lat, precip_lon, map_ax):
+    """! Get the grid coordinates in the map projection of a verification
+         mask, cropped to the map extent, projecting them only the first
+         time a grid is asked for
+
+         Args:
+             vx_mask    - verification mask (string)
+             precip_lat - grid latitudes (1D or 2D array)
+             precip_lon - grid longitudes (1D or 2D array)
+             map_ax     - map axes of the verification mask (GeoAxes)
+
+         Returns:
+             x    - projected x coordinates of the cropped grid (2D array)
+             y    - projected y coordinates of the cropped grid (2D array)
+             crop - row and column slices of the cropped grid (tuple)
+    """
+    precip_lat = np.ascontiguousarray(np.ma.getdata(precip_lat))
+    precip_lon = np.ascontiguousarray(np.ma.getdata(precip_lon))
+    grid_key = (vx_mask, precip_lat.shape, precip_lon.shape,
+                hashlib.md5(precip_lat.tobytes()).hexdigest(),
+                hashlib.md5(precip_lon.tobytes()).hexdigest())
+    if grid_key in _PROJECTED_GRID_CACHE:
+        return _PROJECTED_GRID_CACHE[grid_key]
+    if precip_lat.ndim == 1 and precip_lon.ndim == 1:
+        lon, lat = np.meshgrid(precip_lon, precip_lat)
+    else:
+        lon, lat = precip_lon, precip_lat
+    # Put the longitude seam opposite the map center
+    central_lon = PRECIP_SPATIAL_MAP_DOMAINS[vx_mask]['central_lon']
+    lon = ((lon - central_lon + 180.) % 360.) - 180. + central_lon
+    xyz = map_ax.projection.transform_points(ccrs.PlateCarree(), lon, lat)
+    x, y = xyz[...,0], xyz[...,1]
+    x_min, x_max, y_min, y_max = map_ax.get_extent()
+    in_map = (np.isfinite(x) & np.isfinite(y)
+              & (x >= x_min) & (x <= x_max)
+              & (y >= y_min) & (y <= y_max))
+    rows = np.nonzero(in_map.any(axis=1))[0]
+    cols = np.nonzero(in_map.any(axis=0))[0]
+    if rows.size == 0:
+        crop = (slice(None), slice(None))
+    else:
+        # Keep one extra grid point on each side so the contours
+        # reach the map edges
+        crop = (slice(max(rows[0]-1, 0), rows[-1]+2),
+                slice(max(cols[0]-1, 0), cols[-1]+2))
+    _PROJECTED_GRID_CACHE[grid_key] = (x[crop], y[crop], crop)
+    return _PROJECTED_GRID_CACHE[grid_key]
+
 class PrecipSpatialMap:
     """
     Make a precipitation spatial map graphic
@@ -104,6 +233,8 @@ class PrecipSpatialMap:
         config['data_dir'] = config['repo_data_dir']
         # Read in data
         self.logger.info(f"Reading in model files from {self.input_dir}")
+        gif_list = []
+        COMOUT_gif_name_dict = {}
         for model_num in self.model_info_dict:
             model_num_dict = self.model_info_dict[model_num]
             model_num_name = model_num_dict['name']
@@ -169,11 +300,6 @@ class PrecipSpatialMap:
                 var_name = precip_data.variables['APCP_A24'].getncattr('name')
                 var_level = precip_data.variables['APCP_A24'].getncattr('level')
                 var_units = precip_data.variables['APCP_A24'].getncattr('units')
-                if precip_lat.ndim == 1 and precip_lon.ndim == 1:
-                    x, y = np.meshgrid(precip_lon, precip_lat)
-                elif precip_lat.ndim == 2 and precip_lon.ndim == 2:
-                    x = precip_lon
-                    y = precip_lat
                 file_init_time = (precip_data.variables['APCP_A24']\
                                   .getncattr('init_time'))
                 file_valid_time = (precip_data.variables['APCP_A24']\
@@ -230,38 +356,6 @@ class PrecipSpatialMap:
                         .strftime('%d%b%Y %H')+'Z to '
                         +valid_date_dt.strftime('%d%b%Y %H')+'Z'
                     )
-                plot_left_logo_path = os.path.join(self.logo_dir, 'noaa.png')
-                if os.path.exists(plot_left_logo_path):
-                    plot_left_logo = True
-                    left_logo_img_array = matplotlib.image.imread(
-                        plot_left_logo_path
-                    )
-                    left_logo_xpixel_loc,left_logo_ypixel_loc,left_logo_alpha = (
-                        plot_specs_psm.get_logo_location(
-                            'left', plot_specs_psm.fig_size[0],
-                             plot_specs_psm.fig_size[1],
-                             plt.rcParams['figure.dpi']
-                        )
-                    )
-                else:
-                    plot_left_logo = False
-                    self.logger.debug(f"{plot_left_logo_path} does not exist")
-                plot_right_logo_path = os.path.join(self.logo_dir, 'nws.png')
-                if os.path.exists(plot_right_logo_path):
-                    plot_right_logo = True
-                    right_logo_img_array = matplotlib.image.imread(
-                        plot_right_logo_path
-                    )
-                    right_logo_xpixel_loc,right_logo_ypixel_loc,right_logo_alpha = (
-                        plot_specs_psm.get_logo_location(
-                            'right', plot_specs_psm.fig_size[0],
-                            plot_specs_psm.fig_size[1],
-                            plt.rcParams['figure.dpi']
-                        )
-                    )
-                else:
-                    plot_right_logo = False
-                    self.logger.debug(f"{plot_right_logo_path} does not exist")
                 if var_units == 'inches':
                     clevs = clevs_in
                     cmap = matplotlib.colors.ListedColormap(colorlist_in)
@@ -273,66 +367,22 @@ class PrecipSpatialMap:
                 norm = matplotlib.colors.BoundaryNorm(clevs, cmap.N)
                 # Making plot
                 self.logger.info(f"Making plot")
-                fig = plt.figure(figsize=(plot_specs_psm.fig_size[0],
-                                          plot_specs_psm.fig_size[1]))
-                gs_hspace, gs_wspace = 0, 0
-                gs_bottom, gs_top = 0.125, 0.85
-                gs = gridspec.GridSpec(1,1, bottom=gs_bottom, top=gs_top,
-                                       hspace=gs_hspace, wspace=gs_wspace)
+                basemap = get_basemap(self.plot_info_dict['vx_mask'],
+                                      plot_specs_psm, self.logo_dir)
+                fig = basemap['fig']
+                ax1 = basemap['ax']
+                cbar_ax = basemap['cbar_ax']
                 fig.suptitle(plot_title)
-                if plot_left_logo:
-                    left_logo_img = fig.figimage(
-                        left_logo_img_array, left_logo_xpixel_loc,
-                        left_logo_ypixel_loc, zorder=1, alpha=right_logo_alpha
-                    )
-                    left_logo_img.set_visible(True)
-                if plot_right_logo:
-                    right_logo_img = fig.figimage(
-                        right_logo_img_array, right_logo_xpixel_loc,
-                        right_logo_ypixel_loc, zorder=1, alpha=right_logo_alpha
-                    )
-                if self.plot_info_dict['vx_mask'] == 'conus':
-                    extent = [-124,-70,18.0,50.0]
-                    central_lon = -97.6
-                    central_lat = 35.4
-                elif self.plot_info_dict['vx_mask'] == 'alaska':
-                    extent = [-180,-110,45.0,75.0]
-                    central_lon = -145
-                    central_lat = 60
-                elif self.plot_info_dict['vx_mask'] == 'prico':
-                    extent = [-75,-60,12.0,25.0]
-                    central_lon = -67.5
-                    central_lat = 18.5
-                elif self.plot_info_dict['vx_mask'] == 'hawaii':
-                    extent = [-165,-150,15.0,25.0]
-                    central_lon = -157.5
-                    central_lat = 20
-                myproj=ccrs.LambertConformal(central_longitude=central_lon,
-                                             central_latitude=central_lat,
-                                             false_easting=0.0,
-                                             false_northing=0.0,
-                                             globe=None)
-                ax1 = fig.add_subplot(gs[0], projection=myproj)
-                ax1.set_extent(extent)
-                ax1.add_feature(cfeature.COASTLINE.with_scale('50m'),
-                                zorder=2, linewidth=1)
-                ax1.add_feature(cfeature.BORDERS.with_scale('50m'),
-                                zorder=2, linewidth=1)
-                ax1.add_feature(cfeature.STATES.with_scale('50m'),
-                                zorder=2, linewidth=1)
-                CF1 = ax1.contourf(x, y, precip_APCP_A24,
-                                   transform=ccrs.PlateCarree(),
+                x, y, crop = get_projected_grid(
+                    self.plot_info_dict['vx_mask'], precip_lat, precip_lon,
+                    ax1
+                )
+                CF1 = ax1.contourf(x, y, precip_APCP_A24[crop],
+                                   transform=ax1.projection,
                                    levels=clevs, norm=norm,
                                    cmap=cmap, extend='max')
                 CF1.cmap.set_over(cmap_over_color)
-                cbar_left = gs.get_grid_positions(fig)[2][0]
-                cbar_width = (gs.get_grid_positions(fig)[3][-1]
-                              - gs.get_grid_positions(fig)[2][0])
-                cbar_bottom = 0.075
-                cbar_height = 0.03
-                cbar_ax = fig.add_axes(
-                    [cbar_left, cbar_bottom, cbar_width, cbar_height]
-                )
+                cbar_ax.clear()
                 cbar = fig.colorbar(CF1, cax=cbar_ax,
                                     orientation='horizontal',
                                     ticks=CF1.levels)
@@ -351,9 +401,14 @@ class PrecipSpatialMap:
                         )
                 cbar.ax.set_xticklabels(cbar_tick_labels_list)
                 self.logger.info(f"Saving image as {DATA_png_name}")
-                plt.savefig(DATA_png_name)
-                plt.clf()
-                plt.close('all')
+                fig.savefig(DATA_png_name)
+                # Take the data off the map so the background can be
+                # reused for the next image
+                if hasattr(CF1, 'remove'):
+                    CF1.remove()
+                else:
+                    for CF1_collection in CF1.collections:
+                        CF1_collection.remove()
                 gda_util.copy_file(DATA_png_name, COMOUT_png_name)
             DATA_gif_name = DATA_png_name.replace('.png', '.gif')
             COMOUT_gif_name = COMOUT_png_name.replace('.png', '.gif')
@@ -364,20 +419,13 @@ class PrecipSpatialMap:
                     and not os.path.exists(DATA_gif_name):
                 make_gif = True
             if make_gif:
-                # Convert png to gif, if possible
-                check_convert = subprocess.run(
-                    ['which', 'convert'], stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-                if check_convert.returncode == 0:
-                    self.logger.info(f"Converting {DATA_png_name} to "
-                                     +f"{DATA_gif_name}")
-                    run_convert = subprocess.run(
-                        ['convert', DATA_png_name, DATA_gif_name]
-                    )
-                    gda_util.copy_file(DATA_gif_name, COMOUT_gif_name)
-                else:
-                    self.logger.warning("convert executable not in PATH")
+                gif_list.append((DATA_png_name, DATA_gif_name))
+                COMOUT_gif_name_dict[DATA_gif_name] = COMOUT_gif_name
+        # Convert png to gif in process
+        for DATA_gif_name in gda_util.convert_images(self.logger,
+                                                     gif_list):
+            gda_util.copy_file(DATA_gif_name,
+                               COMOUT_gif_name_dict[DATA_gif_name])
 
 def main():
     # Need settings
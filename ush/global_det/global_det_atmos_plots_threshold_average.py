@@ -101,7 +101,6 @@ class ThresholdAverage:
                               +f"{self.date_info_dict['forecast_hour']} "
                               +"with initialization dates "
                               +', '.join(format_init_dates))
-            plot_dates = valid_dates
         elif self.date_info_dict['date_type'] == 'INIT':
             self.logger.debug("Based on date information, plot will display "
                               +"initialization dates "
@@ -110,129 +109,48 @@ class ThresholdAverage:
                               +f"{self.date_info_dict['forecast_hour']} "
                               +"with valid dates "
                               +', '.join(format_valid_dates))
-            plot_dates = init_dates
         # Make dataframe for all thresholds
         self.logger.info(f"Reading in model stat files from {self.input_dir}")
         self.logger.info("Building dataframe for all thresholds")
-        # Make dataframe for all thresholds
-        fcst_units = []
-        for fcst_var_thresh in self.plot_info_dict['fcst_var_threshs']:
-            self.logger.debug("Building data for forecast threshold "
-                              +f"{fcst_var_thresh}")
-            fcst_var_thresh_idx = (self.plot_info_dict['fcst_var_threshs']\
-                                   .index(fcst_var_thresh))
-            obs_var_thresh = (self.plot_info_dict['obs_var_threshs']\
-                              [fcst_var_thresh_idx])
-            all_model_df = gda_util.build_df(
-                'make_plots', self.logger, self.input_dir, self.output_dir,
-                self.model_info_dict, self.met_info_dict,
-                self.plot_info_dict['fcst_var_name'],
-                self.plot_info_dict['fcst_var_level'],
-                fcst_var_thresh,
-                self.plot_info_dict['obs_var_name'],
-                self.plot_info_dict['obs_var_level'],
-                obs_var_thresh,
-                self.plot_info_dict['line_type'],
-                self.plot_info_dict['grid'],
-                self.plot_info_dict['vx_mask'],
-                self.plot_info_dict['interp_method'],
-                self.plot_info_dict['interp_points'],
-                self.date_info_dict['date_type'],
-                plot_dates, format_valid_dates,
-                self.date_info_dict['forecast_hour']
-            )
-            fcst_units.extend(
-                all_model_df['FCST_UNITS'].values.astype('str').tolist()
-            )
-            # Calculate statistic mean and 95% confidence intervals
-            self.logger.info(f"Calculating statstic {self.plot_info_dict['stat']} "
-                             +f"from line type {self.plot_info_dict['line_type']} "
-                             +"average and 95% confidence intervals")
-            stat_df, stat_array = gda_util.calculate_stat(
-                self.logger, all_model_df, self.plot_info_dict['line_type'],
-                self.plot_info_dict['stat']
-            )
-            model_idx_list = (
-                stat_df.index.get_level_values(0).unique().tolist()
-            )
-            if self.plot_info_dict['event_equalization'] == 'YES':
-                self.logger.info("Doing event equalization")
-                masked_stat_array = np.ma.masked_invalid(stat_array)
-                stat_array = np.ma.mask_cols(masked_stat_array)
-                stat_array = stat_array.filled(fill_value=np.nan)
-                for model_idx in model_idx_list:
-                    model_idx_num = model_idx_list.index(model_idx)
-                    stat_df.loc[model_idx] = stat_array[model_idx_num,:]
-                    all_model_df.loc[model_idx] = (
-                        all_model_df.loc[model_idx].where(
-                            stat_df.loc[model_idx].notna()
-                    ).values)
-            if fcst_var_thresh == self.plot_info_dict['fcst_var_threshs'][0]:
-                threshs_avg_df = pd.DataFrame(
-                    np.nan, model_idx_list,
-                    columns=self.plot_info_dict['fcst_var_threshs']
-                )
-                threshs_ci_df = pd.DataFrame(
-                    np.nan, model_idx_list,
-                    columns=self.plot_info_dict['fcst_var_threshs']
-                )
-            for model_idx in model_idx_list:
-                model_idx_num = model_idx_list.index(model_idx)
-                if self.plot_info_dict['line_type'] in ['CNT', 'GRAD',
-                                                        'CTS', 'NBRCTS',
-                                                        'NBRCNT', 'VCNT']:
-                    avg_method = 'mean'
-                    calc_avg_df = stat_df.loc[model_idx]
-                else:
-                    avg_method = 'aggregation'
-                    calc_avg_df = all_model_df.loc[model_idx]
-                model_idx_thresh_avg = gda_util.calculate_average(
-                    self.logger, avg_method, self.plot_info_dict['line_type'],
-                    self.plot_info_dict['stat'], calc_avg_df
-                )
-                if not np.isnan(model_idx_thresh_avg) \
-                        and not np.ma.is_masked(model_idx_thresh_avg):
-                    threshs_avg_df.loc[model_idx, fcst_var_thresh] = (
-                        model_idx_thresh_avg
-                    )
-                if model_idx == model_idx_list[0]:
-                    model1_stat_df = stat_df.loc[model_idx]
-                else:
-                    model_idx_model1_diff = np.ma.masked_invalid(
-                        stat_df.loc[model_idx] - model1_stat_df
-                    )
-                    nsamples = (len(model_idx_model1_diff)
-                                -np.ma.count_masked(model_idx_model1_diff))
-                    model_idx_model1_diff_mean = np.mean(model_idx_model1_diff)
-                    model_idx_model1_diff_std = np.std(model_idx_model1_diff)
-                    ##Null Hypothesis: mean(M1-M2)=0,
-                    ##M1-M2 follows normal distribution.
-                    ##plot the 5% conf interval of difference of means
-                    ##F*SD/sqrt(N-1),
-                    ##F=1.96 for infinite samples, F=2.0 for nsz=60,
-                    ##F=2.042 for nsz=30, F=2.228 for nsz=10
-                    if nsamples > 1:
-                        model_idx_model1_diff_mean_std_err = (
-                            model_idx_model1_diff_std/np.sqrt(nsamples-1)
-                        )
-                        if nsamples >= 80:
-                            ci = 1.960 * model_idx_model1_diff_mean_std_err
-                        elif nsamples >=40 and nsamples < 80:
-                            ci = 2.000 * model_idx_model1_diff_mean_std_err
-                        elif nsamples >= 20 and nsamples < 40:
-                            ci = 2.042 * model_idx_model1_diff_mean_std_err
-                        elif nsamples > 0 and nsamples < 20:
-                            ci = 2.228 * model_idx_model1_diff_mean_std_err
-                    else:
-                        ci = np.nan
-                    threshs_ci_df.loc[model_idx, fcst_var_thresh] = ci
-                    #from scipy import stats
-                    #scipy_ci = stats.t.interval(
-                    #    alpha=0.95,
-                    #    df=len(np.ma.compressed(model_idx_model1_diff))-1,
-                    #    loc=0,
-                    #    scale=stats.sem(np.ma.compressed(model_idx_model1_diff))
-                    #)
+        all_model_df = gda_util.build_thresh_df(
+            self.logger, self.input_dir,
+            self.model_info_dict, self.met_info_dict,
+            self.plot_info_dict['fcst_var_name'],
+            self.plot_info_dict['fcst_var_level'],
+            self.plot_info_dict['fcst_var_threshs'],
+            self.plot_info_dict['obs_var_name'],
+            self.plot_info_dict['obs_var_level'],
+            self.plot_info_dict['obs_var_threshs'],
+            self.plot_info_dict['line_type'],
+            self.plot_info_dict['grid'],
+            self.plot_info_dict['vx_mask'],
+            self.plot_info_dict['interp_method'],
+            self.plot_info_dict['interp_points'],
+            format_valid_dates,
+            self.date_info_dict['forecast_hour']
+        )
+        fcst_units = all_model_df['FCST_UNITS'].values.astype('str').tolist()
+        # Calculate statistic mean and 95% confidence intervals
+        self.logger.info(f"Calculating statstic {self.plot_info_dict['stat']} "
+                         +f"from line type {self.plot_info_dict['line_type']} "
+                         +"average and 95% confidence intervals "
+                         +"for all thresholds")
+        stat_df, threshs_avg_df = gda_util.calculate_grouped_average(
+            self.logger, all_model_df, self.plot_info_dict['line_type'],
+            self.plot_info_dict['stat'],
+            self.plot_info_dict['event_equalization'] == 'YES'
+        )
+        model_idx_list = (
+            all_model_df.index.get_level_values('model').unique().tolist()
+        )
+        threshs_avg_df = threshs_avg_df.unstack('fcst_var_thresh').reindex(
+            index=model_idx_list,
+            columns=self.plot_info_dict['fcst_var_threshs']
+        )
+        threshs_ci_df = gda_util.calculate_model1_diff_ci(stat_df).T.reindex(
+            index=model_idx_list,
+            columns=self.plot_info_dict['fcst_var_threshs']
+        )
         # Set up plot
         self.logger.info(f"Setting up plot")
         plot_specs_ta = PlotSpecs(self.logger, 'threshold_average')
@@ -165,54 +165,32 @@ class TimeSeries:
             plot_dates, format_valid_dates,
             str(self.date_info_dict['forecast_hour'])
         )
-        # Calculate statistic
+        # Calculate statistic and the model averages
         self.logger.info(f"Calculating statstic {self.plot_info_dict['stat']} "
                          +f"from line type {self.plot_info_dict['line_type']}")
         if self.plot_info_dict['stat'] == 'FBAR_OBAR':
-            stat_df, stat_array = gda_util.calculate_stat(
+            stat_df, avg_df = gda_util.calculate_grouped_average(
                 self.logger, all_model_df, self.plot_info_dict['line_type'],
-                'FBAR'
+                'FBAR', self.plot_info_dict['event_equalization'] == 'YES'
             )
-            obar_stat_df, obar_stat_array = gda_util.calculate_stat(
+            obar_stat_df, obar_avg_df = gda_util.calculate_grouped_average(
                 self.logger, all_model_df, self.plot_info_dict['line_type'],
-                'OBAR'
+                'OBAR', self.plot_info_dict['event_equalization'] == 'YES'
+            )
+            obar_npts_df = (
+                obar_stat_df.where(~np.isinf(obar_stat_df)).notna()
+                .groupby(level='model').sum()
             )
         else:
-            stat_df, stat_array = gda_util.calculate_stat(
+            stat_df, avg_df = gda_util.calculate_grouped_average(
                 self.logger, all_model_df, self.plot_info_dict['line_type'],
-                self.plot_info_dict['stat']
-            )
-        if self.plot_info_dict['event_equalization'] == 'YES':
-            self.logger.info("Doing event equalization")
-            masked_stat_array = np.ma.masked_invalid(stat_array)
-            stat_array = np.ma.mask_cols(masked_stat_array)
-            stat_array = stat_array.filled(fill_value=np.nan)
-            model_idx_list = (
-                stat_df.index.get_level_values(0).unique().tolist()
+                self.plot_info_dict['stat'],
+                self.plot_info_dict['event_equalization'] == 'YES'
             )
-            for model_idx in model_idx_list:
-                model_idx_num = model_idx_list.index(model_idx)
-                stat_df.loc[model_idx] = stat_array[model_idx_num,:]
-                all_model_df.loc[model_idx] = (
-                    all_model_df.loc[model_idx].where(
-                        stat_df.loc[model_idx].notna()
-                ).values)
-            if self.plot_info_dict['stat'] == 'FBAR_OBAR':
-                masked_obar_stat_array = np.ma.masked_invalid(obar_stat_array)
-                obar_stat_array = np.ma.mask_cols(masked_obar_stat_array)
-                obar_stat_array = obar_stat_array.filled(fill_value=np.nan)
-                model_idx_list = (
-                   obar_stat_df.index.get_level_values(0).unique().tolist()
-                )
-                for model_idx in model_idx_list:
-                    model_idx_num = model_idx_list.index(model_idx)
-                    obar_stat_df.loc[model_idx] = (
-                        obar_stat_array[model_idx_num,:]
-                    )
-                    all_model_df.loc[model_idx] = (
-                        all_model_df.loc[model_idx].where(
-                            obar_stat_df.loc[model_idx].notna()
-                    ).values)
+        npts_df = (
+            stat_df.where(~np.isinf(stat_df)).notna()
+            .groupby(level='model').sum()
+        )
         # Set up plot
         self.logger.info(f"Setting up plot")
         plot_specs_ts = PlotSpecs(self.logger, 'time_series')
@@ -326,10 +304,7 @@ class TimeSeries:
                     model_plot_settings_dict[model_num]
                 )
             masked_model_num_data = np.ma.masked_invalid(model_num_data)
-            model_num_npts = (
-                len(masked_model_num_data)
-                - np.ma.count_masked(masked_model_num_data)
-            )
+            model_num_npts = npts_df.loc[model_idx]
             masked_plot_dates = np.ma.masked_where(
                 np.ma.getmask(masked_model_num_data), plot_dates
             )
@@ -338,43 +313,14 @@ class TimeSeries:
                 obar_masked_model_num_data = np.ma.masked_invalid(
                     obar_model_num_data
                 )
-                obar_model_num_npts = (
-                    len(obar_masked_model_num_data)
-                    - np.ma.count_masked(obar_masked_model_num_data)
-                )
+                obar_model_num_npts = obar_npts_df.loc[model_idx]
                 obar_masked_plot_dates = np.ma.masked_where(
                     np.ma.getmask(obar_masked_model_num_data), plot_dates
                 )
             if model_num_npts != 0:
-                if self.plot_info_dict['line_type'] in ['CNT', 'GRAD',
-                                                        'CTS', 'NBRCTS',
-                                                        'NBRCNT', 'VCNT']:
-                    avg_method = 'mean'
-                    calc_avg_df = model_num_data
-                    if self.plot_info_dict['stat'] == 'FBAR_OBAR':
-                        obar_calc_avg_df = obar_model_num_data
-                else:
-                    avg_method = 'aggregation'
-                    calc_avg_df = all_model_df.loc[model_idx]
-                    if self.plot_info_dict['stat'] == 'FBAR_OBAR':
-                        obar_calc_avg_df = all_model_df.loc[model_idx]
+                model_num_avg = avg_df.loc[model_idx]
                 if self.plot_info_dict['stat'] == 'FBAR_OBAR':
-                    model_num_avg = gda_util.calculate_average(
-                        self.logger, avg_method,
-                        self.plot_info_dict['line_type'],
-                        'FBAR', calc_avg_df
-                    )
-                    obar_model_num_avg = gda_util.calculate_average(
-                        self.logger, avg_method,
-                        self.plot_info_dict['line_type'],
-                        'OBAR', obar_calc_avg_df
-                    )
-                else:
-                    model_num_avg = gda_util.calculate_average(
-                        self.logger, avg_method,
-                        self.plot_info_dict['line_type'],
-                        self.plot_info_dict['stat'], calc_avg_df
-                    )
+                    obar_model_num_avg = obar_avg_df.loc[model_idx]
                 if np.abs(model_num_avg) >= 10:
                     model_num_avg_label = format(round(model_num_avg, 2),
                                                  '.2f')
@@ -104,14 +104,197 @@ def get_logger(log_file):
     logger.info(logger_info)
     return logger
 
+def get_partial_sum_file_name(line_type, var_name, var_level, var_thresh,
+                              vx_mask, interp_method, interp_points, vhr,
+                              month_dt):
+    """! Get the name of a model's daily partial sums file for a month
+         Args:
+             line_type     - value in MET column LINE_TYPE (string)
+             var_name      - value in MET column FCST/OBS_VAR (string)
+             var_level     - value in MET column FCST/OBS_LEVS (string)
+             var_thresh    - threshold with letters (string)
+             vx_mask       - value in MET column VX_MASK (string)
+             interp_method - value in MET column INTERP_MTHD (string)
+             interp_points - value in MET column INTERP_PNTS (string)
+             vhr           - valid hour (string)
+             month_dt      - month (datetime obj)
+         Returns:
+             partial_sum_file_name - name of partial sums file (string)
+    """
+    partial_sum_file_name = (
+        'partialsums_'+line_type+'_'+var_name+'_'+var_level+'_'
+        +var_thresh.replace('.','p')+'_'+vx_mask+'_'
+        +interp_method+interp_points+'_valid'+vhr+'Z_'
+        +month_dt.strftime('%Y%m')+'.txt'
+    )
+    return partial_sum_file_name
+
+def read_partial_sum_file(partial_sum_file):
+    """! Read a model's daily partial sums file
+         Args:
+             partial_sum_file - full path to partial sums file (string)
+         Returns:
+             partial_sum_df - dataframe of the daily partial sums
+                              indexed on FCST_LEAD and
+                              FCST_VALID_BEG (floats)
+    """
+    partial_sum_df = pd.read_csv(
+        partial_sum_file, sep=' ', na_values=['NA'], keep_default_na=False,
+        dtype={'FCST_LEAD': str, 'FCST_VALID_BEG': str}
+    ).set_index(['FCST_LEAD', 'FCST_VALID_BEG'])
+    return partial_sum_df.astype(np.float64)
+
+def get_model_partial_sum_df(logger, time_range, model_dict, met_info_dict,
+                             daily_stats_dir, condensed_dir,
+                             partial_sum_dir_list, var_name, var_level,
+                             var_thresh, line_type, grid, vx_mask,
+                             interp_method, interp_points,
+                             start_date_dt, end_date_dt, vhr):
+    """! Get a model's daily partial sums (or counts) of every forecast
+         lead for a time range. Yearly partial sums are put together
+         from the monthly partial sums files when all months have one,
+         otherwise the partial sums are taken from the condensed daily
+         stat files in one pass. Monthly partial sums with data are
+         written to a file for later use.
+         Args:
+             logger               - logger object
+             time_range           - either monthly or yearly (string)
+             model_dict           - dictionary of model information
+                                    (strings)
+             met_info_dict        - dicitionary of MET information
+                                    (strings)
+             daily_stats_dir      - full path to the daily stat files
+                                    directory (string)
+             condensed_dir        - full path to the condensed stat files
+                                    directory (string)
+             partial_sum_dir_list - full paths to the directories with
+                                    monthly partial sums files, the first
+                                    one is written to (strings)
+             var_name             - value in MET column FCST/OBS_VAR
+                                    (string)
+             var_level            - value in MET column FCST/OBS_LEVS
+                                    (string)
+             var_thresh           - threshold with letters (string)
+             line_type            - value in MET column LINE_TYPE
+                                    (string)
+             grid                 - value in MET column DESC (string)
+             vx_mask              - value in MET column VX_MASK (string)
+             interp_method        - value in MET column INTERP_MTHD
+                                    (string)
+             interp_points        - value in MET column INTERP_PNTS
+                                    (string)
+             start_date_dt        - time range's start date (datetime)
+             end_date_dt          - time range's end date (datetime)
+             vhr                  - valid hour (string)
+         Returns:
+             partial_sum_df - dataframe of the daily partial sums
+                              indexed on FCST_LEAD and
+                              FCST_VALID_BEG (floats)
+    """
+    model = model_dict['name']
+    month_dt_list = pd.date_range(
+        start_date_dt.replace(day=1), end_date_dt, freq='MS'
+    ).to_pydatetime()
+    partial_sum_file_list = []
+    for month_dt in month_dt_list:
+        partial_sum_file_name = get_partial_sum_file_name(
+            line_type, var_name, var_level, var_thresh, vx_mask,
+            interp_method, interp_points, vhr, month_dt
+        )
+        for partial_sum_dir in partial_sum_dir_list:
+            partial_sum_file = os.path.join(
+                partial_sum_dir, partial_sum_file_name
+            )
+            if os.path.exists(partial_sum_file):
+                partial_sum_file_list.append(partial_sum_file)
+                break
+    if time_range == 'yearly' \
+            and len(partial_sum_file_list) == len(month_dt_list):
+        logger.info(f"Reading {model} monthly partial sums files: "
+                    +f"{', '.join(partial_sum_file_list)}")
+        return pd.concat(
+            [read_partial_sum_file(partial_sum_file)
+             for partial_sum_file in partial_sum_file_list]
+        )
+    gda_util.condense_model_stat_files(
+        logger, daily_stats_dir, condensed_dir, model,
+        model_dict['obs_name'], vx_mask, var_name, var_level,
+        var_name, var_level, line_type
+    )
+    condensed_model_file = os.path.join(
+        condensed_dir, 'condensed_stats_'+model.lower()+'_'
+        +line_type.lower()+'_'+var_name.lower()+'_'
+        +var_level.lower().replace('.','p').replace('-', '_')+'_'
+        +vx_mask.lower()+'.stat'
+    )
+    col_list = gda_util.get_met_line_type_cols(
+        logger, met_info_dict['root'], met_info_dict['version'], line_type
+    )
+    stat_col_list = col_list[col_list.index('TOTAL'):]
+    if os.path.exists(condensed_model_file):
+        condensed_df, lead_thresh_idx_dict = gda_util.get_condensed_stat_df(
+            logger, condensed_model_file, col_list
+        )
+        if var_thresh != 'NA':
+            var_thresh_symbol = gda_util.format_thresh(var_thresh)[0]
+        else:
+            var_thresh_symbol = var_thresh
+        filter_mask = (
+            (condensed_df['FCST_VALID_BEG']
+             >= start_date_dt.strftime('%Y%m%d_000000'))
+            & (condensed_df['FCST_VALID_BEG']
+               <= end_date_dt.strftime('%Y%m%d_235959'))
+            & condensed_df['FCST_VALID_BEG'].str.endswith('_'+vhr+'0000')
+        )
+        filter_dict = {'MODEL': model, 'DESC': grid,
+                       'FCST_VAR': var_name, 'FCST_LEV': var_level,
+                       'OBS_VAR': var_name, 'OBS_LEV': var_level,
+                       'OBTYPE': model_dict['obs_name'],
+                       'VX_MASK': vx_mask, 'INTERP_MTHD': interp_method,
+                       'INTERP_PNTS': interp_points,
+                       'FCST_THRESH': var_thresh_symbol,
+                       'OBS_THRESH': var_thresh_symbol,
+                       'LINE_TYPE': line_type}
+        for filter_col, filter_val in filter_dict.items():
+            filter_mask = filter_mask & (condensed_df[filter_col] == filter_val)
+        # Use the first line for valid dates with multiple lines
+        partial_sum_df = condensed_df.loc[
+            filter_mask, ['FCST_LEAD', 'FCST_VALID_BEG']+stat_col_list
+        ].drop_duplicates(subset=['FCST_LEAD', 'FCST_VALID_BEG'],
+                          keep='first')
+        partial_sum_df = partial_sum_df.set_index(
+            ['FCST_LEAD', 'FCST_VALID_BEG']
+        ).replace('NA', np.nan).astype(np.float64)
+    else:
+        logger.debug(f"{condensed_model_file} does not exist")
+        partial_sum_df = pd.DataFrame(
+            columns=stat_col_list, dtype=np.float64,
+            index=pd.MultiIndex.from_tuples(
+                [], names=['FCST_LEAD', 'FCST_VALID_BEG']
+            )
+        )
+    # A month without data is not written so a later yearly run
+    # condenses it again from the daily stats
+    if time_range == 'monthly' and partial_sum_df.empty:
+        logger.debug(f"No {model} partial sums, not writing monthly "
+                     +"partial sums file")
+    elif time_range == 'monthly':
+        gda_util.make_dir(partial_sum_dir_list[0])
+        partial_sum_file = os.path.join(
+            partial_sum_dir_list[0],
+            get_partial_sum_file_name(
+                line_type, var_name, var_level, var_thresh, vx_mask,
+                interp_method, interp_points, vhr, start_date_dt
+            )
+        )
+        logger.info(f"Writing {model} partial sums to {partial_sum_file}")
+        partial_sum_df.to_csv(partial_sum_file, sep=' ', na_rep='NA')
+    return partial_sum_df
+
 def create_avg_time_range_stat_df(logger, time_range, model_info_dict,
-                                  met_info_dict, file_header_list,
-                                  input_dir, output_dir,
-                                  var_name, var_level, var_thresh,
-                                  line_type, stat, grid, vx_mask,
-                                  interp_method, interp_points,
-                                  start_date_dt, end_date_dt,
-                                  vhr):
+                                  file_header_list, partial_sum_df_dict,
+                                  line_type, stat, start_date_dt,
+                                  end_date_dt, vhr):
     """! Create dataframe with each forecast day's average
          for all models
          Args:
@@ -119,32 +302,14 @@ def create_avg_time_range_stat_df(logger, time_range, model_info_dict,
              time_range          - either monthly or yearly (string)
              model_info_dict     - dictionary of model information
                                    (strings)
-             model_list          - list of model information (strings)
-             met_info_dict       - dicitionary of MET information
-                                   (strings)
              file_header_list    - list of output file header
                                    (strings)
-             input_dir           - full path to input directory
-                                   (string)
-             output_dir          - full path to output directory
-                                   (string)
-             var_name            - value in MET column FCST/OBS_VAR
-                                   (string)
-             var_level           - value in MET column FCST/OBS_LEVS
-                                   (string)
-             var_thresh          - value in MET column FCST/OBS_THRESH
-                                   (string)
+             partial_sum_df_dict - dictionary of each model's daily
+                                   partial sums dataframe, from
+                                   get_model_partial_sum_df
              line_type           - value in MET column LINE_TYPE
                                    (string)
              stat                - statistic name (string)
-             grid                - value in MET column DESC
-                                   (string)
-             vx_mask             - value in MET column VX_MASK
-                                   (string)
-             interp_method       - value in MET column INTERP_MTHD
-                                   (string)
-             interp_points       - value in MET column INTERP_PNTS
-                                   (string)
              start_date_dt       - time range's start date (datetime)
              end_date_dt         - time range's end date (datetime)
              vhr                 - valid hour (string)
@@ -184,19 +349,28 @@ def create_avg_time_range_stat_df(logger, time_range, model_info_dict,
         )
         format_valid_dates = [valid_dates[d].strftime('%Y%m%d_%H%M%S') \
                               for d in range(len(valid_dates))]
-        format_init_dates = [init_dates[d].strftime('%Y%m%d_%H%M%S') \
-                             for d in range(len(init_dates))]
         nvalues_time_range_min = round(0.75 * len(valid_dates))
-        all_model_df = gda_util.build_df(
-            'make_plots', logger, input_dir, output_dir,
-            model_info_dict, met_info_dict,
-            var_name, var_level, var_thresh,
-            var_name, var_level, var_thresh,
-            line_type, grid, vx_mask,
-            interp_method, interp_points,
-            'VALID', valid_dates, format_valid_dates,
-            str(forecast_hour)
-        )
+        forecast_lead = str(forecast_hour).zfill(2)+'0000'
+        model_num_df_list = []
+        for model_num, model in zip(list(model_info_dict.keys()),
+                                    model_list):
+            partial_sum_df = partial_sum_df_dict[model_num]
+            if forecast_lead in \
+                    partial_sum_df.index.get_level_values('FCST_LEAD'):
+                model_num_df = partial_sum_df.xs(
+                    forecast_lead, level='FCST_LEAD'
+                ).reindex(format_valid_dates)
+            else:
+                model_num_df = pd.DataFrame(
+                    np.nan, index=format_valid_dates,
+                    columns=partial_sum_df.columns
+                )
+            model_num_df.index = pd.MultiIndex.from_product(
+                [[model], format_valid_dates],
+                names=['model', 'valid_dates']
+            )
+            model_num_df_list.append(model_num_df)
+        all_model_df = pd.concat(model_num_df_list)
         stat_df, stat_array = gda_util.calculate_stat(
             logger, all_model_df, line_type, stat
         )
@@ -405,10 +579,14 @@ for avg_time_range in avg_time_range_list:
                             stat_model_dir, 'grid2grid',
                             avg_time_range_start_date_dt,
                             avg_time_range_end_date_dt)
-    # Calculate time range averages
+    # Calculate time range averages, the partial sums only depend on
+    # the line type so they are kept for every stat of a line type
+    line_type_partial_sum_dict = {}
     for line_type_stat in list(g2g_stats_var_dict.keys()):
         line_type = line_type_stat.split('/')[0]
         stat = line_type_stat.split('/')[1]
+        if line_type not in line_type_partial_sum_dict:
+            line_type_partial_sum_dict = {line_type: {}}
         for loop1_info in list(
             itertools.product(list(g2g_stats_var_dict[line_type_stat].keys()),
                               g2g_vx_mask_list)
@@ -429,17 +607,6 @@ for avg_time_range in avg_time_range_list:
                 line_type+'_'+stat+'_'+var_name+'_'+vx_mask
             )
             gda_util.make_dir(stat_var_dir)
-            for model_num in list(g2g_model_info_dict.keys()):
-                model = g2g_model_info_dict[model_num]['name']
-                obs_name = g2g_model_info_dict[model_num]['obs_name']
-                plot_name = g2g_model_info_dict[model_num]['plot_name']
-                logger.debug("Condensing model .stat files for job")
-                for var_level in g2g_stats_var_dict[line_type_stat][var_name]:
-                    gda_util.condense_model_stat_files(
-                        logger, avg_time_range_daily_g2g_stats_dir,
-                        stat_var_dir, model, obs_name, vx_mask,
-                        var_name, var_level, var_name, var_level, line_type
-                    )
             for loop2_info in list(
                     itertools.product(g2g_valid_hour_list,
                                       g2g_stats_var_dict[line_type_stat]\
@@ -449,12 +616,40 @@ for avg_time_range in avg_time_range_list:
                 var_level = loop2_info[1]
                 logger.info(f"Working on valid hour {valid_hour} "
                             +f"level {var_level}")
+                partial_sum_key = (var_name, var_level, vx_mask, valid_hour)
+                if partial_sum_key not in \
+                        line_type_partial_sum_dict[line_type]:
+                    partial_sum_df_dict = {}
+                    for model_num in list(g2g_model_info_dict.keys()):
+                        model = g2g_model_info_dict[model_num]['name']
+                        partial_sum_df_dict[model_num] = (
+                            get_model_partial_sum_df(
+                                logger, avg_time_range,
+                                g2g_model_info_dict[model_num],
+                                met_info_dict,
+                                avg_time_range_daily_g2g_stats_dir,
+                                stat_var_dir,
+                                [os.path.join(DATA, 'monthly', 'grid2grid',
+                                              'daily_partial_sums', model),
+                                 os.path.join(COMIN, 'stats', COMPONENT,
+                                              'long_term',
+                                              'daily_partial_sums', model)],
+                                var_name, var_level, 'NA', line_type,
+                                g2g_grid, vx_mask, 'NEAREST', '1',
+                                avg_time_range_start_date_dt,
+                                avg_time_range_end_date_dt, valid_hour
+                            )
+                        )
+                    line_type_partial_sum_dict[line_type][partial_sum_key] = (
+                        partial_sum_df_dict
+                    )
+                partial_sum_df_dict = (
+                    line_type_partial_sum_dict[line_type][partial_sum_key]
+                )
                 avg_time_range_stat_df = create_avg_time_range_stat_df(
                     logger, avg_time_range, g2g_model_info_dict,
-                    met_info_dict, g2g_file_header_list, stat_var_dir,
-                    stat_var_dir, var_name, var_level, 'NA', line_type, stat,
-                    g2g_grid, vx_mask, 'NEAREST', '1',
-                    avg_time_range_start_date_dt,
+                    g2g_file_header_list, partial_sum_df_dict, line_type,
+                    stat, avg_time_range_start_date_dt,
                     avg_time_range_end_date_dt, valid_hour
                 )
                 for model_num in list(g2g_model_info_dict.keys()):
@@ -595,12 +790,16 @@ for avg_time_range in avg_time_range_list:
                             stat_model_dir, 'grid2grid',
                             avg_time_range_start_date_dt,
                             avg_time_range_end_date_dt)
-    # Calculate time range averages
+    # Calculate time range averages, the partial sums only depend on
+    # the line type so they are kept for every stat of a line type
+    line_type_partial_sum_dict = {}
     for line_type_stat_grid_nbrhd in list(precip_stats_var_dict.keys()):
         line_type = line_type_stat_grid_nbrhd.split('/')[0]
         stat = line_type_stat_grid_nbrhd.split('/')[1]
         grid = line_type_stat_grid_nbrhd.split('/')[2]
         nbrhd = line_type_stat_grid_nbrhd.split('/')[3]
+        if line_type not in line_type_partial_sum_dict:
+            line_type_partial_sum_dict = {line_type: {}}
         for loop1_info in list(
             itertools.product(
                 list(precip_stats_var_dict[line_type_stat_grid_nbrhd].keys()),
@@ -623,14 +822,6 @@ for avg_time_range in avg_time_range_list:
                 +accum+'_'+vx_mask
             )
             gda_util.make_dir(stat_var_dir)
-            for model_num in list(precip_model_info_dict.keys()):
-                model = precip_model_info_dict[model_num]['name']
-                logger.debug("Condensing model .stat files for job")
-                gda_util.condense_model_stat_files(
-                    logger, avg_time_range_daily_precip_stats_dir,
-                    stat_var_dir, model, obs_name, vx_mask,
-                    var_name, 'A24', var_name, 'A24', line_type
-                )
             for loop2_info in list(
                 itertools.product(precip_valid_hour_list,
                                   precip_stats_var_dict\
@@ -650,14 +841,43 @@ for avg_time_range in avg_time_range_list:
                     interp_method = 'NBRHD_SQUARE'
                 else:
                     interp_method = 'NEAREST'
+                partial_sum_key = (var_name, accum, var_thresh_mm, grid,
+                                   vx_mask, interp_method, nbrhd, valid_hour)
+                if partial_sum_key not in \
+                        line_type_partial_sum_dict[line_type]:
+                    partial_sum_df_dict = {}
+                    for model_num in list(precip_model_info_dict.keys()):
+                        model = precip_model_info_dict[model_num]['name']
+                        partial_sum_df_dict[model_num] = (
+                            get_model_partial_sum_df(
+                                logger, avg_time_range,
+                                precip_model_info_dict[model_num],
+                                met_info_dict,
+                                avg_time_range_daily_precip_stats_dir,
+                                stat_var_dir,
+                                [os.path.join(DATA, 'monthly', 'grid2grid',
+                                              'daily_partial_sums', model),
+                                 os.path.join(COMIN, 'stats', COMPONENT,
+                                              'long_term',
+                                              'daily_partial_sums', model)],
+                                var_name, accum,
+                                'ge'+var_thresh_mm.replace('mm', ''),
+                                line_type, grid, vx_mask, interp_method,
+                                nbrhd, avg_time_range_start_date_dt,
+                                avg_time_range_end_date_dt, valid_hour
+                            )
+                        )
+                    line_type_partial_sum_dict[line_type][partial_sum_key] = (
+                        partial_sum_df_dict
+                    )
+                partial_sum_df_dict = (
+                    line_type_partial_sum_dict[line_type][partial_sum_key]
+                )
                 avg_time_range_stat_df = create_avg_time_range_stat_df(
                     logger, avg_time_range, precip_model_info_dict,
-                    met_info_dict, precip_file_header_list,
-                    stat_var_dir, stat_var_dir, var_name, accum,
-                    'ge'+var_thresh_mm.replace('mm', ''), line_type, stat,
-                    grid, vx_mask, interp_method, nbrhd,
-                    avg_time_range_start_date_dt, avg_time_range_end_date_dt,
-                    valid_hour
+                    precip_file_header_list, partial_sum_df_dict, line_type,
+                    stat, avg_time_range_start_date_dt,
+                    avg_time_range_end_date_dt, valid_hour
                 )
                 for model_num in list(precip_model_info_dict.keys()):
                     model = precip_model_info_dict[model_num]['name']
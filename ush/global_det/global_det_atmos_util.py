@@ -6,6 +6,7 @@ Abstract: This contains many functions used across global_det atmos.
 '''
 
 import os
+import re
 import datetime
 import numpy as np
 import subprocess
@@ -16,7 +17,12 @@ import glob
 import pandas as pd
 import logging
 import copy
+import importlib.util
+import collections
+import tarfile
+import time
 from time import sleep
+from concurrent.futures import ThreadPoolExecutor
 
 def run_shell_command(command):
     """! Run shell command
@@ -126,6 +132,133 @@ def check_file_exists_size(file_name):
         file_good = False
     return file_good
 
+# Entries of the directories scanned for expected files and the
+# directory modification time they were listed at, keyed on directory
+# path, so each directory is listed again only when it changes
+_DIR_AVAILABILITY_CACHE = {}
+# Expected files found missing, for report_missing_files
+_MISSING_FILE_SET = set()
+
+def get_dir_availability(dir_path):
+    """! Get the entries of a directory, listing it again only
+         when its modification time has changed since it was
+         last listed
+
+         Args:
+             dir_path - directory path (string)
+
+         Returns:
+             dir_entry_dict - directory entries keyed on
+                              name (dictionary)
+    """
+    try:
+        dir_mtime = os.stat(dir_path).st_mtime_ns
+    except OSError:
+        dir_mtime = None
+    if dir_path in _DIR_AVAILABILITY_CACHE \
+            and _DIR_AVAILABILITY_CACHE[dir_path][0] == dir_mtime:
+        return _DIR_AVAILABILITY_CACHE[dir_path][1]
+    list_time = time.time_ns()
+    dir_entry_dict = {}
+    try:
+        with os.scandir(dir_path) as dir_entries:
+            for dir_entry in dir_entries:
+                dir_entry_dict[dir_entry.name] = dir_entry
+    except OSError:
+        pass
+    # A directory changed within a second of being listed can change
+    # again without a new modification time, so it is not kept
+    if dir_mtime is not None and list_time - dir_mtime < 1000000000:
+        _DIR_AVAILABILITY_CACHE.pop(dir_path, None)
+    else:
+        _DIR_AVAILABILITY_CACHE[dir_path] = (dir_mtime, dir_entry_dict)
+    return dir_entry_dict
+
+def forget_dir_availability(file_name):
+    """! Drop the cached entries of the directory a file is in,
+         for when the file is written after the directory was listed
+
+         Args:
+             file_name - file path (string)
+    """
+    _DIR_AVAILABILITY_CACHE.pop(
+        os.path.dirname(os.path.normpath(file_name)), None
+    )
+
+def get_file_availability(file_list, report_missing=True):
+    """! Resolve which of a list of files exist with one listing
+         per directory instead of a stat per file
+
+         Args:
+             file_list      - file paths (list of strings)
+             report_missing - add missing files to the missing
+                              file report (boolean)
+
+         Returns:
+             file_availability_dict - directory entry of each file,
+                                      holding its size and
+                                      modification time, None if
+                                      the file does not
+                                      exist (dictionary)
+    """
+    file_availability_dict = {}
+    dir_entry_dict_dict = {}
+    for file_name in file_list:
+        if file_name in file_availability_dict:
+            continue
+        dir_path, base_name = os.path.split(os.path.normpath(file_name))
+        if dir_path not in dir_entry_dict_dict:
+            dir_entry_dict_dict[dir_path] = get_dir_availability(dir_path)
+        dir_entry = dir_entry_dict_dict[dir_path].get(base_name)
+        if dir_entry is not None and dir_entry.is_symlink():
+            # Broken links do not exist, as in os.path.exists
+            try:
+                dir_entry.stat()
+            except OSError:
+                dir_entry = None
+        if dir_entry is None and report_missing:
+            _MISSING_FILE_SET.add(file_name)
+        file_availability_dict[file_name] = dir_entry
+    return file_availability_dict
+
+def check_file_available(file_name, report_missing=True):
+    """! Checks to see if file exists using the cached
+         directory listings
+
+         Args:
+             file_name      - file path (string)
+             report_missing - add file to the missing
+                              file report if it does not
+                              exist (boolean)
+
+         Returns:
+             file_available - if file exists or not (boolean)
+    """
+    file_available = get_file_availability(
+        [file_name], report_missing=report_missing
+    )[file_name] is not None
+    return file_available
+
+def report_missing_files(max_files_per_dir=5):
+    """! Print a compact report of the expected files found
+         missing, grouped by directory, and reset it
+
+         Args:
+             max_files_per_dir - number of file names to list
+                                 per directory (integer)
+    """
+    missing_file_dict = {}
+    for missing_file in sorted(_MISSING_FILE_SET):
+        dir_path, base_name = os.path.split(os.path.normpath(missing_file))
+        missing_file_dict.setdefault(dir_path, []).append(base_name)
+    for dir_path, base_name_list in missing_file_dict.items():
+        missing_file_names = ', '.join(base_name_list[:max_files_per_dir])
+        if len(base_name_list) > max_files_per_dir:
+            missing_file_names+=', ...'
+        print(f"NOTE: {len(base_name_list)} expected file(s) missing in "
+              +f"{dir_path}: {missing_file_names}")
+    _MISSING_FILE_SET.clear()
+
 def log_missing_file_model(log_missing_file, missing_file, model, init_dt,
                            fhr):
     """! This writes a missing model file to a log
@@ -193,6 +326,7 @@ def copy_file(source_file, dest_file):
     if check_file_exists_size(source_file):
         print("Copying "+source_file+" to "+dest_file)
         shutil.copy(source_file, dest_file)
+        forget_dir_availability(dest_file)
 
 def convert_grib1_grib2(grib1_file, grib2_file):
     """! Converts GRIB1 data to GRIB2
@@ -416,6 +550,67 @@ def get_valid_hour(init_hour, forecast_hour):
     return valid_hour
 
 
+# Parsed file formats reused by format_filler
+_FORMAT_FILLER_TAG_RE = re.compile(r'\{(\w+)\?fmt=([^}?]*)(\?shift=[^}]*)?\}')
+_FORMAT_FILLER_CACHE = {}
+
+def compile_format_filler(unfilled_file_format):
+    """! Parse a file format once into the literal text and
+         {option?fmt=...} chunks of each directory level
+
+         Args:
+             unfilled_file_format - file naming convention (string)
+         Returns:
+             compiled_file_format - for each directory level, list of
+                                    literal text (string) and
+                                    (option, format, shift, tag)
+                                    tuples (list)
+    """
+    if unfilled_file_format not in _FORMAT_FILLER_CACHE:
+        compiled_file_format = []
+        for file_format_chunk in unfilled_file_format.split('/'):
+            chunk_parts = []
+            chunk_pos = 0
+            for tag_match in _FORMAT_FILLER_TAG_RE.finditer(file_format_chunk):
+                chunk_parts.append(
+                    file_format_chunk[chunk_pos:tag_match.start()]
+                )
+                if tag_match.group(3) is None:
+                    shift = ''
+                else:
+                    shift = tag_match.group(3).partition('shift=')[2]
+                chunk_parts.append(
+                    (tag_match.group(1), tag_match.group(2), shift,
+                     tag_match.group(0))
+                )
+                chunk_pos = tag_match.end()
+            chunk_parts.append(file_format_chunk[chunk_pos:])
+            compiled_file_format.append(chunk_parts)
+        _FORMAT_FILLER_CACHE[unfilled_file_format] = compiled_file_format
+    return _FORMAT_FILLER_CACHE[unfilled_file_format]
+
+def format_lead(forecast_hour, lead_fmt):
+    """! Format a forecast hour like the {lead?fmt=...} option
+
+         Args:
+             forecast_hour - forecast hour (string)
+             lead_fmt      - format, %1H, %2H, or %3H (string)
+         Returns:
+             formatted_forecast_hour - formatted forecast hour (string)
+    """
+    if lead_fmt == '%1H':
+        if int(forecast_hour) < 10:
+            formatted_forecast_hour = forecast_hour[1]
+        else:
+            formatted_forecast_hour = forecast_hour
+    elif lead_fmt == '%2H':
+        formatted_forecast_hour = forecast_hour.zfill(2)
+    elif lead_fmt == '%3H':
+        formatted_forecast_hour = forecast_hour.zfill(3)
+    else:
+        formatted_forecast_hour = forecast_hour
+    return formatted_forecast_hour
+
 def format_filler(unfilled_file_format, valid_time_dt, init_time_dt,
                   forecast_hour, str_sub_dict):
     """! Creates a filled file path from a format
@@ -431,125 +626,36 @@ def format_filler(unfilled_file_format, valid_time_dt, init_time_dt,
                                   time information (string)
     """
     filled_file_format = '/'
-    format_opt_list = ['lead', 'lead_shift', 'valid', 'valid_shift',
-                       'init', 'init_shift']
-    if len(list(str_sub_dict.keys())) != 0:
-        format_opt_list = format_opt_list+list(str_sub_dict.keys())
-    for filled_file_format_chunk in unfilled_file_format.split('/'):
-        for format_opt in format_opt_list:
-            nformat_opt = (
-                filled_file_format_chunk.count('{'+format_opt+'?fmt=')
-            )
-            if nformat_opt > 0:
-               format_opt_count = 1
-               while format_opt_count <= nformat_opt:
-                   if format_opt in ['lead_shift', 'valid_shift',
-                                     'init_shift']:
-                       shift = (
-                           filled_file_format_chunk \
-                           .partition('{'+format_opt+'?fmt=')[2] \
-                           .partition('}')[0].partition('shift=')[2]
-                       )
-                       format_opt_count_fmt = (
-                           filled_file_format_chunk \
-                           .partition('{'+format_opt+'?fmt=')[2] \
-                           .partition('}')[0].partition('?')[0]
-                       )
-                   else:
-                       format_opt_count_fmt = (
-                           filled_file_format_chunk \
-                           .partition('{'+format_opt+'?fmt=')[2] \
-                           .partition('}')[0]
-                       )
-                   if format_opt == 'valid':
-                       replace_format_opt_count = valid_time_dt.strftime(
-                           format_opt_count_fmt
-                       )
-                   elif format_opt == 'lead':
-                       if format_opt_count_fmt == '%1H':
-                           if int(forecast_hour) < 10:
-                               replace_format_opt_count = forecast_hour[1]
-                           else:
-                               replace_format_opt_count = forecast_hour
-                       elif format_opt_count_fmt == '%2H':
-                           replace_format_opt_count = forecast_hour.zfill(2)
-                       elif format_opt_count_fmt == '%3H':
-                           replace_format_opt_count = forecast_hour.zfill(3)
-                       else:
-                           replace_format_opt_count = forecast_hour
-                   elif format_opt == 'init':
-                       replace_format_opt_count = init_time_dt.strftime(
-                           format_opt_count_fmt
-                       )
-                   elif format_opt == 'lead_shift':
-                       shift = (
-                           filled_file_format_chunk \
-                           .partition('{'+format_opt+'?fmt=')[2] \
-                           .partition('}')[0].partition('shift=')[2]
-                       )
-                       forecast_hour_shift = str(int(forecast_hour)
-                                                 + int(shift))
-                       if format_opt_count_fmt == '%1H':
-                           if int(forecast_hour_shift) < 10:
-                               replace_format_opt_count = (
-                                   forecast_hour_shift[1]
-                               )
-                           else:
-                               replace_format_opt_count = forecast_hour_shift
-                       elif format_opt_count_fmt == '%2H':
-                           replace_format_opt_count = (
-                               forecast_hour_shift.zfill(2)
-                           )
-                       elif format_opt_count_fmt == '%3H':
-                           replace_format_opt_count = (
-                               forecast_hour_shift.zfill(3)
-                           )
-                       else:
-                           replace_format_opt_count = forecast_hour_shift
-                   elif format_opt == 'init_shift':
-                       shift = (
-                           filled_file_format_chunk \
-                           .partition('{'+format_opt+'?fmt=')[2] \
-                           .partition('}')[0].partition('shift=')[2]
-                       )
-                       init_shift_time_dt = (
-                           init_time_dt + datetime.timedelta(hours=int(shift))
-                       )
-                       replace_format_opt_count = init_shift_time_dt.strftime(
-                           format_opt_count_fmt
-                       )
-                   elif format_opt == 'valid_shift':
-                       shift = (
-                           filled_file_format_chunk \
-                           .partition('{'+format_opt+'?fmt=')[2] \
-                           .partition('}')[0].partition('shift=')[2]
-                       )
-                       valid_shift_time_dt = (
-                           valid_time_dt + datetime.timedelta(hours=int(shift))
-                       )
-                       replace_format_opt_count = valid_shift_time_dt.strftime(
-                           format_opt_count_fmt
-                       )
-                   else:
-                       replace_format_opt_count = str_sub_dict[format_opt]
-                   if format_opt in ['lead_shift', 'valid_shift', 'init_shift']:
-                       filled_file_format_chunk = (
-                           filled_file_format_chunk.replace(
-                               '{'+format_opt+'?fmt='
-                               +format_opt_count_fmt
-                               +'?shift='+shift+'}',
-                               replace_format_opt_count
-                           )
-                       )
-                   else:
-                       filled_file_format_chunk = (
-                           filled_file_format_chunk.replace(
-                               '{'+format_opt+'?fmt='
-                               +format_opt_count_fmt+'}',
-                               replace_format_opt_count
-                           )
-                       )
-                   format_opt_count+=1
+    for chunk_parts in compile_format_filler(unfilled_file_format):
+        filled_file_format_chunk = ''
+        for chunk_part in chunk_parts:
+            if isinstance(chunk_part, str):
+                filled_file_format_chunk+=chunk_part
+                continue
+            format_opt, format_opt_fmt, shift, tag = chunk_part
+            if format_opt == 'valid':
+                chunk_part = valid_time_dt.strftime(format_opt_fmt)
+            elif format_opt == 'lead':
+                chunk_part = format_lead(forecast_hour, format_opt_fmt)
+            elif format_opt == 'init':
+                chunk_part = init_time_dt.strftime(format_opt_fmt)
+            elif format_opt == 'lead_shift':
+                chunk_part = format_lead(
+                    str(int(forecast_hour) + int(shift)), format_opt_fmt
+                )
+            elif format_opt == 'init_shift':
+                chunk_part = (
+                    init_time_dt + datetime.timedelta(hours=int(shift))
+                ).strftime(format_opt_fmt)
+            elif format_opt == 'valid_shift':
+                chunk_part = (
+                    valid_time_dt + datetime.timedelta(hours=int(shift))
+                ).strftime(format_opt_fmt)
+            elif format_opt in list(str_sub_dict.keys()):
+                chunk_part = str_sub_dict[format_opt]
+            else:
+                chunk_part = tag
+            filled_file_format_chunk+=chunk_part
         filled_file_format = os.path.join(filled_file_format,
                                           filled_file_format_chunk)
     return filled_file_format
@@ -2034,18 +2140,55 @@ def check_model_files(job_dict):
                 'init_date': init_date_dt,
                 'forecast_hour': str(fhr)
             }
+    # Expand all expected files and get their availability up front
+    for fhr_key in list(fhr_check_input_dict.keys()):
+        for fhr_fileN_key in list(fhr_check_input_dict[fhr_key].keys()):
+            fhr_check_input_dict[fhr_key][fhr_fileN_key]['file'] = (
+                format_filler(
+                    input_file_format,
+                    fhr_check_input_dict[fhr_key][fhr_fileN_key]\
+                    ['valid_date'],
+                    fhr_check_input_dict[fhr_key][fhr_fileN_key]\
+                    ['init_date'],
+                    fhr_check_input_dict[fhr_key][fhr_fileN_key]\
+                    ['forecast_hour'],
+                    {}
+                )
+            )
+    for fhr_key in list(fhr_check_output_dict.keys()):
+        for fhr_fileN_key in list(fhr_check_output_dict[fhr_key].keys()):
+            for output_file_role, output_file_format in \
+                    [('DATA_file', output_DATA_file_format),
+                     ('COMOUT_file', output_COMOUT_file_format)]:
+                fhr_check_output_dict[fhr_key][fhr_fileN_key]\
+                [output_file_role] = format_filler(
+                    output_file_format,
+                    fhr_check_output_dict[fhr_key][fhr_fileN_key]\
+                    ['valid_date'],
+                    fhr_check_output_dict[fhr_key][fhr_fileN_key]\
+                    ['init_date'],
+                    fhr_check_output_dict[fhr_key][fhr_fileN_key]\
+                    ['forecast_hour'],
+                    {}
+                )
+    input_file_availability_dict = get_file_availability(
+        [fhr_fileN_dict['file']
+         for fhr_key_dict in fhr_check_input_dict.values()
+         for fhr_fileN_dict in fhr_key_dict.values()]
+    )
+    # COMOUT output files not being there yet is expected
+    output_file_availability_dict = get_file_availability(
+        [fhr_fileN_dict['COMOUT_file']
+         for fhr_key_dict in fhr_check_output_dict.values()
+         for fhr_fileN_dict in fhr_key_dict.values()],
+        report_missing=False
+    )
     # Check input files
     for fhr_key in list(fhr_check_input_dict.keys()):
         fhr_key_input_files_exist_list = []
         for fhr_fileN_key in list(fhr_check_input_dict[fhr_key].keys()):
-            fhr_fileN = format_filler(
-                input_file_format,
-                fhr_check_input_dict[fhr_key][fhr_fileN_key]['valid_date'],
-                fhr_check_input_dict[fhr_key][fhr_fileN_key]['init_date'],
-                fhr_check_input_dict[fhr_key][fhr_fileN_key]['forecast_hour'],
-                {}
-            )
-            if os.path.exists(fhr_fileN):
+            fhr_fileN = fhr_check_input_dict[fhr_key][fhr_fileN_key]['file']
+            if input_file_availability_dict[fhr_fileN] is not None:
                 fhr_key_input_files_exist_list.append(True)
                 if job_dict['JOB_GROUP'] == 'reformat_data' \
                         and job_dict['job_name'] in ['GeoHeightAnom',
@@ -2075,21 +2218,13 @@ def check_model_files(job_dict):
     model_copy_output_DATA2COMOUT_list = []
     for fhr_key in list(fhr_check_output_dict.keys()):
         for fhr_fileN_key in list(fhr_check_output_dict[fhr_key].keys()):
-            fhr_fileN_DATA = format_filler(
-                output_DATA_file_format,
-                fhr_check_output_dict[fhr_key][fhr_fileN_key]['valid_date'],
-                fhr_check_output_dict[fhr_key][fhr_fileN_key]['init_date'],
-                fhr_check_output_dict[fhr_key][fhr_fileN_key]['forecast_hour'],
-                {}
+            fhr_fileN_DATA = (
+                fhr_check_output_dict[fhr_key][fhr_fileN_key]['DATA_file']
             )
-            fhr_fileN_COMOUT = format_filler(
-                output_COMOUT_file_format,
-                fhr_check_output_dict[fhr_key][fhr_fileN_key]['valid_date'],
-                fhr_check_output_dict[fhr_key][fhr_fileN_key]['init_date'],
-                fhr_check_output_dict[fhr_key][fhr_fileN_key]['forecast_hour'],
-                {}
+            fhr_fileN_COMOUT = (
+                fhr_check_output_dict[fhr_key][fhr_fileN_key]['COMOUT_file']
             )
-            if os.path.exists(fhr_fileN_COMOUT):
+            if output_file_availability_dict[fhr_fileN_COMOUT] is not None:
                 copy_file(fhr_fileN_COMOUT,fhr_fileN_DATA)
                 if fhr_check_output_dict[fhr_key]\
                         [fhr_fileN_key]['forecast_hour'] \
@@ -2224,9 +2359,12 @@ def check_truth_files(job_dict):
                     +valid_date_dt.strftime('%Y%m%d%H')
                 )
                 truth_input_file_list.append(pb2nc_file)
+    truth_input_file_availability_dict = get_file_availability(
+        truth_input_file_list
+    )
     truth_input_files_exist_list = []
     for truth_file in truth_input_file_list:
-        if os.path.exists(truth_file):
+        if truth_input_file_availability_dict[truth_file] is not None:
             truth_input_files_exist_list.append(True)
         else:
             truth_input_files_exist_list.append(False)
@@ -2518,6 +2656,95 @@ def get_logger(log_file):
     logger.info(logger_info)
     return logger
 
+def convert_png_to_gif(png_file, gif_file, quantize_colors=256):
+    """! Convert a PNG image to a GIF image in process
+
+         Args:
+             png_file        - full path to PNG image (string)
+             gif_file        - full path to write GIF image to (string)
+             quantize_colors - number of colors in the GIF
+                               palette, at most 256 (integer)
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        # Pillow is installed with matplotlib, use ImageMagick without it
+        run_convert = subprocess.run(['convert', png_file, gif_file])
+        if run_convert.returncode != 0:
+            raise OSError(f"convert gave return code "
+                          +f"{run_convert.returncode}")
+        return
+    tmp_gif_file = gif_file+'.tmp'
+    with Image.open(png_file) as png_img:
+        gif_img = png_img.convert('RGB').quantize(colors=quantize_colors)
+    gif_img.save(tmp_gif_file, format='GIF', optimize=True)
+    os.replace(tmp_gif_file, gif_file)
+
+def convert_images(logger, png_gif_file_list, nthreads=4,
+                   quantize_colors=256):
+    """! Convert PNG images to GIF images with a pool of threads
+
+         Args:
+             logger            - logger object
+             png_gif_file_list - full paths of the PNG images and the GIF
+                                 images to write (list of tuples)
+             nthreads          - number of conversion threads (integer)
+             quantize_colors   - number of colors in the GIF
+                                 palette, at most 256 (integer)
+
+         Returns:
+             gif_file_list - GIF images written (list of strings)
+    """
+    gif_file_list = []
+    if len(png_gif_file_list) == 0:
+        return gif_file_list
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, int(nthreads))) as executor:
+        convert_jobs = [
+            executor.submit(convert_png_to_gif, png_file, gif_file,
+                            quantize_colors)
+            for png_file, gif_file in png_gif_file_list
+        ]
+        for (png_file, gif_file), convert_job in zip(png_gif_file_list,
+                                                     convert_jobs):
+            try:
+                convert_job.result()
+                gif_file_list.append(gif_file)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not convert {png_file} to "
+                               +f"{gif_file}: {e}")
+    logger.info(f"Converted {len(gif_file_list)} of "
+                +f"{len(png_gif_file_list)} PNG images to GIF in "
+                +f"{time.perf_counter()-start_time:.2f} seconds")
+    return gif_file_list
+
+def tar_images(logger, tar_file, image_dir):
+    """! Write the files in a directory straight into a tar file
+
+         Args:
+             logger    - logger object
+             tar_file  - full path to tar file to write (string)
+             image_dir - full path to the directory with the
+                         images (string)
+
+         Returns:
+             nfiles - number of files in the tar file (integer)
+    """
+    start_time = time.perf_counter()
+    image_name_list = sorted(
+        dir_entry.name for dir_entry in os.scandir(image_dir)
+        if not dir_entry.name.startswith('.')
+    )
+    tmp_tar_file = tar_file+'.tmp'
+    with tarfile.open(tmp_tar_file, 'w') as tar:
+        for image_name in image_name_list:
+            tar.add(os.path.join(image_dir, image_name), arcname=image_name)
+    os.replace(tmp_tar_file, tar_file)
+    logger.info(f"Wrote {len(image_name_list)} files from {image_dir} to "
+                +f"{tar_file} in {time.perf_counter()-start_time:.2f} "
+                +"seconds")
+    return len(image_name_list)
+
 def get_plot_dates(logger, date_type, start_date, end_date,
                    valid_hr_start, valid_hr_end, valid_hr_inc,
                    init_hr_start, init_hr_end, init_hr_inc,
@@ -2863,6 +3090,349 @@ def condense_model_stat_files(logger, input_dir, output_dir, model, obs,
         else:
             logger.info(f"{output_file} exists")
 
+# Parsed condensed and filtered stat files, reused across build_df
+# calls in the same process so each file is read once per job; only
+# the most recently used files are kept so memory stays bounded
+_STAT_DF_CACHE_SIZE = 16
+_CONDENSED_STAT_DF_CACHE = collections.OrderedDict()
+_FILTERED_STAT_DF_CACHE = collections.OrderedDict()
+
+def get_cached_stat_df(stat_df_cache, cache_key, file_mtime):
+    """! Get a parsed stat file from a cache if it was read since
+         the file was last modified
+
+         Args:
+             stat_df_cache - cache of parsed stat files (OrderedDict)
+             cache_key     - stat file path and columns (tuple)
+             file_mtime    - modification time of the stat file (float)
+
+         Returns:
+             stat_df_info - cached dataframe and what was built from
+                            it, None if not cached (tuple)
+    """
+    if cache_key in stat_df_cache \
+            and stat_df_cache[cache_key][0] == file_mtime:
+        stat_df_cache.move_to_end(cache_key)
+        return stat_df_cache[cache_key][1:]
+    return None
+
+def cache_stat_df(stat_df_cache, cache_key, file_mtime, stat_df_info):
+    """! Add a parsed stat file to a cache, dropping the least
+         recently used files once the cache is full
+
+         Args:
+             stat_df_cache - cache of parsed stat files (OrderedDict)
+             cache_key     - stat file path and columns (tuple)
+             file_mtime    - modification time of the stat file (float)
+             stat_df_info  - dataframe and what was built from it (tuple)
+    """
+    stat_df_cache[cache_key] = (file_mtime,)+stat_df_info
+    stat_df_cache.move_to_end(cache_key)
+    while len(stat_df_cache) > _STAT_DF_CACHE_SIZE:
+        stat_df_cache.popitem(last=False)
+
+def get_binary_stat_file(stat_file):
+    """! Get the path of the Parquet copy of a condensed or
+         filtered stat file
+
+         Args:
+             stat_file - path to stat file (string)
+
+         Returns:
+             binary_stat_file - path to Parquet copy of
+                                stat file (string)
+    """
+    return os.path.splitext(stat_file)[0]+'.parquet'
+
+# Parquet copies of stat files need pyarrow, check for it once and
+# only warn about it missing once per process
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+_PYARROW_WARNING_SET = set()
+
+def write_binary_stat_df(logger, stat_df, stat_file):
+    """! Write a Parquet copy of a condensed or filtered stat file
+         for later jobs to read, the header columns are written as
+         strings and the line type columns as floats. Only done when
+         intermediate_stat_format is parquet and pyarrow is available,
+         the stat file is still what is copied to COMOUT
+
+         Args:
+             logger    - logger object
+             stat_df   - dataframe of the stat file
+             stat_file - path to stat file (string)
+
+         Returns:
+    """
+    if os.environ.get('intermediate_stat_format', 'stat').lower() \
+            != 'parquet':
+        return
+    if not _HAS_PYARROW:
+        if not _PYARROW_WARNING_SET:
+            logger.warning("intermediate_stat_format is parquet but "
+                           +"pyarrow is not available, not writing "
+                           +"Parquet copies of stat files")
+            _PYARROW_WARNING_SET.add('pyarrow')
+        return
+    binary_stat_file = get_binary_stat_file(stat_file)
+    col_list = stat_df.columns.tolist()
+    float_idx = col_list.index('TOTAL')
+    binary_stat_df = stat_df.astype(
+        {col: str for col in col_list[:float_idx]}
+    ).reset_index(drop=True)
+    binary_stat_df[col_list[float_idx:]] = (
+        binary_stat_df[col_list[float_idx:]].apply(
+            pd.to_numeric, errors='coerce'
+        ).astype(np.float64)
+    )
+    tmp_binary_stat_file = f"{binary_stat_file}.{os.getpid()}.tmp"
+    binary_stat_df.to_parquet(tmp_binary_stat_file, index=False,
+                              compression='zstd')
+    os.replace(tmp_binary_stat_file, binary_stat_file)
+    logger.debug(f"Wrote {binary_stat_file}")
+
+def read_binary_stat_df(logger, stat_file, col_list):
+    """! Read the Parquet copy of a condensed or filtered stat file,
+         if there is one that is not older than the stat file and
+         has the requested columns
+
+         Args:
+             logger    - logger object
+             stat_file - path to stat file (string)
+             col_list  - MET line type columns (strings)
+
+         Returns:
+             stat_df - dataframe of the stat file, None if there
+                       is no Parquet copy to use
+    """
+    if not _HAS_PYARROW:
+        return None
+    binary_stat_file = get_binary_stat_file(stat_file)
+    if not os.path.exists(binary_stat_file) \
+            or os.path.getmtime(binary_stat_file) \
+            < os.path.getmtime(stat_file):
+        return None
+    stat_df = pd.read_parquet(binary_stat_file)
+    if stat_df.columns.tolist() != col_list:
+        logger.debug(f"{binary_stat_file} columns do not match "
+                     +f"{stat_file}, not using it")
+        return None
+    logger.debug(f"Reading {binary_stat_file}")
+    return stat_df
+
+def get_condensed_stat_df(logger, condensed_model_file, col_list):
+    """! Read a condensed stat file, reusing it if it was already
+         read in this process
+
+         Args:
+             logger               - logger object
+             condensed_model_file - path to condensed stat file
+                                    (string)
+             col_list             - MET line type columns (strings)
+
+         Returns:
+             condensed_df       - dataframe of the condensed
+                                  stat file (strings)
+             lead_thresh_idx_dict - row positions of each
+                                    (FCST_LEAD, FCST_THRESH)
+                                    (dictionary)
+    """
+    cache_key = (condensed_model_file, tuple(col_list))
+    file_mtime = os.path.getmtime(condensed_model_file)
+    stat_df_info = get_cached_stat_df(
+        _CONDENSED_STAT_DF_CACHE, cache_key, file_mtime
+    )
+    if stat_df_info is None:
+        condensed_df = read_binary_stat_df(
+            logger, condensed_model_file, col_list
+        )
+        if condensed_df is None:
+            logger.debug(f"Reading {condensed_model_file}")
+            condensed_df = pd.read_csv(
+                condensed_model_file, sep=" ", skiprows=1,
+                skipinitialspace=True, names=col_list,
+                keep_default_na=False, dtype='str', header=None
+            )
+            write_binary_stat_df(logger, condensed_df, condensed_model_file)
+        lead_thresh_idx_dict = condensed_df.groupby(
+            ['FCST_LEAD', 'FCST_THRESH'], sort=False
+        ).indices
+        stat_df_info = (condensed_df, lead_thresh_idx_dict)
+        cache_stat_df(
+            _CONDENSED_STAT_DF_CACHE, cache_key, file_mtime, stat_df_info
+        )
+    return stat_df_info
+
+def slice_condensed_stat_df(logger, condensed_model_file, col_list,
+                            filter_dict, met_format_valid_dates):
+    """! Get the lines of a condensed stat file matching the
+         requested header column values and valid dates
+
+         Args:
+             logger                 - logger object
+             condensed_model_file   - path to condensed stat file
+                                      (string)
+             col_list               - MET line type columns (strings)
+             filter_dict            - header column values to match,
+                                      must include FCST_LEAD and
+                                      FCST_THRESH (dictionary)
+             met_format_valid_dates - list of valid dates formatted
+                                      like they are in MET stat files
+
+         Returns:
+             filtered_df - dataframe of the matching lines
+                           sorted by valid date (strings)
+    """
+    condensed_df, lead_thresh_idx_dict = get_condensed_stat_df(
+        logger, condensed_model_file, col_list
+    )
+    lead_thresh_idx = lead_thresh_idx_dict.get(
+        (filter_dict['FCST_LEAD'], filter_dict['FCST_THRESH']), []
+    )
+    filtered_df = condensed_df.iloc[lead_thresh_idx]
+    filter_mask = (
+        filtered_df['FCST_VALID_BEG'].isin(met_format_valid_dates)
+    )
+    for filter_col, filter_val in filter_dict.items():
+        if filter_col in ['FCST_LEAD', 'FCST_THRESH']:
+            continue
+        filter_mask = filter_mask & (filtered_df[filter_col] == filter_val)
+    filtered_df = filtered_df[filter_mask].copy()
+    filtered_df['FCST_VALID_BEG'] = pd.to_datetime(
+        filtered_df['FCST_VALID_BEG'], format='%Y%m%d_%H%M%S'
+    )
+    filtered_df = filtered_df.sort_values(by='FCST_VALID_BEG')
+    filtered_df['FCST_VALID_BEG'] = (
+        filtered_df['FCST_VALID_BEG'].dt.strftime('%Y%m%d_%H%M%S')
+    )
+    return filtered_df
+
+def get_filtered_stat_df(logger, filtered_model_stat_file, col_list):
+    """! Read and type a filtered stat file, reusing it if it was
+         already read in this process
+
+         Args:
+             logger                   - logger object
+             filtered_model_stat_file - path to filtered stat
+                                        file (string)
+             col_list                 - MET line type columns (strings)
+
+         Returns:
+             model_stat_file_df - dataframe of the filtered
+                                  stat file
+    """
+    cache_key = (filtered_model_stat_file, tuple(col_list))
+    file_mtime = os.path.getmtime(filtered_model_stat_file)
+    stat_df_info = get_cached_stat_df(
+        _FILTERED_STAT_DF_CACHE, cache_key, file_mtime
+    )
+    if stat_df_info is None:
+        model_stat_file_df = read_binary_stat_df(
+            logger, filtered_model_stat_file, col_list
+        )
+        if model_stat_file_df is None:
+            model_stat_file_df = pd.read_csv(
+                filtered_model_stat_file, sep=" ", skiprows=1,
+                skipinitialspace=True, names=col_list,
+                na_values=['NA'], header=None
+            )
+            df_dtype_dict = {}
+            float_idx = col_list.index('TOTAL')
+            for col_idx, col in enumerate(col_list):
+                if col_idx < float_idx:
+                    df_dtype_dict[col] = str
+                else:
+                    df_dtype_dict[col] = np.float64
+            model_stat_file_df = model_stat_file_df.astype(df_dtype_dict)
+        stat_df_info = (model_stat_file_df,)
+        cache_stat_df(
+            _FILTERED_STAT_DF_CACHE, cache_key, file_mtime, stat_df_info
+        )
+    return stat_df_info[0]
+
+def align_valid_dates(logger, model_stat_file_df, model_num_df_index,
+                      model_stat_file):
+    """! Align a model's stat file lines to the model's valid dates,
+         using the first line for valid dates with multiple lines
+
+         Args:
+             logger             - logger object
+             model_stat_file_df - dataframe of the model's
+                                  stat file lines
+             model_num_df_index - index of model and valid dates
+                                  (MultiIndex)
+             model_stat_file    - path to model's stat file (string)
+
+         Returns:
+             model_num_df - dataframe of the stat file lines on
+                            model_num_df_index, NaN for valid
+                            dates with no lines
+    """
+    nlines = len(model_stat_file_df)
+    model_stat_file_df = model_stat_file_df.drop_duplicates(
+        subset='FCST_VALID_BEG', keep='first'
+    )
+    if len(model_stat_file_df) != nlines:
+        logger.debug(f"Multiple lines matching valid dates in "
+                     +f"{model_stat_file} using first one")
+    valid_dates = model_num_df_index.get_level_values('valid_dates')
+    model_num_df = model_stat_file_df.set_index(
+        'FCST_VALID_BEG', drop=False
+    ).reindex(valid_dates)
+    model_num_df.index = model_num_df_index
+    missing_valid_dates = valid_dates[
+        ~valid_dates.isin(model_stat_file_df['FCST_VALID_BEG'])
+    ]
+    if len(missing_valid_dates) != 0:
+        logger.debug("No data matching valid dates "
+                     +f"{', '.join(missing_valid_dates)} in "
+                     +f"{model_stat_file}")
+    return model_num_df
+
+def get_mctc_line_type_cols(condensed_model_file, met_line_type_col_list):
+    """! Expand the MET MCTC line type columns for the number
+         of categories in a condensed stat file
+
+         Args:
+             condensed_model_file   - path to condensed stat file
+                                      (string)
+             met_line_type_col_list - MET MCTC line type
+                                      columns (strings)
+
+         Returns:
+             met_line_type_col_list - MET MCTC line type columns
+                                      for the number of categories
+                                      (strings)
+    """
+    tmp_df = pd.read_csv(
+        condensed_model_file, sep=" ", skiprows=1,
+        skipinitialspace=True, nrows=1,
+        keep_default_na=False, dtype='str', header=None
+    )
+    if len(tmp_df) > 0:
+        ncat = int(tmp_df[25][0])
+        new_met_line_type_col_list = []
+        for col in met_line_type_col_list:
+            if col == '(N_CAT)':
+                new_met_line_type_col_list.append('N_CAT')
+            elif col == 'F[0-9]*_O[0-9]*':
+                fcount = 1
+                ocount = 1
+                totcount = 1
+                while totcount <= ncat*ncat:
+                    new_met_line_type_col_list.append(
+                        'F'+str(fcount)+'_'+'O'+str(ocount)
+                    )
+                    if ocount < ncat:
+                        ocount+=1
+                    elif ocount == ncat:
+                        ocount = 1
+                        fcount+=1
+                    totcount+=1
+            else:
+                new_met_line_type_col_list.append(col)
+        met_line_type_col_list = new_met_line_type_col_list
+    return met_line_type_col_list
+
 def build_df(job_group, logger, input_dir, output_dir, model_info_dict,
              met_info_dict, fcst_var_name, fcst_var_level, fcst_var_thresh,
              obs_var_name, obs_var_level, obs_var_thresh, line_type,
@@ -2903,6 +3473,7 @@ def build_df(job_group, logger, input_dir, output_dir, model_info_dict,
     met_version_line_type_col_list = get_met_line_type_cols(
         logger, met_info_dict['root'], met_info_dict['version'], line_type
     )
+    model_num_df_list = []
     for model_num in list(model_info_dict.keys()):
         model_num_name = (
             model_num+'/'+model_info_dict[model_num]['name']
@@ -2959,36 +3530,9 @@ def build_df(job_group, logger, input_dir, output_dir, model_info_dict,
             write_filtered_stat_file = False
             read_filtered_stat_file = False
         if os.path.exists(condensed_model_file) and line_type == 'MCTC':
-            tmp_df = pd.read_csv(
-                condensed_model_file, sep=" ", skiprows=1,
-                skipinitialspace=True,
-                keep_default_na=False, dtype='str', header=None
+            met_version_line_type_col_list = get_mctc_line_type_cols(
+                condensed_model_file, met_version_line_type_col_list
             )
-            if len(tmp_df) > 0:
-                ncat = int(tmp_df[25][0])
-                new_met_version_line_type_col_list = []
-                for col in met_version_line_type_col_list:
-                    if col == '(N_CAT)':
-                        new_met_version_line_type_col_list.append('N_CAT')
-                    elif col == 'F[0-9]*_O[0-9]*':
-                        fcount = 1
-                        ocount = 1
-                        totcount = 1
-                        while totcount <= ncat*ncat:
-                            new_met_version_line_type_col_list.append(
-                                'F'+str(fcount)+'_'+'O'+str(ocount)
-                            )
-                            if ocount < ncat:
-                                ocount+=1
-                            elif ocount == ncat:
-                                ocount = 1
-                                fcount+=1
-                            totcount+=1
-                    else:
-                        new_met_version_line_type_col_list.append(col)
-                met_version_line_type_col_list = (
-                    new_met_version_line_type_col_list
-                )
         if write_filtered_stat_file:
             if fcst_var_thresh != 'NA':
                 fcst_var_thresh_symbol, fcst_var_thresh_letter = (
@@ -3019,52 +3563,31 @@ def build_df(job_group, logger, input_dir, output_dir, model_info_dict,
                             +f"FCST_THRESH: {fcst_var_thresh_symbol}, "
                             +f"OBS_THRESH: {obs_var_thresh_symbol}, "
                             +f"LINE_TYPE: {line_type}")
-                condensed_model_df = pd.read_csv(
-                    condensed_model_file, sep=" ", skiprows=1,
-                    skipinitialspace=True, names=met_version_line_type_col_list,
-                    keep_default_na=False, dtype='str', header=None
-                )
-                filtered_model_df = condensed_model_df[
-                    (condensed_model_df['MODEL'] == model_dict['name'])
-                     & (condensed_model_df['DESC'] == grid)
-                     & (condensed_model_df['FCST_LEAD'] \
-                        == fhr.zfill(2)+'0000')
-                     & (condensed_model_df['FCST_VAR'] \
-                        == fcst_var_name)
-                     & (condensed_model_df['FCST_LEV'] \
-                        == fcst_var_level)
-                     & (condensed_model_df['OBS_VAR'] \
-                        == obs_var_name)
-                     & (condensed_model_df['OBS_LEV'] \
-                        == obs_var_level)
-                     & (condensed_model_df['OBTYPE'] == model_dict['obs_name'])
-                     & (condensed_model_df['VX_MASK'] \
-                        == vx_mask)
-                     & (condensed_model_df['INTERP_MTHD'] \
-                        == interp_method)
-                     & (condensed_model_df['INTERP_PNTS'] \
-                        == interp_points)
-                     & (condensed_model_df['FCST_THRESH'] \
-                        == fcst_var_thresh_symbol)
-                     & (condensed_model_df['OBS_THRESH'] \
-                        == obs_var_thresh_symbol)
-                     & (condensed_model_df['LINE_TYPE'] \
-                        == line_type)
-                ]
-                filtered_model_df = filtered_model_df[
-                    filtered_model_df['FCST_VALID_BEG'].isin(met_format_valid_dates)
-                ]
-                filtered_model_df['FCST_VALID_BEG'] = pd.to_datetime(
-                    filtered_model_df['FCST_VALID_BEG'], format='%Y%m%d_%H%M%S'
-                )
-                filtered_model_df = filtered_model_df.sort_values(by='FCST_VALID_BEG')
-                filtered_model_df['FCST_VALID_BEG'] = (
-                    filtered_model_df['FCST_VALID_BEG'].dt.strftime('%Y%m%d_%H%M%S')
+                filtered_model_df = slice_condensed_stat_df(
+                    logger, condensed_model_file,
+                    met_version_line_type_col_list,
+                    {'MODEL': model_dict['name'],
+                     'DESC': grid,
+                     'FCST_LEAD': fhr.zfill(2)+'0000',
+                     'FCST_VAR': fcst_var_name,
+                     'FCST_LEV': fcst_var_level,
+                     'OBS_VAR': obs_var_name,
+                     'OBS_LEV': obs_var_level,
+                     'OBTYPE': model_dict['obs_name'],
+                     'VX_MASK': vx_mask,
+                     'INTERP_MTHD': interp_method,
+                     'INTERP_PNTS': interp_points,
+                     'FCST_THRESH': fcst_var_thresh_symbol,
+                     'OBS_THRESH': obs_var_thresh_symbol,
+                     'LINE_TYPE': line_type},
+                    met_format_valid_dates
                 )
                 filtered_model_df.to_csv(
                     filtered_model_stat_file, header=met_version_line_type_col_list,
-                    index=None, sep=' ', mode='w'
+                    index=None, sep=' ', mode='w', na_rep='NA'
                 )
+                write_binary_stat_df(logger, filtered_model_df,
+                                     filtered_model_stat_file)
             else:
                 logger.debug(f"{condensed_model_file} does not exist")
             if os.path.exists(filtered_model_stat_file):
@@ -3078,51 +3601,321 @@ def build_df(job_group, logger, input_dir, output_dir, model_info_dict,
             if os.path.exists(filtered_model_stat_file):
                 logger.info(f"Reading {filtered_model_stat_file} for "
                             +f"{model_dict['name']}")
-                model_stat_file_df = pd.read_csv(
-                    filtered_model_stat_file, sep=" ", skiprows=1,
-                    skipinitialspace=True, names=met_version_line_type_col_list,
-                    na_values=['NA'], header=None
+                model_stat_file_df = get_filtered_stat_df(
+                    logger, filtered_model_stat_file,
+                    met_version_line_type_col_list
+                )
+                model_num_df = align_valid_dates(
+                    logger, model_stat_file_df, model_num_df_index,
+                    filtered_model_stat_file
                 )
-                df_dtype_dict = {}
-                float_idx = met_version_line_type_col_list.index('TOTAL')
-                for col in met_version_line_type_col_list:
-                    col_idx = met_version_line_type_col_list.index(col)
-                    if col_idx < float_idx:
-                        df_dtype_dict[col] = str
-                    else:
-                        df_dtype_dict[col] = np.float64
-                model_stat_file_df = model_stat_file_df.astype(df_dtype_dict)
-                for valid_date in met_format_valid_dates:
-                    model_stat_file_df_valid_date_idx_list = (
-                        model_stat_file_df.index[
-                            model_stat_file_df['FCST_VALID_BEG'] == valid_date
-                        ]
-                    ).tolist()
-                    if len(model_stat_file_df_valid_date_idx_list) == 0:
-                        logger.debug("No data matching valid date "
-                                     +f"{valid_date} in "
-                                     +f"{filtered_model_stat_file}")
-                        continue
-                    elif len(model_stat_file_df_valid_date_idx_list) > 1:
-                        logger.debug(f"Multiple lines matching valid date "
-                                     +f"{valid_date} in "
-                                     +f"{filtered_model_stat_file} "
-                                     +f"using first one")
-                    else:
-                        logger.debug(f"One line matching valid date "
-                                     +f"{valid_date} in "
-                                     +f"{filtered_model_stat_file}")
-                    model_num_df.loc[(model_num_name, valid_date)] = (
-                        model_stat_file_df.loc\
-                        [model_stat_file_df_valid_date_idx_list[0]]\
-                        [:]
-                    )
             else:
                 logger.debug(f"{filtered_model_stat_file} does not exist")
-        if model_num == 'model1':
-            all_model_df = model_num_df
-        else:
-            all_model_df = pd.concat([all_model_df, model_num_df])
+        model_num_df_list.append(model_num_df)
+    all_model_df = pd.concat(model_num_df_list)
+    return all_model_df
+
+def build_level_lead_df(logger, level_input_dir_dict, model_info_dict,
+                        met_info_dict, fcst_var_name, fcst_var_thresh,
+                        obs_var_name, obs_var_thresh, line_type, grid,
+                        vx_mask, interp_method, interp_points,
+                        fhr_valid_dates_dict):
+    """! Build the data frame for all model stats at a set of levels
+         and forecast hours, reading each model's condensed stat file
+         for a level once for all the forecast hours
+
+         Args:
+             logger               - logger object
+             level_input_dir_dict - path to the input directory
+                                    of each level (dictionary)
+             model_info_dict      - model infomation dictionary (strings)
+             met_info_dict        - MET information dictionary (strings)
+             fcst_var_name        - forecast variable name (string)
+             fcst_var_tresh       - forecast variable treshold (string)
+             obs_var_name         - observation variable name (string)
+             obs_var_tresh        - observation variable treshold (string)
+             line_type            - MET line type (string)
+             grid                 - verification grid (string)
+             vx_mask              - verification masking region (string)
+             interp_method        - interpolation method (string)
+             interp_points        - interpolation points (string)
+             fhr_valid_dates_dict - list of valid dates formatted
+                                    like they are in MET stat files
+                                    for each forecast hour (dictionary)
+
+         Returns:
+             all_model_df - dataframe of all the information,
+                            indexed by model, level, forecast hour
+                            and valid date
+    """
+    met_version_line_type_col_list = get_met_line_type_cols(
+        logger, met_info_dict['root'], met_info_dict['version'], line_type
+    )
+    if fcst_var_thresh != 'NA':
+        fcst_var_thresh_symbol, fcst_var_thresh_letter = (
+            format_thresh(fcst_var_thresh)
+        )
+    else:
+        fcst_var_thresh_symbol = fcst_var_thresh
+    if obs_var_thresh != 'NA':
+        obs_var_thresh_symbol, obs_var_thresh_letter = (
+            format_thresh(obs_var_thresh)
+        )
+    else:
+        obs_var_thresh_symbol = obs_var_thresh
+    fhr_lead_dict = {}
+    fhr_valid_date_list = []
+    for fhr, met_format_valid_dates in fhr_valid_dates_dict.items():
+        fhr_lead_dict[str(fhr).zfill(2)+'0000'] = fhr
+        for valid_date in met_format_valid_dates:
+            fhr_valid_date_list.append((fhr, valid_date))
+    model_level_df_list = []
+    for model_num in list(model_info_dict.keys()):
+        model_num_name = (
+            model_num+'/'+model_info_dict[model_num]['name']
+            +'/'+model_info_dict[model_num]['plot_name']
+        )
+        model_dict = model_info_dict[model_num]
+        for level, level_input_dir in level_input_dir_dict.items():
+            model_level_df_index = pd.MultiIndex.from_tuples(
+                [(model_num_name, level, fhr, valid_date)
+                 for fhr, valid_date in fhr_valid_date_list],
+                names=['model', 'level', 'fhr', 'valid_dates']
+            )
+            condensed_model_file = os.path.join(
+                level_input_dir, 'condensed_stats_'
+                +f"{model_dict['name'].lower()}_"
+                +f"{line_type.lower()}_"
+                +f"{fcst_var_name.lower()}_"
+                +f"{level.lower().replace('.','p').replace('-', '_')}_"
+                +f"{vx_mask.lower()}.stat"
+            )
+            model_level_col_list = met_version_line_type_col_list
+            if os.path.exists(condensed_model_file) and line_type == 'MCTC':
+                model_level_col_list = get_mctc_line_type_cols(
+                    condensed_model_file, model_level_col_list
+                )
+            if not os.path.exists(condensed_model_file) \
+                    or len(fhr_valid_date_list) == 0:
+                if not os.path.exists(condensed_model_file):
+                    logger.debug(f"{condensed_model_file} does not exist")
+                model_level_df_list.append(
+                    pd.DataFrame(np.nan, index=model_level_df_index,
+                                 columns=model_level_col_list)
+                )
+                continue
+            logger.info(f"Reading {condensed_model_file} for "
+                        +f"MODEL: {model_dict['name']}, DESC: {grid} "
+                        +f"FCST_LEAD: {', '.join(fhr_lead_dict)}, "
+                        +f"FCST_VAR: {fcst_var_name}, "
+                        +f"FCST_LEV: {level}, "
+                        +f"OBS_VAR: {obs_var_name}, "
+                        +f"OBS_LEV: {level}, "
+                        +f"OBTYPE: {model_dict['obs_name']}, "
+                        +f"VX_MASK: {vx_mask}, "
+                        +f"INTERP_MTHD: {interp_method}, "
+                        +f"INTERP_PNTS: {interp_points}, "
+                        +f"FCST_THRESH: {fcst_var_thresh_symbol}, "
+                        +f"OBS_THRESH: {obs_var_thresh_symbol}, "
+                        +f"LINE_TYPE: {line_type}")
+            condensed_df, lead_thresh_idx_dict = get_condensed_stat_df(
+                logger, condensed_model_file, model_level_col_list
+            )
+            lead_thresh_idx = np.concatenate(
+                [lead_thresh_idx_dict.get((lead, fcst_var_thresh_symbol), [])
+                 for lead in fhr_lead_dict]
+            ).astype(int)
+            model_level_df = condensed_df.iloc[np.sort(lead_thresh_idx)]
+            filter_mask = pd.MultiIndex.from_arrays(
+                [model_level_df['FCST_LEAD'].map(fhr_lead_dict),
+                 model_level_df['FCST_VALID_BEG']]
+            ).isin(fhr_valid_date_list)
+            for filter_col, filter_val in [
+                    ('MODEL', model_dict['name']), ('DESC', grid),
+                    ('FCST_VAR', fcst_var_name), ('FCST_LEV', level),
+                    ('OBS_VAR', obs_var_name), ('OBS_LEV', level),
+                    ('OBTYPE', model_dict['obs_name']),
+                    ('VX_MASK', vx_mask),
+                    ('INTERP_MTHD', interp_method),
+                    ('INTERP_PNTS', interp_points),
+                    ('OBS_THRESH', obs_var_thresh_symbol),
+                    ('LINE_TYPE', line_type)]:
+                filter_mask = filter_mask & (
+                    model_level_df[filter_col] == filter_val
+                ).values
+            model_level_df = model_level_df[filter_mask].copy()
+            float_col_list = (
+                model_level_col_list[model_level_col_list.index('TOTAL'):]
+            )
+            model_level_df[float_col_list] = (
+                model_level_df[float_col_list].apply(pd.to_numeric,
+                                                     errors='coerce')
+            )
+            nlines = len(model_level_df)
+            model_level_df = model_level_df.drop_duplicates(
+                subset=['FCST_LEAD', 'FCST_VALID_BEG'], keep='first'
+            )
+            if len(model_level_df) != nlines:
+                logger.debug(f"Multiple lines matching valid dates in "
+                             +f"{condensed_model_file} using first one")
+            model_level_df.index = pd.MultiIndex.from_arrays(
+                [[model_num_name]*len(model_level_df),
+                 [level]*len(model_level_df),
+                 model_level_df['FCST_LEAD'].map(fhr_lead_dict),
+                 model_level_df['FCST_VALID_BEG']],
+                names=['model', 'level', 'fhr', 'valid_dates']
+            )
+            model_level_df_list.append(
+                model_level_df.reindex(model_level_df_index)
+            )
+    all_model_df = pd.concat(model_level_df_list)
+    return all_model_df
+
+def build_thresh_df(logger, input_dir, model_info_dict, met_info_dict,
+                    fcst_var_name, fcst_var_level, fcst_var_thresh_list,
+                    obs_var_name, obs_var_level, obs_var_thresh_list,
+                    line_type, grid, vx_mask, interp_method, interp_points,
+                    met_format_valid_dates, fhr):
+    """! Build the data frame for all model stats at a set of
+         thresholds, reading each model's condensed stat file
+         once for all the thresholds
+
+         Args:
+             logger                 - logger object
+             input_dir              - path to input directory (string)
+             model_info_dict        - model infomation dictionary (strings)
+             met_info_dict          - MET information dictionary (strings)
+             fcst_var_name          - forecast variable name (string)
+             fcst_var_level         - forecast variable level (string)
+             fcst_var_thresh_list   - forecast variable tresholds (strings)
+             obs_var_name           - observation variable name (string)
+             obs_var_level          - observation variable level (string)
+             obs_var_thresh_list    - observation variable tresholds,
+                                      paired with fcst_var_thresh_list
+                                      (strings)
+             line_type              - MET line type (string)
+             grid                   - verification grid (string)
+             vx_mask                - verification masking region (string)
+             interp_method          - interpolation method (string)
+             interp_points          - interpolation points (string)
+             met_format_valid_dates - list of valid dates formatted
+                                      like they are in MET stat files
+             fhr                    - forecast hour (string)
+
+         Returns:
+             all_model_df - dataframe of all the information,
+                            indexed by model, forecast threshold
+                            and valid date
+    """
+    met_version_line_type_col_list = get_met_line_type_cols(
+        logger, met_info_dict['root'], met_info_dict['version'], line_type
+    )
+    # format_thresh() once per threshold, the stat files use the symbols
+    thresh_symbol_dict = {}
+    for fcst_var_thresh, obs_var_thresh in zip(fcst_var_thresh_list,
+                                               obs_var_thresh_list):
+        thresh_symbol_dict[(format_thresh(fcst_var_thresh)[0],
+                            format_thresh(obs_var_thresh)[0])] = (
+            fcst_var_thresh
+        )
+    fcst_lead = fhr.zfill(2)+'0000'
+    model_df_list = []
+    for model_num in list(model_info_dict.keys()):
+        model_num_name = (
+            model_num+'/'+model_info_dict[model_num]['name']
+            +'/'+model_info_dict[model_num]['plot_name']
+        )
+        model_dict = model_info_dict[model_num]
+        model_df_index = pd.MultiIndex.from_product(
+            [[model_num_name], fcst_var_thresh_list, met_format_valid_dates],
+            names=['model', 'fcst_var_thresh', 'valid_dates']
+        )
+        condensed_model_file = os.path.join(
+            input_dir, 'condensed_stats_'
+            +f"{model_dict['name'].lower()}_"
+            +f"{line_type.lower()}_"
+            +f"{fcst_var_name.lower()}_"
+            +f"{fcst_var_level.lower().replace('.','p').replace('-', '_')}_"
+            +f"{vx_mask.lower()}.stat"
+        )
+        model_col_list = met_version_line_type_col_list
+        if os.path.exists(condensed_model_file) and line_type == 'MCTC':
+            model_col_list = get_mctc_line_type_cols(
+                condensed_model_file, model_col_list
+            )
+        if not os.path.exists(condensed_model_file) \
+                or len(met_format_valid_dates) == 0:
+            if not os.path.exists(condensed_model_file):
+                logger.debug(f"{condensed_model_file} does not exist")
+            model_df_list.append(
+                pd.DataFrame(np.nan, index=model_df_index,
+                             columns=model_col_list)
+            )
+            continue
+        logger.info(f"Reading {condensed_model_file} for "
+                    +f"MODEL: {model_dict['name']}, DESC: {grid} "
+                    +f"FCST_LEAD: {fcst_lead}, "
+                    +f"FCST_VAR: {fcst_var_name}, "
+                    +f"FCST_LEV: {fcst_var_level}, "
+                    +f"OBS_VAR: {obs_var_name}, "
+                    +f"OBS_LEV: {obs_var_level}, "
+                    +f"OBTYPE: {model_dict['obs_name']}, "
+                    +f"VX_MASK: {vx_mask}, "
+                    +f"INTERP_MTHD: {interp_method}, "
+                    +f"INTERP_PNTS: {interp_points}, "
+                    +"FCST_THRESH: "
+                    +f"{', '.join(t[0] for t in thresh_symbol_dict)}, "
+                    +"OBS_THRESH: "
+                    +f"{', '.join(t[1] for t in thresh_symbol_dict)}, "
+                    +f"LINE_TYPE: {line_type}")
+        condensed_df, lead_thresh_idx_dict = get_condensed_stat_df(
+            logger, condensed_model_file, model_col_list
+        )
+        lead_thresh_idx = np.concatenate(
+            [lead_thresh_idx_dict.get((fcst_lead, fcst_thresh_symbol), [])
+             for fcst_thresh_symbol in set(t[0] for t in thresh_symbol_dict)]
+        ).astype(int)
+        model_df = condensed_df.iloc[np.sort(lead_thresh_idx)]
+        filter_mask = (
+            pd.MultiIndex.from_arrays(
+                [model_df['FCST_THRESH'], model_df['OBS_THRESH']]
+            ).isin(list(thresh_symbol_dict))
+            & model_df['FCST_VALID_BEG'].isin(met_format_valid_dates).values
+        )
+        for filter_col, filter_val in [
+                ('MODEL', model_dict['name']), ('DESC', grid),
+                ('FCST_VAR', fcst_var_name), ('FCST_LEV', fcst_var_level),
+                ('OBS_VAR', obs_var_name), ('OBS_LEV', obs_var_level),
+                ('OBTYPE', model_dict['obs_name']),
+                ('VX_MASK', vx_mask),
+                ('INTERP_MTHD', interp_method),
+                ('INTERP_PNTS', interp_points),
+                ('LINE_TYPE', line_type)]:
+            filter_mask = filter_mask & (
+                model_df[filter_col] == filter_val
+            ).values
+        model_df = model_df[filter_mask].copy()
+        float_col_list = model_col_list[model_col_list.index('TOTAL'):]
+        model_df[float_col_list] = (
+            model_df[float_col_list].apply(pd.to_numeric, errors='coerce')
+        )
+        nlines = len(model_df)
+        model_df = model_df.drop_duplicates(
+            subset=['FCST_THRESH', 'OBS_THRESH', 'FCST_VALID_BEG'],
+            keep='first'
+        )
+        if len(model_df) != nlines:
+            logger.debug(f"Multiple lines matching valid dates in "
+                         +f"{condensed_model_file} using first one")
+        model_df.index = pd.MultiIndex.from_arrays(
+            [[model_num_name]*len(model_df),
+             [thresh_symbol_dict[thresh_symbols] for thresh_symbols
+              in zip(model_df['FCST_THRESH'], model_df['OBS_THRESH'])],
+             model_df['FCST_VALID_BEG']],
+            names=['model', 'fcst_var_thresh', 'valid_dates']
+        )
+        model_df_list.append(model_df.reindex(model_df_index))
+    all_model_df = pd.concat(model_df_list)
     return all_model_df
 
 def calculate_stat(logger, data_df, line_type, stat):
@@ -3580,3 +4373,146 @@ def calculate_average(logger, average_method, line_type, stat, df):
         logger.warning(f"{average_method} not recongnized..."
                        +"use mean, or aggregation...returning NaN")
     return average_value
+
+def calculate_grouped_average(logger, all_model_df, line_type, stat,
+                              event_equalization):
+    """! Calculate the statistic and its average over the valid dates
+         for every model and every other index value at once
+
+         Args:
+             logger             - logger object
+             all_model_df       - dataframe of all the information,
+                                  indexed by model, any other
+                                  index levels and valid date
+             line_type          - line type to calculate
+                                  stat from
+             stat               - statistic to calculate
+                                  (string)
+             event_equalization - do event equalization across
+                                  the models (boolean)
+
+         Returns:
+             stat_df - series of the statistic, indexed like
+                       all_model_df
+             avg_df  - series of the statistic average, indexed
+                       by model and the other index levels
+    """
+    group_level_list = [lvl for lvl in all_model_df.index.names
+                        if lvl != 'valid_dates']
+    stat_df = pd.Series(
+        calculate_stat(logger, all_model_df.reset_index(drop=True),
+                       line_type, stat)[1],
+        index=all_model_df.index
+    )
+    if event_equalization:
+        logger.info("Doing event equalization")
+        stat_df = stat_df.where(
+            (stat_df.notna() & ~np.isinf(stat_df))
+            .groupby(level=[lvl for lvl in all_model_df.index.names
+                            if lvl != 'model'])
+            .transform('all')
+        )
+        all_model_df = all_model_df.where(stat_df.notna(), axis=0)
+    if line_type in ['CNT', 'GRAD', 'CTS', 'NBRCTS', 'NBRCNT', 'VCNT']:
+        avg_df = (
+            stat_df.where(~np.isinf(stat_df))
+            .groupby(level=group_level_list).mean()
+        )
+    else:
+        sum_df = (
+            all_model_df.loc[:,'TOTAL':]
+            .groupby(level=group_level_list).sum()
+        )
+        ndays = (
+            all_model_df.loc[:,'TOTAL']
+            .groupby(level=group_level_list).count()
+        )
+        avg_df = pd.Series(
+            calculate_stat(logger,
+                           sum_df.div(ndays, axis=0).reset_index(drop=True),
+                           line_type, stat)[1],
+            index=sum_df.index
+        ).where(ndays != 0)
+    return stat_df, avg_df
+
+def calculate_level_lead_average(logger, all_model_df, line_type, stat,
+                                 event_equalization):
+    """! Calculate the average of the statistic for each model,
+         forecast hour and level at once
+
+         Args:
+             logger             - logger object
+             all_model_df       - dataframe of all the information,
+                                  indexed by model, level,
+                                  forecast hour and valid date
+             line_type          - line type to calculate
+                                  stat from
+             stat               - statistic to calculate
+                                  (string)
+             event_equalization - do event equalization across
+                                  the models (boolean)
+
+         Returns:
+             avg_df - dataframe of the statistic average, indexed
+                      by model and forecast hour with a column
+                      for each level
+    """
+    model_idx_list = (
+        all_model_df.index.get_level_values('model').unique().tolist()
+    )
+    level_list = (
+        all_model_df.index.get_level_values('level').unique().tolist()
+    )
+    fhr_list = all_model_df.index.get_level_values('fhr').unique().tolist()
+    avg_df = calculate_grouped_average(
+        logger, all_model_df, line_type, stat, event_equalization
+    )[1]
+    avg_df = avg_df.unstack('level').reindex(
+        index=pd.MultiIndex.from_product([model_idx_list, fhr_list],
+                                         names=['model', 'fhr']),
+        columns=level_list
+    )
+    return avg_df
+
+def calculate_model1_diff_ci(stat_df):
+    """! Calculate the 95% confidence interval of the mean
+         difference of each model from the first model, for every
+         other index value at once
+         Null Hypothesis: mean(M1-M2)=0,
+         M1-M2 follows normal distribution.
+         CI is F*SD/sqrt(N-1) of the difference of means,
+         F=1.96 for infinite samples, F=2.0 for nsz=60,
+         F=2.042 for nsz=30, F=2.228 for nsz=10
+
+         Args:
+             stat_df - series of the statistic, indexed by model,
+                       any other index levels and valid date
+
+         Returns:
+             ci_df - dataframe of the confidence interval, indexed
+                     by the other index levels with a column for
+                     each model, NaN for the first model
+    """
+    model_idx_list = (
+        stat_df.index.get_level_values('model').unique().tolist()
+    )
+    group_level_list = [lvl for lvl in stat_df.index.names
+                        if lvl not in ['model', 'valid_dates']]
+    model_stat_df = stat_df.unstack('model')
+    model1_diff_df = model_stat_df[model_idx_list].sub(
+        model_stat_df[model_idx_list[0]], axis=0
+    )
+    model1_diff_df = model1_diff_df.where(~np.isinf(model1_diff_df))
+    model1_diff_df.iloc[:,0] = np.nan
+    model1_diff_groups = model1_diff_df.groupby(level=group_level_list)
+    nsamples = model1_diff_groups.count()
+    model1_diff_mean_std_err = (
+        model1_diff_groups.std(ddof=0)
+        /np.sqrt((nsamples-1).where(nsamples > 1))
+    )
+    ci_factor = np.select(
+        [nsamples >= 80, nsamples >= 40, nsamples >= 20],
+        [1.960, 2.000, 2.042], default=2.228
+    )
+    ci_df = (ci_factor*model1_diff_mean_std_err).where(nsamples > 1)
+    return ci_df
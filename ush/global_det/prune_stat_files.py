@@ -15,6 +15,7 @@ Abstract: This script is run by all scripts in the verif_plotting software.
 '''
 
 import glob
+import fnmatch
 import subprocess
 import os
 import re
@@ -31,34 +32,82 @@ def daterange(start, end, td):
       yield curr
       curr+=td
 
+# Directory listings reused for every date of the evaluation period
+_DIR_LISTING_CACHE = {}
+
+def list_dir(dir_path):
+    if dir_path not in _DIR_LISTING_CACHE:
+        try:
+            with os.scandir(dir_path) as dir_entries:
+                _DIR_LISTING_CACHE[dir_path] = [
+                    dir_entry.name for dir_entry in dir_entries
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            _DIR_LISTING_CACHE[dir_path] = []
+    return _DIR_LISTING_CACHE[dir_path]
+
+def find_files(file_path_list):
+    # Same matches as glob.glob for each path, but with one
+    # os.scandir per directory instead of one listing per path
+    found_file_list = []
+    for file_path in file_path_list:
+        dir_path, file_name = os.path.split(file_path)
+        if glob.has_magic(dir_path):
+            found_file_list.extend(glob.glob(file_path))
+            continue
+        dir_names = list_dir(dir_path)
+        if glob.has_magic(file_name):
+            found_file_list.extend([
+                os.path.join(dir_path, dir_name) for dir_name
+                in fnmatch.filter(dir_names, file_name)
+                if not dir_name.startswith('.') or file_name.startswith('.')
+            ])
+        elif file_name in dir_names:
+            found_file_list.append(file_path)
+    return found_file_list
+
+def expand_met_stat_files_date_range(data_dir, output_base_template,
+                                     RUN_case, RUN_type, line_type, vx_mask,
+                                     var_name, model, obtype, eval_period,
+                                     valid_list):
+    template = string_template_substitution.compile_template(
+        output_base_template
+    )
+    str_sub_dict = dict(
+        RUN_CASE=str(RUN_case), RUN_CASE_UPPER=str(RUN_case).upper(),
+        RUN_CASE_LOWER=str(RUN_case).lower(), RUN_TYPE=str(RUN_type),
+        RUN_TYPE_UPPER=str(RUN_type).lower(),
+        RUN_TYPE_LOWER=str(RUN_type).lower(), LINE_TYPE=str(line_type),
+        LINE_TYPE_UPPER=str(line_type).upper(),
+        LINE_TYPE_LOWER=str(line_type).lower(),
+        VX_MASK=str(vx_mask), VX_MASK_UPPER=str(vx_mask).upper(),
+        VX_MASK_LOWER=str(vx_mask).lower(),
+        VAR_NAME=str(var_name), VAR_NAME_UPPER=str(var_name).upper(),
+        VAR_NAME_LOWER=str(var_name).lower(), MODEL=str(model),
+        MODEL_UPPER=str(model).upper(), MODEL_LOWER=str(model).lower(),
+        OBTYPE=str(obtype), OBTYPE_UPPER=str(obtype).upper(),
+        OBTYPE_LOWER=str(obtype).lower(), EVAL_PERIOD=str(eval_period),
+        EVAL_PERIOD_UPPER=str(eval_period).upper(),
+        EVAL_PERIOD_LOWER=str(eval_period).lower()
+    )
+    met_stat_file_list = [
+        os.path.join(
+            # edit below to define stats archive path. Use '*' as wildcard.
+            data_dir,
+            template.format(VALID=valid, valid=valid, **str_sub_dict)
+        ) for valid in valid_list
+    ]
+    return find_files(met_stat_file_list)
+
 def expand_met_stat_files(met_stat_files, data_dir, output_base_template, RUN_case, 
                           RUN_type, line_type, vx_mask, var_name, model, 
                           obtype, eval_period, valid):
     met_stat_files_out = np.concatenate((
-        met_stat_files, 
-        glob.glob(os.path.join(
-            # edit below to define stats archive path. Use '*' as wildcard.
-            data_dir, 
-            string_template_substitution.do_string_sub(
-                output_base_template, 
-                RUN_CASE=str(RUN_case), RUN_CASE_UPPER=str(RUN_case).upper(),
-                RUN_CASE_LOWER=str(RUN_case).lower(), RUN_TYPE=str(RUN_type), 
-                RUN_TYPE_UPPER=str(RUN_type).lower(), 
-                RUN_TYPE_LOWER=str(RUN_type).lower(), LINE_TYPE=str(line_type),
-                LINE_TYPE_UPPER=str(line_type).upper(), 
-                LINE_TYPE_LOWER=str(line_type).lower(),
-                VX_MASK=str(vx_mask), VX_MASK_UPPER=str(vx_mask).upper(),
-                VX_MASK_LOWER=str(vx_mask).lower(), 
-                VAR_NAME=str(var_name), VAR_NAME_UPPER=str(var_name).upper(),
-                VAR_NAME_LOWER=str(var_name).lower(), MODEL=str(model), 
-                MODEL_UPPER=str(model).upper(), MODEL_LOWER=str(model).lower(),
-                OBTYPE=str(obtype), OBTYPE_UPPER=str(obtype).upper(),
-                OBTYPE_LOWER=str(obtype).lower(), EVAL_PERIOD=str(eval_period),
-                EVAL_PERIOD_UPPER=str(eval_period).upper(),
-                EVAL_PERIOD_LOWER=str(eval_period).lower(),
-                VALID=valid, valid=valid
-            )
-        ))
+        met_stat_files,
+        expand_met_stat_files_date_range(
+            data_dir, output_base_template, RUN_case, RUN_type, line_type,
+            vx_mask, var_name, model, obtype, eval_period, [valid]
+        )
     ))
     return met_stat_files_out
 
@@ -70,12 +119,11 @@ def prune_data(data_dir, prune_dir, tmp_dir, output_base_template, valid_range,
    # Get list of models and loop through
    for model in model_list:
       # Get input and output data
-      met_stat_files = []
-      for valid in daterange(valid_range[0], valid_range[1], td(days=1)):
-         met_stat_files = expand_met_stat_files(
-            met_stat_files, data_dir, output_base_template, RUN_case, RUN_type, 
-            line_type, vx_mask, var_name, model, obtype, eval_period, valid
-         ) 
+      met_stat_files = expand_met_stat_files_date_range(
+         data_dir, output_base_template, RUN_case, RUN_type, line_type,
+         vx_mask, var_name, model, obtype, eval_period,
+         list(daterange(valid_range[0], valid_range[1], td(days=1)))
+      )
       pruned_data_dir = os.path.join(
          prune_dir, line_type+'_'+var_name+'_'+vx_mask+'_'+eval_period, tmp_dir
       )
@@ -843,3 +843,83 @@ def extract_lead(template, filename):
     for match_tag in match_tags:
         if match_tag.split('?') != 'lead':
             new_template = new_template.replace('{' + match_tag + '}', '.*')
+
+class CompiledTemplate:
+    """! Template parsed once into literal text and tags so it can be
+         filled many times without repeating the tag discovery done
+         by do_string_sub. Tags with a plain datetime format, i.e.
+         {valid?fmt=%Y%m%d}, or no formatting are filled directly; tags
+         with shift or truncate options fall back to do_string_sub.
+    """
+    def __init__(self, tmpl):
+        self.tmpl = tmpl
+        self.parts = []
+        split_tmpl = re.split(r'\{([^}{]*)\}', tmpl)
+        for idx, part in enumerate(split_tmpl):
+            if idx % 2 == 0:
+                if part:
+                    self.parts.append(part)
+                continue
+            split_string = part.split(FORMATTING_DELIMITER)
+            key = split_string[0]
+            fmt = None
+            simple = True
+            for split_item in split_string[1:]:
+                if split_item.startswith(FORMAT_STRING
+                                         +FORMATTING_VALUE_DELIMITER):
+                    fmt = split_item.split(FORMATTING_VALUE_DELIMITER)[1]
+                else:
+                    simple = False
+            self.parts.append((key, fmt, simple, part))
+
+    def format(self, skip_missing_tags=False, **kwargs):
+        """! Fill the template
+             @param skip_missing_tags if True, leave tags whose key was
+              not passed in place, otherwise raise a TypeError
+             @param kwargs values to substitute for the template tags
+             @returns template with tags substituted with values
+        """
+        filled = []
+        for part in self.parts:
+            if isinstance(part, str):
+                filled.append(part)
+                continue
+            key, fmt, simple, tag = part
+            if key not in kwargs:
+                if skip_missing_tags:
+                    filled.append(TEMPLATE_IDENTIFIER_BEGIN+tag
+                                  +TEMPLATE_IDENTIFIER_END)
+                    continue
+                raise TypeError("The key " + key +
+                                " was not passed to do_string_sub " +
+                                " for template: " + self.tmpl + ": "
+                                + str(kwargs))
+            value = kwargs[key]
+            if simple and fmt is None:
+                if isinstance(value, int):
+                    value = f"{value}S"
+                filled.append(value)
+            elif simple and isinstance(value, datetime.datetime):
+                filled.append(value.strftime(fmt))
+            elif simple and isinstance(value, str):
+                filled.append(value)
+            else:
+                filled.append(
+                    find_and_replace_tags_in_template(
+                        [tag], TEMPLATE_IDENTIFIER_BEGIN+tag
+                        +TEMPLATE_IDENTIFIER_END, kwargs
+                    )
+                )
+        return ''.join(filled)
+
+_COMPILED_TEMPLATE_CACHE = {}
+
+def compile_template(tmpl):
+    """! Parse a template once, reusing the parsed template
+         for repeated calls with the same template
+         @param tmpl template to parse
+         @returns CompiledTemplate object
+    """
+    if tmpl not in _COMPILED_TEMPLATE_CACHE:
+        _COMPILED_TEMPLATE_CACHE[tmpl] = CompiledTemplate(tmpl)
+    return _COMPILED_TEMPLATE_CACHE[tmpl]
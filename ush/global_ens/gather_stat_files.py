@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+
+'''
+Program Name: gather_stat_files.py
+Contact(s): Binbin Zhou
+Abstract: This script gathers the small MET .stat files of a day
+          into the daily evs.stats.*.stat files. It does the
+          same job as running the METplus StatAnalysis
+          GatherByDay configurations with -dump_row: lines
+          are kept for the requested model and observation
+          types with a forecast valid time in the day's valid
+          window. The kept lines of every input file are
+          held in memory and sorted per file, then the
+          sorted lists are merged into the output file.
+          The gather jobs are run at once in a pool of
+          processes.
+
+          Usage: gather_stat_files.py VALID_BEG VALID_END OBTYPES JOB [JOB ...]
+              VALID_BEG - first forecast valid time, YYYYmmddHH
+              VALID_END - last forecast valid time, YYYYmmddHH
+              OBTYPES   - comma separated OBTYPE values to keep,
+                          ALL keeps every OBTYPE
+              JOB       - MODEL:LOOKIN:OUTPUT_FILE, LOOKIN is
+                          a directory or file path that may
+                          use wildcards and OUTPUT_FILE is
+                          the daily file to write
+'''
+
+import os
+import sys
+import glob
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+
+# MET .stat header columns up to and including LINE_TYPE
+STAT_HEADER_COLS = ['VERSION', 'MODEL', 'DESC', 'FCST_LEAD',
+                    'FCST_VALID_BEG', 'FCST_VALID_END', 'OBS_LEAD',
+                    'OBS_VALID_BEG', 'OBS_VALID_END', 'FCST_VAR',
+                    'FCST_UNITS', 'FCST_LEV', 'OBS_VAR', 'OBS_UNITS',
+                    'OBS_LEV', 'OBTYPE', 'VX_MASK', 'INTERP_MTHD',
+                    'INTERP_PNTS', 'FCST_THRESH', 'OBS_THRESH', 'COV_THRESH',
+                    'ALPHA', 'LINE_TYPE']
+# Header columns the gathered lines are sorted on
+SORT_COLS = ['FCST_VALID_BEG', 'FCST_LEAD', 'LINE_TYPE', 'FCST_VAR',
+             'FCST_LEV', 'VX_MASK', 'FCST_THRESH']
+
+def get_stat_files(lookin):
+    """! Get the .stat files for a lookin path, directories are
+         searched recursively like MET stat_analysis -lookin
+
+         Args:
+             lookin - directory or file path, may use
+                      wildcards (string)
+
+         Returns:
+             stat_file_list - sorted list of .stat files (strings)
+    """
+    stat_file_list = []
+    for lookin_path in sorted(glob.glob(lookin)):
+        if os.path.isdir(lookin_path):
+            for root, dirs, files in os.walk(lookin_path):
+                for file_name in files:
+                    if file_name.endswith('.stat'):
+                        stat_file_list.append(os.path.join(root, file_name))
+        elif os.path.isfile(lookin_path):
+            stat_file_list.append(lookin_path)
+    return sorted(set(stat_file_list))
+
+def read_stat_file(stat_file, model, obtype_list, valid_beg, valid_end):
+    """! Read the lines of a .stat file to gather
+
+         Args:
+             stat_file   - full path to .stat file (string)
+             model       - value in MET column MODEL (string)
+             obtype_list - values in MET column OBTYPE to keep,
+                           empty keeps all (strings)
+             valid_beg   - first FCST_VALID_BEG, YYYYmmdd_HHMMSS (string)
+             valid_end   - last FCST_VALID_BEG, YYYYmmdd_HHMMSS (string)
+
+         Returns:
+             header_line - header line of the file (string)
+             line_list   - sorted list of (sort key, line) for the
+                           lines to keep (tuples)
+    """
+    model_idx = STAT_HEADER_COLS.index('MODEL')
+    obtype_idx = STAT_HEADER_COLS.index('OBTYPE')
+    valid_idx = STAT_HEADER_COLS.index('FCST_VALID_BEG')
+    sort_idx_list = [STAT_HEADER_COLS.index(col) for col in SORT_COLS]
+    line_list = []
+    with open(stat_file, 'r') as sf:
+        header_line = sf.readline().rstrip('\n')
+        for line in sf:
+            line = line.rstrip('\n')
+            line_cols = line.split()
+            if len(line_cols) <= len(STAT_HEADER_COLS) \
+                    or line_cols[model_idx] != model \
+                    or not valid_beg <= line_cols[valid_idx] <= valid_end:
+                continue
+            if obtype_list and line_cols[obtype_idx] not in obtype_list:
+                continue
+            line_list.append(
+                (tuple(line_cols[idx] for idx in sort_idx_list)
+                 +tuple(line_cols), line)
+            )
+    line_list.sort()
+    return header_line, line_list
+
+def gather_stat_files(model, lookin, output_file, obtype_list,
+                      valid_beg, valid_end):
+    """! Gather the lines of the small .stat files into one file
+
+         Args:
+             model       - value in MET column MODEL (string)
+             lookin      - directory or file path, may use
+                           wildcards (string)
+             output_file - full path to gathered file (string)
+             obtype_list - values in MET column OBTYPE to keep,
+                           empty keeps all (strings)
+             valid_beg   - first FCST_VALID_BEG, YYYYmmdd_HHMMSS (string)
+             valid_end   - last FCST_VALID_BEG, YYYYmmdd_HHMMSS (string)
+
+         Returns:
+             nlines - number of lines written (integer)
+    """
+    stat_file_list = get_stat_files(lookin)
+    print(f"Gathering {model} lines from {len(stat_file_list)} files "
+          +f"in {lookin}")
+    output_header_cols = None
+    output_header_line = None
+    file_line_list = []
+    for stat_file in stat_file_list:
+        header_line, line_list = read_stat_file(
+            stat_file, model, obtype_list, valid_beg, valid_end
+        )
+        header_cols = header_line.split()[:len(STAT_HEADER_COLS)]
+        if header_cols != STAT_HEADER_COLS:
+            print(f"WARNING: {stat_file} does not have a MET .stat header, "
+                  +"skipping")
+            continue
+        if output_header_cols is None:
+            output_header_cols = header_line.split()
+            output_header_line = header_line
+        elif header_line.split()[0] != output_header_cols[0]:
+            print(f"WARNING: {stat_file} is from MET "
+                  +f"{header_line.split()[0]} not "
+                  +f"{output_header_cols[0]}, skipping")
+            continue
+        if line_list:
+            file_line_list.append(line_list)
+    nlines = 0
+    if not file_line_list:
+        print(f"WARNING: No {model} lines to gather in {lookin}")
+        return nlines
+    output_dir = os.path.dirname(output_file)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+    tmp_output_file = output_file+'.tmp'
+    with open(tmp_output_file, 'w') as of:
+        of.write(output_header_line+'\n')
+        last_line_key = None
+        for line_key, line in heapq.merge(*file_line_list):
+            # Same lines from more than one file are written once
+            if line_key == last_line_key:
+                continue
+            of.write(line+'\n')
+            last_line_key = line_key
+            nlines+=1
+    os.replace(tmp_output_file, output_file)
+    print(f"Wrote {nlines} {model} lines to {output_file}")
+    return nlines
+
+def main():
+    if len(sys.argv) < 5:
+        print(__doc__)
+        sys.exit(1)
+    valid_beg = sys.argv[1][0:8]+'_'+sys.argv[1][8:10]+'0000'
+    valid_end = sys.argv[2][0:8]+'_'+sys.argv[2][8:10]+'0000'
+    obtypes = sys.argv[3]
+    if obtypes.upper() == 'ALL':
+        obtype_list = []
+    else:
+        obtype_list = obtypes.split(',')
+    job_list = []
+    for job in sys.argv[4:]:
+        job_info = job.split(':')
+        if len(job_info) != 3:
+            print(f"ERROR: Gather job {job} is not MODEL:LOOKIN:OUTPUT_FILE")
+            sys.exit(1)
+        job_list.append(job_info)
+    nproc = min(int(os.environ.get('gather_nproc', len(job_list))),
+                len(job_list), len(os.sched_getaffinity(0)))
+    with ProcessPoolExecutor(max_workers=max(1, nproc)) as executor:
+        futures = [
+            executor.submit(gather_stat_files, model, lookin, output_file,
+                            obtype_list, valid_beg, valid_end)
+            for model, lookin, output_file in job_list
+        ]
+        for future in futures:
+            future.result()
+
+if __name__ == '__main__':
+    main()
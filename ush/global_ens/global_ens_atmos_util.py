@@ -1321,6 +1321,45 @@ def condense_model_stat_files(logger, input_dir, output_file, model, obs,
             with open(output_file, 'w') as f:
                 f.write(met_header_cols+all_grep_output)
 
+def align_valid_dates(logger, model_stat_file_df, model_num_df_index,
+                      model_stat_file):
+    """! Align a model's stat file lines to the model's valid dates,
+         using the first line for valid dates with multiple lines
+
+         Args:
+             logger             - logger object
+             model_stat_file_df - dataframe of the model's
+                                  stat file lines
+             model_num_df_index - index of model and valid dates
+                                  (MultiIndex)
+             model_stat_file    - path to model's stat file (string)
+
+         Returns:
+             model_num_df - dataframe of the stat file lines on
+                            model_num_df_index, NaN for valid
+                            dates with no lines
+    """
+    nlines = len(model_stat_file_df)
+    model_stat_file_df = model_stat_file_df.drop_duplicates(
+        subset='FCST_VALID_BEG', keep='first'
+    )
+    if len(model_stat_file_df) != nlines:
+        logger.debug(f"Multiple lines matching valid dates in "
+                     +f"{model_stat_file} using first one")
+    valid_dates = model_num_df_index.get_level_values('valid_dates')
+    model_num_df = model_stat_file_df.set_index(
+        'FCST_VALID_BEG', drop=False
+    ).reindex(valid_dates)
+    model_num_df.index = model_num_df_index
+    missing_valid_dates = valid_dates[
+        ~valid_dates.isin(model_stat_file_df['FCST_VALID_BEG'])
+    ]
+    if len(missing_valid_dates) != 0:
+        logger.debug("No data matching valid dates "
+                     +f"{', '.join(missing_valid_dates)} in "
+                     +f"{model_stat_file}")
+    return model_num_df
+
 def build_df(logger, input_dir, output_dir, model_info_dict,
              plot_info_dict, date_info_dict, met_info_dict,
              dates, met_format_valid_dates):
@@ -1354,6 +1393,7 @@ def build_df(logger, input_dir, output_dir, model_info_dict,
             df_dtype_dict[col] = str
         else:
             df_dtype_dict[col] = np.float64
+    model_num_df_list = []
     for model_num in list(model_info_dict.keys()):
         model_num_name = (
             model_num+'/'+model_info_dict[model_num]['name']
@@ -1476,34 +1516,14 @@ def build_df(logger, input_dir, output_dir, model_info_dict,
                 na_values=['NA'], header=None
             )
             model_stat_file_df = model_stat_file_df.astype(df_dtype_dict)
-            for valid_date in met_format_valid_dates:
-                model_stat_file_df_valid_date_idx_list = (
-                    model_stat_file_df.index[
-                        model_stat_file_df['FCST_VALID_BEG'] == valid_date
-                    ]
-                ).tolist()
-                if len(model_stat_file_df_valid_date_idx_list) == 0:
-                    logger.debug(f"No data matching valid date {valid_date} "
-                                 +f"in {parsed_model_stat_file}")
-                    continue
-                elif len(model_stat_file_df_valid_date_idx_list) > 1:
-                    logger.debug(f"Multiple lines matching valid date "
-                                 +f"{valid_date} in {parsed_model_stat_file}"
-                                 +f"using first one")
-                else:
-                    logger.debug(f"One line matching valid date "
-                                 +f"{valid_date} in {parsed_model_stat_file}")
-                model_num_df.loc[(model_num_name, valid_date)] = (
-                    model_stat_file_df.loc\
-                    [model_stat_file_df_valid_date_idx_list[0]]\
-                    [:]
-                )
+            model_num_df = align_valid_dates(
+                logger, model_stat_file_df, model_num_df_index,
+                parsed_model_stat_file
+            )
         else:
             logger.warning(f"{parsed_model_stat_file} does not exist")
-        if model_num == 'model1':
-            all_model_df = model_num_df
-        else:
-            all_model_df = pd.concat([all_model_df, model_num_df])
+        model_num_df_list.append(model_num_df)
+    all_model_df = pd.concat(model_num_df_list)
     return all_model_df
 
 def calculate_stat(logger, data_df, line_type, stat):
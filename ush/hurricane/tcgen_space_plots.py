@@ -0,0 +1,315 @@
+##Python script to plot TC genesis HITS, FALSE ALARMS, and HITS/FALSE ALARMS
+##for all basins and models in one run.
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+import cartopy
+import cartopy.crs as ccrs
+import cartopy.feature as cfeature
+
+cartopyDataDir = os.environ['cartopyDataDir']
+cartopy.config['data_dir'] = cartopyDataDir
+
+# Map settings and the hand-placed labels of each basin.
+# PLS NOTE THAT THE extent is diff from tick marks and that is by design.
+# The lat/lon labels are a roundabout for the known issues with
+# cartopy LCC/Northpolarstero projection.
+BASIN_SPECS = {
+    'al': {
+        'domain': 'atlantic',
+        'central_longitude': -55.0,
+        'extent': [260, 370, -5, 50],
+        'xticks': [-130, -120, -110, -100, -90, -80, -70, -60, -50, -40,
+                   -30, -20, -10, 0, 10],
+        'yticks': [-5, 0, 10, 20, 30, 40, 50],
+        'coastline_width': 0.30,
+        'gshhs_color': 'black',
+        'labels': [
+            ("0 ", (-6,18)), ("10N ", (-15,52)), ("20N ", (-15,85)),
+            ("30N ", (-15,120)), ("40N ", (-15,157)),
+            ("90W ", (27,-5)), ("80W ", (60,-5)), ("70W ", (92,-5)),
+            ("60W ", (125,-5)), ("50W ", (157,-5)), ("40W ", (189,-5)),
+            ("30W ", (220,-5)), ("20W ", (253,-5)), ("10W ", (286,-5)),
+            ("0 ", (323,-5)),
+        ],
+        'legend': {
+            'hits': {'marker_loc': (346, 47), 'label_loc': (286,185)},
+            'false': {'marker_loc': (346, 47), 'label_loc': (286,185)},
+            'hitfalse': {'hits_marker_loc': (346, 47.5),
+                         'false_marker_loc': (346, 45),
+                         'hits_label_loc': (286,186),
+                         'false_label_loc': (286,177)},
+        },
+    },
+    'ep': {
+        'domain': 'eastpac',
+        'central_longitude': -60.0,
+        'extent': [180, 290, 0, 50],
+        'xticks': [-70, -80, -90, -100, -110, -120, -130, -140, -150, -160,
+                   -170, -180],
+        'yticks': [0, 10, 20, 30, 40, 50],
+        'coastline_width': 0.30,
+        'gshhs_color': 'black',
+        'labels': [
+            ("40N ", (-15,140)), ("30N ", (-15,104)), ("20N ", (-15,69)),
+            ("10N ", (-15,35)),
+            ("80W ", (318,-5)), ("90W ", (286,-5)), ("100W ", (250,-5)),
+            ("110W ", (218,-5)), ("120W ", (185,-5)), ("130W ", (152,-5)),
+            ("140W ", (119,-5)), ("150W ", (87,-5)), ("160W ", (55,-5)),
+            ("170W ", (23,-5)),
+        ],
+        'legend': {
+            'hits': {'marker_loc': (185, 47), 'label_loc': (20,168)},
+            'false': {'marker_loc': (185, 47), 'label_loc': (20,168)},
+            'hitfalse': {'hits_marker_loc': (185, 47),
+                         'false_marker_loc': (185, 45),
+                         'hits_label_loc': (20,168),
+                         'false_label_loc': (20,160)},
+        },
+    },
+    'wp': {
+        'domain': 'westpac',
+        'central_longitude': 80.0,
+        'extent': [100, 180, 0, 50],
+        'xticks': [100, 110, 120, 130, 140, 150, 160, 170, 180],
+        'yticks': [0, 10, 20, 30, 40, 50],
+        'coastline_width': 0.80,
+        'gshhs_color': cfeature.COLORS['water'],
+        'labels': [
+            ("40N ", (-15,191)), ("30N ", (-15,141)), ("20N ", (-15,94)),
+            ("10N ", (-15,47)),
+            ("110E ", (36,-5)), ("120E ", (83,-5)), ("130E ", (128,-5)),
+            ("140E ", (171,-5)), ("150E ", (216,-5)), ("160E ", (262,-5)),
+            ("170E ", (305,-5)),
+        ],
+        'legend': {
+            'hits': {'marker_loc': (160, 47), 'label_loc': (272,230)},
+            'false': {'marker_loc': (160, 47), 'label_loc': (272,230)},
+            'hitfalse': {'hits_marker_loc': (160, 47),
+                         'false_marker_loc': (160, 45.5),
+                         'hits_label_loc': (272,230),
+                         'false_label_loc': (272,221)},
+        },
+    },
+}
+# GIF name head of each plot type
+GIF_NAME_HEADS = {'hits': 'tcgen_hits', 'false': 'tcgen_falseAlarm',
+                  'hitfalse': 'tcgen_HitFalse'}
+HITS_STYLE = {'marker': 'o', 'color': 'green', 's': 12, 'facecolor': 'none'}
+FALSE_STYLE = {'marker': 's', 'color': 'red', 's': 12, 'facecolor': 'none'}
+
+# Figures with the static background of each basin already drawn
+_BASEMAP_CACHE = {}
+
+
+def get_basemap(basin):
+    """! Get the figure with the map background of a basin, drawing
+         it only the first time it is asked for
+
+         Args:
+             basin - basin abbreviation, al, ep, or wp (string)
+
+         Returns:
+             fig - figure with the basin map background (Figure)
+             ax  - map axes of the figure (GeoAxes)
+    """
+    if basin not in _BASEMAP_CACHE:
+        basin_spec = BASIN_SPECS[basin]
+        fig = plt.figure()
+        ax = plt.axes(projection=ccrs.Miller(
+            central_longitude=basin_spec['central_longitude']
+        ))
+        ax.set_extent(basin_spec['extent'], crs=ccrs.PlateCarree())
+        ax.gridlines(xlocs=basin_spec['xticks'], ylocs=basin_spec['yticks'],
+                     color='gray', alpha=0.9, linestyle='--')
+        ###Add topography, lakes, borders etc
+        ax.coastlines('10m', linewidth=basin_spec['coastline_width'],
+                      color='black')
+        ax.add_feature(cfeature.GSHHSFeature('low', levels=[2],
+                                             facecolor='white'),
+                       color=basin_spec['gshhs_color'], linewidth=0.1)
+        land_10m = cfeature.NaturalEarthFeature('physical', 'land', '10m',
+                                                edgecolor='face',
+                                                facecolor='None')
+        ax.add_feature(cfeature.LAKES)
+        ax.add_feature(cfeature.BORDERS)
+        ax.add_feature(land_10m)
+        for label, label_loc in basin_spec['labels']:
+            ax.annotate(label, (0,0), label_loc, xycoords='axes fraction',
+                        textcoords='offset points', va='top', color='Black',
+                        fontsize=6.5)
+        _BASEMAP_CACHE[basin] = (fig, ax)
+    return _BASEMAP_CACHE[basin]
+
+
+def read_genmpr_events(genmpr_file, event_line_tags):
+    """! Read the event locations from a TC-Gen GENMPR file
+
+         Args:
+             genmpr_file     - path to TC-Gen GENMPR file (string)
+             event_line_tags - text marking the lines of the wanted
+                               events, matched in order (list of strings)
+
+         Returns:
+             lat - event latitudes (array)
+             lon - event longitudes shifted by 360 (array)
+    """
+    event_lines = []
+    if os.path.exists(genmpr_file):
+        with open(genmpr_file, 'r') as genmpr:
+            genmpr_lines = genmpr.readlines()
+        for event_line_tag in event_line_tags:
+            event_lines.extend(
+                [line.split() for line in genmpr_lines
+                 if event_line_tag in line]
+            )
+    else:
+        print("WARNING: "+genmpr_file+" does not exist")
+    lat = np.array([float(event_line[31]) for event_line in event_lines])
+    lon = np.array([float(event_line[32]) for event_line in event_lines])
+    return lat, lon + 360.
+
+
+def save_tcgen_plot(basin, plot_type, hits, fals, title, output_file):
+    """! Draw the events of one plot over the basin map background,
+         save it, and remove them again from the background
+
+         Args:
+             basin       - basin abbreviation, al, ep, or wp (string)
+             plot_type   - hits, false, or hitfalse (string)
+             hits        - hit latitudes and longitudes (tuple of arrays)
+             fals        - false alarm latitudes and longitudes
+                           (tuple of arrays)
+             title       - plot title (string)
+             output_file - path to save plot to (string)
+    """
+    fig, ax = get_basemap(basin)
+    legend_spec = BASIN_SPECS[basin]['legend'][plot_type]
+    plot_artists = []
+    if plot_type == 'hits':
+        event_list = [(hits, HITS_STYLE, legend_spec['marker_loc'],
+                       "Hits", 'Green', legend_spec['label_loc'])]
+    elif plot_type == 'false':
+        event_list = [(fals, FALSE_STYLE, legend_spec['marker_loc'],
+                       "False alarms", 'Red', legend_spec['label_loc'])]
+    elif plot_type == 'hitfalse':
+        event_list = [
+            (hits, HITS_STYLE, legend_spec['hits_marker_loc'],
+             "Hits", 'Green', legend_spec['hits_label_loc']),
+            (fals, FALSE_STYLE, legend_spec['false_marker_loc'],
+             "False alarms", 'Red', legend_spec['false_label_loc'])
+        ]
+    #Plot all events at once
+    for (lat, lon), style, marker_loc, label, color, label_loc in event_list:
+        plot_artists.append(
+            ax.scatter(lon, lat, transform=ccrs.PlateCarree(), **style)
+        )
+    for (lat, lon), style, marker_loc, label, color, label_loc in event_list:
+        plot_artists.append(
+            ax.scatter(marker_loc[0], marker_loc[1],
+                       transform=ccrs.PlateCarree(), **style)
+        )
+        plot_artists.append(
+            ax.annotate(label+" ("+str(len(lat))+")", (0,0), label_loc,
+                        xycoords='axes fraction', textcoords='offset points',
+                        va='top', color=color, fontsize=6.5)
+        )
+    ax.set_title(title)
+    fig.savefig(output_file, dpi=160, bbox_inches='tight')
+    for plot_artist in plot_artists:
+        plot_artist.remove()
+
+
+def convert_png_to_gif(png_file, gif_file):
+    """! Convert a PNG image to a GIF image in process and remove the
+         PNG image
+
+         Args:
+             png_file - path to PNG image (string)
+             gif_file - path to write GIF image to (string)
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        # Pillow is installed with matplotlib, use ImageMagick without it
+        subprocess.run(['convert', png_file, gif_file], check=True)
+    else:
+        with Image.open(png_file) as png_img:
+            gif_img = png_img.convert('RGB').quantize(colors=256)
+        gif_img.save(gif_file, format='GIF', optimize=True)
+    os.remove(png_file)
+
+
+def main():
+    YEAR = os.environ['YEAR']
+    DATA = os.environ['DATA']
+    COMINstats = os.environ['COMINstats']
+    TCGENdays = os.environ['TCGENdays']
+    basin_list = os.environ['basinlist'].split()
+    model_list = os.environ['modellist'].split()
+    nthreads = int(os.environ.get('tcgen_convert_nthreads', '4'))
+    plot_time = 0.
+    convert_job_list = []
+    executor = ThreadPoolExecutor(max_workers=max(1, nthreads))
+    for basin in basin_list:
+        if basin not in BASIN_SPECS:
+            print("WARNING: No map settings for basin "+basin+", skipping")
+            continue
+        for model in model_list:
+            output_dir = os.path.join(DATA, basin+'_'+model)
+            if not os.path.exists(output_dir):
+                os.makedirs(output_dir)
+            genmpr_file = os.path.join(
+                COMINstats, 'tc_gen_'+YEAR+'_genmpr_'+basin+'_'+model+'.txt'
+            )
+            hits = read_genmpr_events(genmpr_file, ['00    FYOY'])
+            fals = read_genmpr_events(genmpr_file,
+                                      ['00    FYON', 'NA    FYON'])
+            for plot_type in ['hits', 'false', 'hitfalse']:
+                output_file = os.path.join(
+                    output_dir, 'TC_genesis_'+plot_type+'.png'
+                )
+                print("Plotting "+output_file)
+                start_time = time.perf_counter()
+                save_tcgen_plot(basin, plot_type, hits, fals, TCGENdays,
+                                output_file)
+                plot_time+=time.perf_counter()-start_time
+                #Convert to gif while the next plot is drawn
+                gif_file = os.path.join(
+                    output_dir,
+                    GIF_NAME_HEADS[plot_type]+'_'+basin+'_'+model+'.gif'
+                )
+                convert_job_list.append(
+                    (gif_file, executor.submit(convert_png_to_gif,
+                                               output_file, gif_file))
+                )
+    start_time = time.perf_counter()
+    nfailed = 0
+    for gif_file, convert_job in convert_job_list:
+        try:
+            convert_job.result()
+        except (OSError, ValueError, subprocess.CalledProcessError) as e:
+            print("WARNING: Could not make "+gif_file+": "+str(e))
+            nfailed+=1
+    executor.shutdown()
+    print("Plotted "+str(len(convert_job_list))+" images in "
+          +"%.2f" % plot_time+" seconds, finished converting to gif "
+          +"%.2f" % (time.perf_counter()-start_time)+" seconds later")
+    if nfailed != 0:
+        print("WARNING: "+str(nfailed)+" of "+str(len(convert_job_list))
+              +" images could not be converted to gif")
+##The logos are added to the gifs in the bash script.
+
+
+if __name__ == '__main__':
+    main()
@@ -2,16 +2,21 @@
 from datetime import datetime, timedelta as td
 import os
 import sys
-import requests
 import numpy as np
 import mesoscale_util as cutil
+import mesoscale_spc_otlk_util as otlk_util
 
 VDATE = os.environ['VDATE']
 VHOUR = os.environ['VHOUR']
 DAY = os.environ['DAY']
-metplus_launcher = os.environ['metplus_launcher']
 EVSINspcotlk = os.environ['EVSINspcotlk']
-MET_PLUS_CONF = os.environ['MET_PLUS_CONF']
+MET_PLUS_OUT = os.environ['MET_PLUS_OUT']
+VERIF_TYPE = os.environ['VERIF_TYPE']
+NEST = os.environ['NEST']
+GRID_POLY_LIST = os.environ['GRID_POLY_LIST']
+GENVXMASK_OUTPUT_DIR = os.path.join(
+    MET_PLUS_OUT, VERIF_TYPE, 'genvxmask', f'{NEST}.{VDATE}'
+)
 
 vdate_dt = datetime.strptime(VDATE,'%Y%m%d')
 VDATEp1 = (vdate_dt + td(days=1)).strftime('%Y%m%d')
@@ -29,6 +34,7 @@ else:
     print(f"ERROR: Invalid day in DAYS: {DAY}")
     sys.exit(1)
 
+otlk_list = []
 for OTLK in OTLKs:
     if int(DAY) == 1:
         if int(VHOUR) < 12: 
@@ -85,48 +91,32 @@ for OTLK in OTLKs:
     NEST_INPUT_TEMPLATE = (
         f"spc_otlk.{VDATE}/{SHP_FILE}.shp"
     )
-    os.environ['SHP_FILE'] = SHP_FILE
-    os.environ['NEST_INPUT_TEMPLATE'] = NEST_INPUT_TEMPLATE
     if os.path.isfile(os.path.join(EVSINspcotlk,NEST_INPUT_TEMPLATE)):
-        try:
-            N_REC = cutil.run_shell_command([
-                'gis_dump_dbf', 
-                os.path.join(EVSINspcotlk,f"spc_otlk.{VDATE}/{SHP_FILE}.dbf"), 
-                '|', 'grep', 'n_records', '|', 'cut', '-d\'=\'', '-f2', '|', 'tr', 
-                '-d', '\' \''
-            ], capture_output=True)
-            print(f"Processing {N_REC} records.")
-            if int(N_REC) > 0:
-                for REC in np.arange(int(N_REC)):
-                    NAME = cutil.run_shell_command([
-                        'gis_dump_dbf', 
-                        os.path.join(EVSINspcotlk,f"spc_otlk.{VDATE}/{SHP_FILE}.dbf"), 
-                        '|', 'egrep', '-A', '5', f'"^Record {REC}"', '|', 'tail',
-                        '-1', '|', 'cut', '-d\'"\'', '-f2'
-                    ], capture_output=True)
-                    NAME = NAME.replace('\n','')
-                    print(f"Processing Record #{REC}: {NAME}")
-                    MASK_FNAME = f"spc_otlk_d{DAY}_{OTLK}_{NAME}_v{V1DATE}{V1HOUR}-{V2DATE}{V2HOUR}_for{VHOUR}Z"
-                    if int(DAY) == 3:
-                        MASK_NAME = f"DAY{DAY}_{NAME}"
-                    else:
-                        MASK_NAME = f"DAY{DAY}_{OTLK}_{NAME}"
-                    os.environ['REC'] = str(REC)
-                    os.environ['MASK_FNAME'] = MASK_FNAME
-                    os.environ['MASK_NAME'] = MASK_NAME
-
-                    cutil.run_shell_command([
-                        metplus_launcher, '-c', 
-                        os.path.join(MET_PLUS_CONF, 'GenVxMask_SPC_OTLK.conf')
-                    ])
-            else:
-                print(f"No day {DAY} outlook areas were issued at {OTLK}Z on {IDATE}")
-                continue
-        except IOError as e:
-            print(f"ERROR: {e}")
-            print(f"The following file was deleted or corrupted while trying "
-                  + f"to open it: {os.path.join(EVSINspcotlk,NEST_INPUT_TEMPLATE)}")
-            sys.exit(1)
+        MASK_FNAME = f"spc_otlk_d{DAY}_{OTLK}_{{NAME}}_v{V1DATE}{V1HOUR}-{V2DATE}{V2HOUR}_for{VHOUR}Z"
+        if int(DAY) == 3:
+            MASK_NAME = f"DAY{DAY}_{{NAME}}"
+        else:
+            MASK_NAME = f"DAY{DAY}_{OTLK}_{{NAME}}"
+        otlk_list.append({
+            'shp_file': os.path.join(EVSINspcotlk,NEST_INPUT_TEMPLATE),
+            'mask_fname': MASK_FNAME,
+            'mask_name': MASK_NAME
+        })
     else:
         print(f"No day {DAY} outlook areas were issued at {OTLK}Z on {IDATE}")
         continue
+
+# Read all outlook shapefiles and write the masks for all records and
+# issuance times in one call; rasterized masks are cached per shapefile
+# and grid so the other valid hours reuse them
+try:
+    otlk_util.gen_spc_otlk_masks(
+        otlk_list, GRID_POLY_LIST, GENVXMASK_OUTPUT_DIR,
+        cache_dir=os.path.join(MET_PLUS_OUT, VERIF_TYPE, 'genvxmask',
+                               'spc_otlk_mask_cache')
+    )
+except IOError as e:
+    print(f"ERROR: {e}")
+    print(f"An SPC outlook file was deleted or corrupted while trying "
+          + f"to open it: {[otlk['shp_file'] for otlk in otlk_list]}")
+    sys.exit(1)
@@ -1474,6 +1474,186 @@ def calculate_bootstrap_ci(logger, bs_method, model_data, stat, nrepl, level,
       dict(CI_LOWER=[stat_ci_lower], CI_UPPER=[stat_ci_upper], STATUS=[status])
    )
 
+def get_roc_stat_arrays(ctc_counts):
+   """! Calculate the ROC points and the area under the ROC curve
+        from contingency table counts, all at once
+
+        Args:
+           ctc_counts - array of the FY_OY, FY_ON, FN_OY, FN_ON
+                        counts in the last axis, and thresholds
+                        in the axis before it
+
+        Returns:
+           pofd       - array of the probability of false detection
+                        for each threshold
+           pod        - array of the probability of detection
+                        for each threshold
+           auc        - array of the area under the ROC curve
+                        through all thresholds
+   """
+   fy_oy, fy_on, fn_oy, fn_on = np.moveaxis(ctc_counts, -1, 0)
+   with np.errstate(divide='ignore', invalid='ignore'):
+      pod = fy_oy/(fy_oy + fn_oy)
+      pofd = fy_on/(fy_on + fn_on)
+   # Sort the points along the curve; undefined points sort last and
+   # are moved to (1,1) so they add no area
+   curve_idx = np.argsort(pofd, axis=-1)
+   curve_x = np.take_along_axis(pofd, curve_idx, axis=-1)
+   curve_y = np.take_along_axis(pod, curve_idx, axis=-1)
+   curve_nan = np.isnan(curve_x) | np.isnan(curve_y)
+   curve_x = np.where(curve_nan, 1., curve_x)
+   curve_y = np.where(curve_nan, 1., curve_y)
+   pad_shape = curve_x.shape[:-1]+(1,)
+   curve_x = np.concatenate(
+      (np.zeros(pad_shape), curve_x, np.ones(pad_shape)), axis=-1
+   )
+   curve_y = np.concatenate(
+      (np.zeros(pad_shape), curve_y, np.ones(pad_shape)), axis=-1
+   )
+   auc = np.sum(
+      np.diff(curve_x, axis=-1)*(curve_y[...,1:]+curve_y[...,:-1])/2.,
+      axis=-1
+   )
+   auc = np.where(np.all(curve_nan, axis=-1), np.nan, auc)
+   return pofd, pod, auc
+
+def calculate_roc_curve(logger, df, stat_list, confidence_intervals=False,
+                        bs_method='MATCHED_PAIRS', nrepl=5000, level=.95,
+                        bs_min_samp=30):
+   """! Calculate the ROC statistics and the area under the ROC curve
+        for all models and thresholds at once from the CTC lines, and
+        their bootstrap confidence intervals from one set of
+        resampled counts
+
+        Args:
+           df                   - Dataframe of the CTC lines, with
+                                  MODEL and FCST_THRESH_VALUE columns
+           stat_list            - list of the statistic names to
+                                  return: pofd (farate) and/or
+                                  pod (hrate)
+           confidence_intervals - boolean to compute the bootstrap
+                                  confidence intervals
+           bs_method            - string of the method to use to
+                                  calculate the bootstrap confidence
+                                  intervals
+           nrepl                - integer of resamples that create the
+                                  bootstrap distribution
+           level                - float confidence level (0.-1.) of the
+                                  confidence interval
+           bs_min_samp          - minimum number of samples allowed for
+                                  confidence intervals to be computed
+
+        Returns:
+           stat_df              - Dataframe indexed on MODEL and
+                                  FCST_THRESH_VALUE of the statistics,
+                                  and their _BLERR and _BUERR
+                                  confidence interval bounds
+           auc_df               - Dataframe indexed on MODEL of the
+                                  area under the ROC curve (AUC), and
+                                  its bounds
+           status               - integer to provide the parent script
+                                  with information about the outcome
+                                  of the bootstrap resampling
+   """
+   status = 0
+   stat_index_dict = {'pofd': 0, 'farate': 0, 'pod': 1, 'hrate': 1}
+   for stat in stat_list:
+      if stat not in stat_index_dict:
+         e = f"{stat} is not a ROC statistic (pofd, farate, pod, hrate)"
+         logger.error(e)
+         raise ValueError(e)
+   ctc_cols = ['FY_OY', 'FY_ON', 'FN_OY', 'FN_ON']
+   model_list = sorted(df['MODEL'].unique())
+   thresh_list = sorted(df['FCST_THRESH_VALUE'].unique())
+   # Pivot the counts into a (case, model, threshold, count) array, a
+   # case being the valid time and lead of a line
+   case_cols = ['FCST_VALID_BEG', 'FCST_LEAD']
+   df_counts = df.pivot_table(
+      index=case_cols, columns=['MODEL', 'FCST_THRESH_VALUE'],
+      values=ctc_cols, aggfunc='sum', fill_value=0.
+   ).reindex(
+      columns=pd.MultiIndex.from_product(
+         [ctc_cols, model_list, thresh_list]
+      ),
+      fill_value=0.
+   )
+   ctc_counts = np.moveaxis(
+      df_counts.values.astype(float).reshape(
+         len(df_counts), len(ctc_cols), len(model_list), len(thresh_list)
+      ),
+      1, -1
+   )
+   ctc_counts_all = ctc_counts.sum(axis=0)
+   stat_arrays = get_roc_stat_arrays(ctc_counts_all)
+   stat_index = pd.MultiIndex.from_product(
+      [model_list, thresh_list], names=['MODEL', 'FCST_THRESH_VALUE']
+   )
+   stat_df = pd.DataFrame(index=stat_index)
+   for stat in stat_list:
+      stat_df[str(stat).upper()] = (
+         stat_arrays[stat_index_dict[stat]].ravel()
+      )
+   auc_df = pd.DataFrame(
+      {'AUC': stat_arrays[2]}, index=pd.Index(model_list, name='MODEL')
+   )
+   if not confidence_intervals:
+      return stat_df, auc_df, status
+   # Resample once; the statistics and the AUC all use the same counts
+   rng = np.random.default_rng()
+   if str(bs_method).upper() == 'MATCHED_PAIRS':
+      total_all = ctc_counts_all.sum(axis=-1)
+      if np.any(total_all < bs_min_samp):
+         logger.warning(f"Sample too small for bootstrapping. (Matched pairs"
+                        + f" sample size: {total_all.min()}; minimum sample"
+                        + f" size: {bs_min_samp}")
+         status = 1
+         return stat_df, auc_df, status
+      # sample over events in the aggregated contingency tables
+      ctc_counts_samp = rng.multinomial(
+         total_all.astype(int), ctc_counts_all/total_all[...,np.newaxis],
+         size=(nrepl,)+total_all.shape
+      ).astype(float)
+   elif str(bs_method).upper() == 'FORECASTS':
+      nlines = df.groupby(['MODEL', 'FCST_THRESH_VALUE']).size()
+      if nlines.min() < bs_min_samp or len(nlines) < stat_index.size:
+         logger.warning(f"Sample too small for bootstrapping. (Forecasts"
+                        + f" sample size: {nlines.min()}; minimum sample"
+                        + f" size: {bs_min_samp}")
+         status = 1
+         return stat_df, auc_df, status
+      # sample over cases, the same cases for all models and thresholds
+      ncase = len(ctc_counts)
+      case_weights = rng.multinomial(
+         ncase, np.full(ncase, 1./ncase), size=nrepl
+      ).astype(float)
+      ctc_counts_samp = np.einsum('rc,c...->r...', case_weights, ctc_counts)
+   else:
+      logger.error(bs_method+" is not a valid option")
+      exit(1)
+   lower_pctile = 100.*((1.-level)/2.)
+   upper_pctile = 100.-lower_pctile
+   stat_arrays_samp = get_roc_stat_arrays(ctc_counts_samp)
+   with warnings.catch_warnings():
+      warnings.simplefilter('ignore', category=RuntimeWarning)
+      stat_ci = [
+         np.nanpercentile(
+            stat_array_samp - stat_array, [lower_pctile, upper_pctile],
+            axis=0
+         )
+         for stat_array, stat_array_samp
+         in zip(stat_arrays, stat_arrays_samp)
+      ]
+   for stat in stat_list:
+      stat_df[str(stat).upper()+'_BLERR'] = (
+         stat_ci[stat_index_dict[stat]][0].ravel()
+      )
+      stat_df[str(stat).upper()+'_BUERR'] = (
+         stat_ci[stat_index_dict[stat]][1].ravel()
+      )
+   auc_df['AUC_BLERR'] = stat_ci[2][0]
+   auc_df['AUC_BUERR'] = stat_ci[2][1]
+   return stat_df, auc_df, status
+
 def calculate_stat(logger, model_data, stat):
    """! Calculate the statistic from the data from the
         read in MET .stat file(s)
@@ -23,8 +23,11 @@ import matplotlib
 matplotlib.use('agg')
 import matplotlib.pyplot as plt
 import matplotlib.colors as colors
+import matplotlib.cm as cm
 import matplotlib.image as mpimg
 from matplotlib.offsetbox import OffsetImage, AnnotationBbox
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from datetime import datetime, timedelta as td
 
 
@@ -47,6 +50,8 @@ paths = Paths()
 presets = Presets()
 model_colors = ModelSpecs()
 reference = Reference()
+# Rendered performance diagram backgrounds, by style, axes size and dpi
+BACKGROUND_CACHE = {}
 
 
 # =================== FUNCTIONS =========================
@@ -57,6 +62,72 @@ def get_bias_label_position(bias_value, radius):
     y = np.sqrt(np.power(radius, 2) - np.power(x, 2))
     return (x, y)
 
+def draw_performance_diagram_background(fig, ax, cmap, dpi, 
+                                        clabel_font_size=None):
+    # The CSI contours and frequency bias lines are the same on every
+    # performance diagram, so render them once per style, axes size and dpi
+    # and draw the image behind the model points
+    grid_min = 0.001
+    grid_max = 1.
+    x_min, x_max = ax.get_xlim()
+    y_min, y_max = ax.get_ylim()
+    ax_pos = ax.get_position()
+    fig_width, fig_height = fig.get_size_inches()
+    width = fig_width*ax_pos.width*(grid_max-grid_min)/(x_max-x_min)
+    height = fig_height*ax_pos.height*(grid_max-grid_min)/(y_max-y_min)
+    csi_contour_vals = np.arange(0., 1.1, 0.1)
+    cache_key = (
+        tuple(cmap.colors), round(width, 3), round(height, 3), dpi, 
+        clabel_font_size
+    )
+    if cache_key not in BACKGROUND_CACHE:
+        fig_bg = Figure(figsize=(width, height), dpi=dpi)
+        canvas_bg = FigureCanvasAgg(fig_bg)
+        ax_bg = fig_bg.add_axes([0., 0., 1., 1.])
+        ax_bg.set_axis_off()
+        grid_ticks = np.arange(0.001, 1.001, 0.001)
+        sr_g, pod_g = np.meshgrid(grid_ticks, grid_ticks)
+        bias = pod_g / sr_g
+        csi = 1.0 / (1.0 / sr_g + 1.0 / pod_g - 1.0)
+        bias_contour_vals = [
+            0.1, 0.2, 0.4, 0.6, 0.8, 1., 1.2, 1.5, 2., 3., 5., 10.
+        ]
+        b_contour = ax_bg.contour(
+            sr_g, pod_g, bias, bias_contour_vals, 
+            colors='gray', linestyles='dashed'
+        )
+        ax_bg.contourf(
+            sr_g, pod_g, csi, csi_contour_vals, cmap=cmap, extend='neither'
+        )
+        ax_bg.set_xlim(grid_min, grid_max)
+        ax_bg.set_ylim(grid_min, grid_max)
+        clabel_kwargs = {}
+        if clabel_font_size is not None:
+            clabel_kwargs['fontsize'] = clabel_font_size
+        ax_bg.clabel(
+            b_contour, fmt='%1.1f', 
+            manual=[
+                get_bias_label_position(bias_value, .75) 
+                for bias_value in bias_contour_vals
+            ],
+            **clabel_kwargs
+        )
+        canvas_bg.draw()
+        BACKGROUND_CACHE[cache_key] = np.asarray(
+            canvas_bg.buffer_rgba()
+        ).copy()
+    ax.imshow(
+        BACKGROUND_CACHE[cache_key], 
+        extent=(grid_min, grid_max, grid_min, grid_max), origin='upper', 
+        aspect='auto', interpolation='none', zorder=0
+    )
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(y_min, y_max)
+    # Stands in for the CSI contours in the colorbar
+    return cm.ScalarMappable(
+        norm=colors.BoundaryNorm(csi_contour_vals, cmap.N), cmap=cmap
+    )
+
 def plot_performance_diagram(df: pd.DataFrame, logger: logging.Logger, 
                       date_range: tuple, model_list: list, num: int = 0, 
                       level: str = '500', flead='all', thresh: list = ['<20'], 
@@ -545,27 +616,6 @@ def plot_performance_diagram(df: pd.DataFrame, logger: logging.Logger,
     ]
 
     cmap = colors.ListedColormap(gray_colors)
-    grid_ticks = np.arange(0.001, 1.001, 0.001)
-    sr_g, pod_g = np.meshgrid(grid_ticks, grid_ticks)
-    bias = pod_g / sr_g
-    csi = 1.0 / (1.0 / sr_g + 1.0 / pod_g - 1.0)
-    bias_contour_vals = [
-        0.1, 0.2, 0.4, 0.6, 0.8, 1., 1.2, 1.5, 2., 3., 5., 10.
-    ]
-    b_contour = plt.contour(
-        sr_g, pod_g, bias, bias_contour_vals, 
-        colors='gray', linestyles='dashed'
-    )
-    csi_contour = plt.contourf(
-        sr_g, pod_g, csi, np.arange(0., 1.1, 0.1), cmap=cmap, extend='neither'
-    )
-    plt.clabel(
-        b_contour, fmt='%1.1f', 
-        manual=[
-            get_bias_label_position(bias_value, .75) 
-            for bias_value in bias_contour_vals
-        ]
-    )
     y_min = 0.
     y_max = 1.
     thresh_labels = pivot_metric1.index
@@ -769,10 +819,13 @@ def plot_performance_diagram(df: pd.DataFrame, logger: logging.Logger,
     )
 
     fig.subplots_adjust(bottom=.15, right=.77, left=.23, wspace=0, hspace=0)
+    csi_mappable = draw_performance_diagram_background(
+        fig, ax, cmap, dpi
+    )
     cax = fig.add_axes([.775, .2, .01, .725])
     cbar_ticks = [0.,.1,.2,.3,.4,.5,.6,.7,.8,.9,1.]
     cb = plt.colorbar(
-        csi_contour, orientation='vertical', cax=cax, ticks=cbar_ticks,
+        csi_mappable, orientation='vertical', cax=cax, ticks=cbar_ticks,
         spacing='uniform', drawedges=True
     )
     cb.dividers.set_color('black')
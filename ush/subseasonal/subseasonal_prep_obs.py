@@ -400,4 +400,8 @@ for OBS in OBSNAME:
             file.write('export err=$?; err_chk'+'\n')
             file.close()
 
+
+# Report expected files not found
+sub_util.report_missing_files()
+
 print("END: "+os.path.basename(__file__))
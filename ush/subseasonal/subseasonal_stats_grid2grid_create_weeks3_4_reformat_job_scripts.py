@@ -380,4 +380,8 @@ if JOB_GROUP in ['reformat_data', 'assemble_data']:
                     job.close()
                     date_dt = date_dt + datetime.timedelta(hours=valid_date_inc)
 
+
+# Report expected files not found
+sub_util.report_missing_files()
+
 print("END: "+os.path.basename(__file__))
@@ -141,7 +141,6 @@ while valid_hr <= int(valid_hr_end):
                       +days_avg_day_fhr_DATAROOT_input_file+" or "
                       +days_avg_day_fhr_COMIN_input_file)
             days_avg_day_fhr+=12
-        days_avg_df_list = []
         if os.path.exists(output_COMOUT_file):
             sub_util.copy_file(output_COMOUT_file, output_DATA_file)
             make_days_avg_output_file = False
@@ -164,99 +163,13 @@ while valid_hr <= int(valid_hr_end):
         if make_days_avg_output_file:
             print(f"DATA Output File: {output_DATA_file}")
             print(f"COMOUT Output File: {output_COMOUT_file}")
-            all_days_avg_df = pd.DataFrame(columns=MET_MPR_column_list)
-            for days_avg_file in days_avg_file_list:
-                with open(days_avg_file, 'r') as infile:
-                    input_file_header = infile.readline()
-                days_avg_file_df = pd.read_csv(days_avg_file, sep=" ", skiprows=1,
-                                                skipinitialspace=True, header=None,
-                                                names=MET_MPR_column_list,
-                                                na_filter=False, dtype=str)
-                all_days_avg_df = pd.concat(
-                    [all_days_avg_df, days_avg_file_df], ignore_index=True
-                )
-            for obtype in all_days_avg_df['OBTYPE'].unique():
-                all_days_avg_obtype_df = all_days_avg_df.loc[
-                    all_days_avg_df['OBTYPE'] == obtype
-                ]
-                for sid in all_days_avg_obtype_df['OBS_SID'].unique():
-                    all_days_avg_obtype_sid_df = (
-                        all_days_avg_obtype_df.loc[
-                            all_days_avg_obtype_df['OBS_SID'] == sid
-                        ]
-                    )
-                    for vx_mask \
-                            in all_days_avg_obtype_sid_df['VX_MASK'].unique():
-                        all_days_avg_obtype_sid_vx_mask_df = (
-                            all_days_avg_obtype_sid_df.loc[
-                                all_days_avg_obtype_sid_df['VX_MASK']\
-                                == vx_mask
-                            ]
-                        )
-                        if len(all_days_avg_obtype_sid_vx_mask_df) < 9:
-                            continue
-                        all_days_avg_obtype_sid_vx_mask_fcst_mean = (
-                            np.array(
-                                all_days_avg_obtype_sid_vx_mask_df['FCST']\
-                                .values, dtype=float
-                            ).mean()
-                        )
-                        all_days_avg_obtype_sid_vx_mask_obs_mean = (
-                            np.array(
-                                all_days_avg_obtype_sid_vx_mask_df['OBS']\
-                                .values, dtype=float
-                            ).mean()
-                        )
-                        if job_name == 'Days6_10Avg_Temp2m':
-                            all_days_avg_obtype_sid_vx_mask_climo_mean = (
-                                np.array(
-                                    all_days_avg_obtype_sid_vx_mask_df['CLIMO_MEAN']\
-                                    .values, dtype=float
-                                ).mean()
-                            )
-                        days_avg_obtype_sid_vx_mask_df = pd.DataFrame.copy(
-                            all_days_avg_obtype_sid_vx_mask_df.iloc[0,:],
-                            deep=True
-                        )
-                        days_avg_obtype_sid_vx_mask_df['FCST_LEAD'] = (
-                            str(days_avg_day_fhr_end).zfill(2)+'0000'
-                        )
-                        days_avg_obtype_sid_vx_mask_df['FCST_VALID_BEG'] = (
-                            days_avg_valid_end.strftime('%Y%m%d_%H%M%S')
-                        )
-                        days_avg_obtype_sid_vx_mask_df['FCST_VALID_END'] = (
-                            days_avg_valid_end.strftime('%Y%m%d_%H%M%S')
-                        )
-                        days_avg_obtype_sid_vx_mask_df['OBS_VALID_BEG'] = (
-                            days_avg_valid_end.strftime('%Y%m%d_%H%M%S')
-                        )
-                        days_avg_obtype_sid_vx_mask_df['OBS_VALID_END'] = (
-                            days_avg_valid_end.strftime('%Y%m%d_%H%M%S')
-                        )
-                        days_avg_obtype_sid_vx_mask_df['FCST_VAR'] = (
-                            days_avg_obtype_sid_vx_mask_df['FCST_VAR']
-                            +'_DAYS6_10AVG'
-                        )
-                        days_avg_obtype_sid_vx_mask_df['OBS_VAR'] = (
-                            days_avg_obtype_sid_vx_mask_df['OBS_VAR']
-                            +'_DAYS6_10AVG'
-                        )
-                        days_avg_obtype_sid_vx_mask_df['FCST'] = str(
-                            all_days_avg_obtype_sid_vx_mask_fcst_mean
-                        )
-                        days_avg_obtype_sid_vx_mask_df['OBS'] = str(
-                            all_days_avg_obtype_sid_vx_mask_obs_mean
-                        )
-                        if job_name == 'Days6_10Avg_Temp2m':
-                            days_avg_obtype_sid_vx_mask_df['CLIMO_MEAN'] = str(
-                                all_days_avg_obtype_sid_vx_mask_climo_mean
-                            )
-                        days_avg_df_list.append(
-                            days_avg_obtype_sid_vx_mask_df
-                        )
-            days_avg_df = pd.concat(
-                days_avg_df_list, axis=1, ignore_index=True
-            ).T
+            with open(days_avg_file_list[0], 'r') as infile:
+                input_file_header = infile.readline()
+            days_avg_df = sub_util.create_mpr_station_avg_df(
+                days_avg_file_list, MET_MPR_column_list, 9,
+                days_avg_day_fhr_end, days_avg_valid_end, '_DAYS6_10AVG',
+                job_name == 'Days6_10Avg_Temp2m'
+            )
             days_avg_df.to_csv(
                 output_DATA_file, header=input_file_header,
                 index=None, sep=' ', mode='w'
@@ -738,4 +738,8 @@ if USE_CFP == 'YES':
        iproc+=1
     poe_file.close()
 
+
+# Report expected files not found
+sub_util.report_missing_files()
+
 print("END: "+os.path.basename(__file__))
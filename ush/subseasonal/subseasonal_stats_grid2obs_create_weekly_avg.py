@@ -141,7 +141,6 @@ while valid_hr <= int(valid_hr_end):
                       +weekly_avg_day_fhr_DATAROOT_input_file+" or "
                       +weekly_avg_day_fhr_COMIN_input_file)
             weekly_avg_day_fhr+=12
-        weekly_avg_df_list = []
         if os.path.exists(output_COMOUT_file):
             sub_util.copy_file(output_COMOUT_file, output_DATA_file)
             make_weekly_avg_output_file = False
@@ -164,99 +163,13 @@ while valid_hr <= int(valid_hr_end):
         if make_weekly_avg_output_file:
             print(f"DATA Output File: {output_DATA_file}")
             print(f"COMOUT Output File: {output_COMOUT_file}")
-            all_weekly_avg_df = pd.DataFrame(columns=MET_MPR_column_list)
-            for weekly_avg_file in weekly_avg_file_list:
-                with open(weekly_avg_file, 'r') as infile:
-                    input_file_header = infile.readline()
-                weekly_avg_file_df = pd.read_csv(weekly_avg_file, sep=" ", skiprows=1,
-                                                skipinitialspace=True, header=None,
-                                                names=MET_MPR_column_list,
-                                                na_filter=False, dtype=str)
-                all_weekly_avg_df = pd.concat(
-                    [all_weekly_avg_df, weekly_avg_file_df], ignore_index=True
-                )
-            for obtype in all_weekly_avg_df['OBTYPE'].unique():
-                all_weekly_avg_obtype_df = all_weekly_avg_df.loc[
-                    all_weekly_avg_df['OBTYPE'] == obtype
-                ]
-                for sid in all_weekly_avg_obtype_df['OBS_SID'].unique():
-                    all_weekly_avg_obtype_sid_df = (
-                        all_weekly_avg_obtype_df.loc[
-                            all_weekly_avg_obtype_df['OBS_SID'] == sid
-                        ]
-                    )
-                    for vx_mask \
-                            in all_weekly_avg_obtype_sid_df['VX_MASK'].unique():
-                        all_weekly_avg_obtype_sid_vx_mask_df = (
-                            all_weekly_avg_obtype_sid_df.loc[
-                                all_weekly_avg_obtype_sid_df['VX_MASK']\
-                                == vx_mask
-                            ]
-                        )
-                        if len(all_weekly_avg_obtype_sid_vx_mask_df) < 12:
-                            continue
-                        all_weekly_avg_obtype_sid_vx_mask_fcst_mean = (
-                            np.array(
-                                all_weekly_avg_obtype_sid_vx_mask_df['FCST']\
-                                .values, dtype=float
-                            ).mean()
-                        )
-                        all_weekly_avg_obtype_sid_vx_mask_obs_mean = (
-                            np.array(
-                                all_weekly_avg_obtype_sid_vx_mask_df['OBS']\
-                                .values, dtype=float
-                            ).mean()
-                        )
-                        if job_name == 'WeeklyAvg_Temp2m':
-                            all_weekly_avg_obtype_sid_vx_mask_climo_mean = (
-                                np.array(
-                                    all_weekly_avg_obtype_sid_vx_mask_df['CLIMO_MEAN']\
-                                    .values, dtype=float
-                                ).mean()
-                            )
-                        weekly_avg_obtype_sid_vx_mask_df = pd.DataFrame.copy(
-                            all_weekly_avg_obtype_sid_vx_mask_df.iloc[0,:],
-                            deep=True
-                        )
-                        weekly_avg_obtype_sid_vx_mask_df['FCST_LEAD'] = (
-                            str(weekly_avg_day_fhr_end).zfill(2)+'0000'
-                        )
-                        weekly_avg_obtype_sid_vx_mask_df['FCST_VALID_BEG'] = (
-                            weekly_avg_valid_end.strftime('%Y%m%d_%H%M%S')
-                        )
-                        weekly_avg_obtype_sid_vx_mask_df['FCST_VALID_END'] = (
-                            weekly_avg_valid_end.strftime('%Y%m%d_%H%M%S')
-                        )
-                        weekly_avg_obtype_sid_vx_mask_df['OBS_VALID_BEG'] = (
-                            weekly_avg_valid_end.strftime('%Y%m%d_%H%M%S')
-                        )
-                        weekly_avg_obtype_sid_vx_mask_df['OBS_VALID_END'] = (
-                            weekly_avg_valid_end.strftime('%Y%m%d_%H%M%S')
-                        )
-                        weekly_avg_obtype_sid_vx_mask_df['FCST_VAR'] = (
-                            weekly_avg_obtype_sid_vx_mask_df['FCST_VAR']
-                            +'_WEEKLYAVG'
-                        )
-                        weekly_avg_obtype_sid_vx_mask_df['OBS_VAR'] = (
-                            weekly_avg_obtype_sid_vx_mask_df['OBS_VAR']
-                            +'_WEEKLYAVG'
-                        )
-                        weekly_avg_obtype_sid_vx_mask_df['FCST'] = str(
-                            all_weekly_avg_obtype_sid_vx_mask_fcst_mean
-                        )
-                        weekly_avg_obtype_sid_vx_mask_df['OBS'] = str(
-                            all_weekly_avg_obtype_sid_vx_mask_obs_mean
-                        )
-                        if job_name == 'WeeklyAvg_Temp2m':
-                            weekly_avg_obtype_sid_vx_mask_df['CLIMO_MEAN'] = str(
-                                all_weekly_avg_obtype_sid_vx_mask_climo_mean
-                            )
-                        weekly_avg_df_list.append(
-                            weekly_avg_obtype_sid_vx_mask_df
-                        )
-            weekly_avg_df = pd.concat(
-                weekly_avg_df_list, axis=1, ignore_index=True
-            ).T
+            with open(weekly_avg_file_list[0], 'r') as infile:
+                input_file_header = infile.readline()
+            weekly_avg_df = sub_util.create_mpr_station_avg_df(
+                weekly_avg_file_list, MET_MPR_column_list, 12,
+                weekly_avg_day_fhr_end, weekly_avg_valid_end, '_WEEKLYAVG',
+                job_name == 'WeeklyAvg_Temp2m'
+            )
             weekly_avg_df.to_csv(
                 output_DATA_file, header=input_file_header,
                 index=None, sep=' ', mode='w'
@@ -141,7 +141,6 @@ while valid_hr <= int(valid_hr_end):
                       +weeks_avg_day_fhr_DATAROOT_input_file+" or "
                       +weeks_avg_day_fhr_COMIN_input_file)
             weeks_avg_day_fhr+=12
-        weeks_avg_df_list = []
         if os.path.exists(output_COMOUT_file):
             sub_util.copy_file(output_COMOUT_file, output_DATA_file)
             make_weeks_avg_output_file = False
@@ -164,99 +163,13 @@ while valid_hr <= int(valid_hr_end):
         if make_weeks_avg_output_file:
             print(f"DATA Output File: {output_DATA_file}")
             print(f"COMOUT Output File: {output_COMOUT_file}")
-            all_weeks_avg_df = pd.DataFrame(columns=MET_MPR_column_list)
-            for weeks_avg_file in weeks_avg_file_list:
-                with open(weeks_avg_file, 'r') as infile:
-                    input_file_header = infile.readline()
-                weeks_avg_file_df = pd.read_csv(weeks_avg_file, sep=" ", skiprows=1,
-                                                skipinitialspace=True, header=None,
-                                                names=MET_MPR_column_list,
-                                                na_filter=False, dtype=str)
-                all_weeks_avg_df = pd.concat(
-                    [all_weeks_avg_df, weeks_avg_file_df], ignore_index=True
-                )
-            for obtype in all_weeks_avg_df['OBTYPE'].unique():
-                all_weeks_avg_obtype_df = all_weeks_avg_df.loc[
-                    all_weeks_avg_df['OBTYPE'] == obtype
-                ]
-                for sid in all_weeks_avg_obtype_df['OBS_SID'].unique():
-                    all_weeks_avg_obtype_sid_df = (
-                        all_weeks_avg_obtype_df.loc[
-                            all_weeks_avg_obtype_df['OBS_SID'] == sid
-                        ]
-                    )
-                    for vx_mask \
-                            in all_weeks_avg_obtype_sid_df['VX_MASK'].unique():
-                        all_weeks_avg_obtype_sid_vx_mask_df = (
-                            all_weeks_avg_obtype_sid_df.loc[
-                                all_weeks_avg_obtype_sid_df['VX_MASK']\
-                                == vx_mask
-                            ]
-                        )
-                        if len(all_weeks_avg_obtype_sid_vx_mask_df) < 23:
-                            continue
-                        all_weeks_avg_obtype_sid_vx_mask_fcst_mean = (
-                            np.array(
-                                all_weeks_avg_obtype_sid_vx_mask_df['FCST']\
-                                .values, dtype=float
-                            ).mean()
-                        )
-                        all_weeks_avg_obtype_sid_vx_mask_obs_mean = (
-                            np.array(
-                                all_weeks_avg_obtype_sid_vx_mask_df['OBS']\
-                                .values, dtype=float
-                            ).mean()
-                        )
-                        if job_name == 'Weeks3_4Avg_Temp2m':
-                            all_weeks_avg_obtype_sid_vx_mask_climo_mean = (
-                                np.array(
-                                    all_weeks_avg_obtype_sid_vx_mask_df['CLIMO_MEAN']\
-                                    .values, dtype=float
-                                ).mean()
-                            )
-                        weeks_avg_obtype_sid_vx_mask_df = pd.DataFrame.copy(
-                            all_weeks_avg_obtype_sid_vx_mask_df.iloc[0,:],
-                            deep=True
-                        )
-                        weeks_avg_obtype_sid_vx_mask_df['FCST_LEAD'] = (
-                            str(weeks_avg_day_fhr_end).zfill(2)+'0000'
-                        )
-                        weeks_avg_obtype_sid_vx_mask_df['FCST_VALID_BEG'] = (
-                            weeks_avg_valid_end.strftime('%Y%m%d_%H%M%S')
-                        )
-                        weeks_avg_obtype_sid_vx_mask_df['FCST_VALID_END'] = (
-                            weeks_avg_valid_end.strftime('%Y%m%d_%H%M%S')
-                        )
-                        weeks_avg_obtype_sid_vx_mask_df['OBS_VALID_BEG'] = (
-                            weeks_avg_valid_end.strftime('%Y%m%d_%H%M%S')
-                        )
-                        weeks_avg_obtype_sid_vx_mask_df['OBS_VALID_END'] = (
-                            weeks_avg_valid_end.strftime('%Y%m%d_%H%M%S')
-                        )
-                        weeks_avg_obtype_sid_vx_mask_df['FCST_VAR'] = (
-                            weeks_avg_obtype_sid_vx_mask_df['FCST_VAR']
-                            +'_WEEKS3_4AVG'
-                        )
-                        weeks_avg_obtype_sid_vx_mask_df['OBS_VAR'] = (
-                            weeks_avg_obtype_sid_vx_mask_df['OBS_VAR']
-                            +'_WEEKS3_4AVG'
-                        )
-                        weeks_avg_obtype_sid_vx_mask_df['FCST'] = str(
-                            all_weeks_avg_obtype_sid_vx_mask_fcst_mean
-                        )
-                        weeks_avg_obtype_sid_vx_mask_df['OBS'] = str(
-                            all_weeks_avg_obtype_sid_vx_mask_obs_mean
-                        )
-                        if job_name == 'Weeks3_4Avg_Temp2m':
-                            weeks_avg_obtype_sid_vx_mask_df['CLIMO_MEAN'] = str(
-                                all_weeks_avg_obtype_sid_vx_mask_climo_mean
-                            )
-                        weeks_avg_df_list.append(
-                            weeks_avg_obtype_sid_vx_mask_df
-                        )
-            weeks_avg_df = pd.concat(
-                weeks_avg_df_list, axis=1, ignore_index=True
-            ).T
+            with open(weeks_avg_file_list[0], 'r') as infile:
+                input_file_header = infile.readline()
+            weeks_avg_df = sub_util.create_mpr_station_avg_df(
+                weeks_avg_file_list, MET_MPR_column_list, 23,
+                weeks_avg_day_fhr_end, weeks_avg_valid_end, '_WEEKS3_4AVG',
+                job_name == 'Weeks3_4Avg_Temp2m'
+            )
             weeks_avg_df.to_csv(
                 output_DATA_file, header=input_file_header,
                 index=None, sep=' ', mode='w'
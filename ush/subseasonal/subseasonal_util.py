@@ -17,6 +17,8 @@ import glob
 import pandas as pd
 import logging
 import copy
+import importlib.util
+import time
 from time import sleep
 
 def run_shell_command(command):
@@ -120,6 +122,133 @@ def check_file_exists_size(file_name):
         file_good = False
     return file_good
 
+# Entries of the directories scanned for expected files and the
+# directory modification time they were listed at, keyed on directory
+# path, so each directory is listed again only when it changes
+_DIR_AVAILABILITY_CACHE = {}
+# Expected files found missing, for report_missing_files
+_MISSING_FILE_SET = set()
+
+def get_dir_availability(dir_path):
+    """! Get the entries of a directory, listing it again only
+         when its modification time has changed since it was
+         last listed
+
+         Args:
+             dir_path - directory path (string)
+
+         Returns:
+             dir_entry_dict - directory entries keyed on
+                              name (dictionary)
+    """
+    try:
+        dir_mtime = os.stat(dir_path).st_mtime_ns
+    except OSError:
+        dir_mtime = None
+    if dir_path in _DIR_AVAILABILITY_CACHE \
+            and _DIR_AVAILABILITY_CACHE[dir_path][0] == dir_mtime:
+        return _DIR_AVAILABILITY_CACHE[dir_path][1]
+    list_time = time.time_ns()
+    dir_entry_dict = {}
+    try:
+        with os.scandir(dir_path) as dir_entries:
+            for dir_entry in dir_entries:
+                dir_entry_dict[dir_entry.name] = dir_entry
+    except OSError:
+        pass
+    # A directory changed within a second of being listed can change
+    # again without a new modification time, so it is not kept
+    if dir_mtime is not None and list_time - dir_mtime < 1000000000:
+        _DIR_AVAILABILITY_CACHE.pop(dir_path, None)
+    else:
+        _DIR_AVAILABILITY_CACHE[dir_path] = (dir_mtime, dir_entry_dict)
+    return dir_entry_dict
+
+def forget_dir_availability(file_name):
+    """! Drop the cached entries of the directory a file is in,
+         for when the file is written after the directory was listed
+
+         Args:
+             file_name - file path (string)
+    """
+    _DIR_AVAILABILITY_CACHE.pop(
+        os.path.dirname(os.path.normpath(file_name)), None
+    )
+
+def get_file_availability(file_list, report_missing=True):
+    """! Resolve which of a list of files exist with one listing
+         per directory instead of a stat per file
+
+         Args:
+             file_list      - file paths (list of strings)
+             report_missing - add missing files to the missing
+                              file report (boolean)
+
+         Returns:
+             file_availability_dict - directory entry of each file,
+                                      holding its size and
+                                      modification time, None if
+                                      the file does not
+                                      exist (dictionary)
+    """
+    file_availability_dict = {}
+    dir_entry_dict_dict = {}
+    for file_name in file_list:
+        if file_name in file_availability_dict:
+            continue
+        dir_path, base_name = os.path.split(os.path.normpath(file_name))
+        if dir_path not in dir_entry_dict_dict:
+            dir_entry_dict_dict[dir_path] = get_dir_availability(dir_path)
+        dir_entry = dir_entry_dict_dict[dir_path].get(base_name)
+        if dir_entry is not None and dir_entry.is_symlink():
+            # Broken links do not exist, as in os.path.exists
+            try:
+                dir_entry.stat()
+            except OSError:
+                dir_entry = None
+        if dir_entry is None and report_missing:
+            _MISSING_FILE_SET.add(file_name)
+        file_availability_dict[file_name] = dir_entry
+    return file_availability_dict
+
+def check_file_available(file_name, report_missing=True):
+    """! Checks to see if file exists using the cached
+         directory listings
+
+         Args:
+             file_name      - file path (string)
+             report_missing - add file to the missing
+                              file report if it does not
+                              exist (boolean)
+
+         Returns:
+             file_available - if file exists or not (boolean)
+    """
+    file_available = get_file_availability(
+        [file_name], report_missing=report_missing
+    )[file_name] is not None
+    return file_available
+
+def report_missing_files(max_files_per_dir=5):
+    """! Print a compact report of the expected files found
+         missing, grouped by directory, and reset it
+
+         Args:
+             max_files_per_dir - number of file names to list
+                                 per directory (integer)
+    """
+    missing_file_dict = {}
+    for missing_file in sorted(_MISSING_FILE_SET):
+        dir_path, base_name = os.path.split(os.path.normpath(missing_file))
+        missing_file_dict.setdefault(dir_path, []).append(base_name)
+    for dir_path, base_name_list in missing_file_dict.items():
+        missing_file_names = ', '.join(base_name_list[:max_files_per_dir])
+        if len(base_name_list) > max_files_per_dir:
+            missing_file_names+=', ...'
+        print(f"NOTE: {len(base_name_list)} expected file(s) missing in "
+              +f"{dir_path}: {missing_file_names}")
+    _MISSING_FILE_SET.clear()
+
 def log_missing_file_model(log_missing_file, missing_file, model, init_dt,
                            fhr):
     """! This writes a missing model file to a log
@@ -187,6 +316,7 @@ def copy_file(source_file, dest_file):
     if check_file_exists_size(source_file):
         print("Copying "+source_file+" to "+dest_file)
         shutil.copy2(source_file, dest_file)
+        forget_dir_availability(dest_file)
 
 def convert_grib1_grib2(grib1_file, grib2_file):
     """! Converts GRIB1 data to GRIB2
@@ -1142,7 +1272,7 @@ def check_gefs_prep_files(job_dict):
                 fhr_check_output_dict[fhr_key][fhr_fileN_key]['forecast_hour'],
                 {}
             )
-            if os.path.exists(fhr_fileN_COMOUT):
+            if check_file_available(fhr_fileN_COMOUT, report_missing=False):
                 fhr_key_output_files_exist_list.append(True)
                 print("COMOUT files "+fhr_fileN_restart+" exist and will not"
                       +" be generated in prep restart")
@@ -1193,7 +1323,7 @@ def check_ccpa_prep_files(DATA, STEP, INITDATE):
         nf+=1
     ccpa_files_exist_list = []
     for ccpa_file in ccpa_file_list:
-        if os.path.exists(ccpa_file):
+        if check_file_available(ccpa_file):
             ccpa_files_exist_list.append(True)
         else:
             ccpa_files_exist_list.append(False)
@@ -1287,7 +1417,7 @@ def check_daily_model_files(job_dict):
                 fhr_check_input_dict[fhr_key][fhr_fileN_key]['forecast_hour'],
                 {}
             )
-            if os.path.exists(fhr_fileN):
+            if check_file_available(fhr_fileN):
                 fhr_key_input_files_exist_list.append(True)
                 if job_dict['JOB_GROUP'] == 'reformat_data' \
                         and job_dict['job_name'] == 'SST':
@@ -1322,7 +1452,7 @@ def check_daily_model_files(job_dict):
                 fhr_check_output_dict[fhr_key][fhr_fileN_key]['forecast_hour'],
                 {}
             )
-            if os.path.exists(fhr_fileN_COMOUT):
+            if check_file_available(fhr_fileN_COMOUT, report_missing=False):
                 # Copy restart files from COMOUT to DATA dir
                 # to be used in restart and remove from fhr_list
                 copy_file(fhr_fileN_COMOUT,fhr_fileN_DATA)
@@ -1533,8 +1663,8 @@ def check_weekly_model_files(job_dict):
                     ['anl'],
                     {}
                 )
-                if os.path.exists(fhr_fileN) \
-                        and os.path.exists(truth_file):
+                if check_file_available(fhr_fileN) \
+                        and check_file_available(truth_file):
                     fhr_key_input_files_exist_list.append(True)
                     fhr_list.append(
                         fhr_check_input_dict[fhr_key][fhr_fileN_key]\
@@ -1546,7 +1676,7 @@ def check_weekly_model_files(job_dict):
                     and job_dict['job_name'] in ['Concentration',
                                                  'SST',
                                                  'GenEnsProd']:
-                if os.path.exists(fhr_fileN):
+                if check_file_available(fhr_fileN):
                     fhr_key_input_files_exist_list.append(True)
                     fhr_list.append(
                         fhr_check_input_dict[fhr_key][fhr_fileN_key]\
@@ -1556,7 +1686,7 @@ def check_weekly_model_files(job_dict):
                     fhr_key_input_files_exist_list.append(False)
             elif job_dict['JOB_GROUP'] == 'assemble_data' \
                     and job_dict['job_name'] == 'TempAnom2m':
-                if os.path.exists(fhr_fileN):
+                if check_file_available(fhr_fileN):
                     fhr_key_input_files_exist_list.append(True)
                     fhr_list.append(
                         fhr_check_input_dict[fhr_key][fhr_fileN_key]\
@@ -1589,7 +1719,7 @@ def check_weekly_model_files(job_dict):
                 fhr_check_output_dict[fhr_key][fhr_fileN_key]['forecast_hour'],
                 {}
             )
-            if os.path.exists(fhr_fileN_COMOUT):
+            if check_file_available(fhr_fileN_COMOUT, report_missing=False):
                 # Copy restart files from COMOUT to DATA dir
                 # to be used in restart and remove from fhr_list
                 copy_file(fhr_fileN_COMOUT,fhr_fileN_DATA)
@@ -1703,7 +1833,7 @@ def check_monthly_model_files(job_dict):
                 fhr_check_input_dict[fhr_key][fhr_fileN_key]['forecast_hour'],
                 {}
             )
-            if os.path.exists(fhr_fileN):
+            if check_file_available(fhr_fileN):
                 fhr_key_input_files_exist_list.append(True)
                 if job_dict['JOB_GROUP'] == 'reformat_data' \
                         and job_dict['job_name'] in ['Concentration',
@@ -1739,7 +1869,7 @@ def check_monthly_model_files(job_dict):
                 fhr_check_output_dict[fhr_key][fhr_fileN_key]['forecast_hour'],
                 {}
             )
-            if os.path.exists(fhr_fileN_COMOUT):
+            if check_file_available(fhr_fileN_COMOUT, report_missing=False):
                 # Copy restart files from COMOUT to DATA dir
                 # to be used in restart and remove from fhr_list
                 copy_file(fhr_fileN_COMOUT,fhr_fileN_DATA)
@@ -1947,8 +2077,8 @@ def check_days6_10_model_files(job_dict):
                     ['anl'],
                     {}
                 )
-                if os.path.exists(fhr_fileN) \
-                        and os.path.exists(truth_file):
+                if check_file_available(fhr_fileN) \
+                        and check_file_available(truth_file):
                     fhr_key_input_files_exist_list.append(True)
                     fhr_list.append(
                         fhr_check_input_dict[fhr_key][fhr_fileN_key]\
@@ -1958,7 +2088,7 @@ def check_days6_10_model_files(job_dict):
                     fhr_key_input_files_exist_list.append(False)
             elif job_dict['JOB_GROUP'] == 'reformat_data' \
                     and job_dict['job_name'] == 'GenEnsProd':
-                if os.path.exists(fhr_fileN):
+                if check_file_available(fhr_fileN):
                     fhr_key_input_files_exist_list.append(True)
                     fhr_list.append(
                         fhr_check_input_dict[fhr_key][fhr_fileN_key]\
@@ -1968,7 +2098,7 @@ def check_days6_10_model_files(job_dict):
                     fhr_key_input_files_exist_list.append(False)
             elif job_dict['JOB_GROUP'] == 'assemble_data' \
                     and job_dict['job_name'] == 'TempAnom2m':
-                if os.path.exists(fhr_fileN):
+                if check_file_available(fhr_fileN):
                     fhr_key_input_files_exist_list.append(True)
                     fhr_list.append(
                         fhr_check_input_dict[fhr_key][fhr_fileN_key]\
@@ -2001,7 +2131,7 @@ def check_days6_10_model_files(job_dict):
                 fhr_check_output_dict[fhr_key][fhr_fileN_key]['forecast_hour'],
                 {}
             )
-            if os.path.exists(fhr_fileN_COMOUT):
+            if check_file_available(fhr_fileN_COMOUT, report_missing=False):
                 # Copy restart files from COMOUT to DATA dir
                 # to be used in restart and remove from fhr_list
                 copy_file(fhr_fileN_COMOUT,fhr_fileN_DATA)
@@ -2211,8 +2341,8 @@ def check_weeks3_4_model_files(job_dict):
                     ['anl'],
                     {}
                 )
-                if os.path.exists(fhr_fileN) \
-                        and os.path.exists(truth_file):
+                if check_file_available(fhr_fileN) \
+                        and check_file_available(truth_file):
                     fhr_key_input_files_exist_list.append(True)
                     fhr_list.append(
                         fhr_check_input_dict[fhr_key][fhr_fileN_key]\
@@ -2222,7 +2352,7 @@ def check_weeks3_4_model_files(job_dict):
                     fhr_key_input_files_exist_list.append(False)
             elif job_dict['JOB_GROUP'] == 'reformat_data' \
                     and job_dict['job_name'] == 'GenEnsProd':
-                if os.path.exists(fhr_fileN):
+                if check_file_available(fhr_fileN):
                     fhr_key_input_files_exist_list.append(True)
                     fhr_list.append(
                         fhr_check_input_dict[fhr_key][fhr_fileN_key]\
@@ -2232,7 +2362,7 @@ def check_weeks3_4_model_files(job_dict):
                     fhr_key_input_files_exist_list.append(False)
             elif job_dict['JOB_GROUP'] == 'assemble_data' \
                     and job_dict['job_name'] == 'TempAnom2m':
-                if os.path.exists(fhr_fileN):
+                if check_file_available(fhr_fileN):
                     fhr_key_input_files_exist_list.append(True)
                     fhr_list.append(
                         fhr_check_input_dict[fhr_key][fhr_fileN_key]\
@@ -2265,7 +2395,7 @@ def check_weeks3_4_model_files(job_dict):
                 fhr_check_output_dict[fhr_key][fhr_fileN_key]['forecast_hour'],
                 {}
             )
-            if os.path.exists(fhr_fileN_COMOUT):
+            if check_file_available(fhr_fileN_COMOUT, report_missing=False):
                 # Copy restart files from COMOUT to DATA dir
                 # to be used in restart and remove from fhr_list
                 copy_file(fhr_fileN_COMOUT,fhr_fileN_DATA)
@@ -3330,7 +3460,7 @@ def check_model_files(job_dict):
                 fhr_check_input_dict[fhr_key][fhr_fileN_key]['forecast_hour'],
                 {}
             )
-            if os.path.exists(fhr_fileN):
+            if check_file_available(fhr_fileN):
                 fhr_key_input_files_exist_list.append(True)
                 if job_dict['JOB_GROUP'] == 'reformat_data' \
                         and job_dict['job_name'] in ['GeoHeightAnom',
@@ -3381,7 +3511,7 @@ def check_model_files(job_dict):
                 fhr_check_output_dict[fhr_key][fhr_fileN_key]['forecast_hour'],
                 {}
             )
-            if os.path.exists(fhr_fileN_COMOUT):
+            if check_file_available(fhr_fileN_COMOUT, report_missing=False):
                 # Copy restart files from COMOUT to DATA dir
                 copy_file(fhr_fileN_COMOUT,fhr_fileN_DATA)
             else:
@@ -3525,7 +3655,8 @@ def check_weekly_truth_files(job_dict):
     truth_output_files_exist_list = []
     truth_copy_output_DATA2COMOUT_list = truth_output_file_list
     for truth_file_tuple in truth_output_file_list:
-        if os.path.exists(truth_file_tuple[1]):
+        if check_file_available(truth_file_tuple[1],
+                                report_missing=False):
             truth_output_files_exist_list.append(True)
             truth_copy_output_DATA2COMOUT_list.remove(truth_file_tuple)
         else:
@@ -3536,7 +3667,7 @@ def check_weekly_truth_files(job_dict):
     else:
         truth_input_files_exist_list = []
         for truth_file in truth_input_file_list:
-            if os.path.exists(truth_file):
+            if check_file_available(truth_file):
                 truth_input_files_exist_list.append(True)
             else:
                 truth_input_files_exist_list.append(False)
@@ -3673,7 +3804,8 @@ def check_days6_10_truth_files(job_dict):
     truth_output_files_exist_list = []
     truth_copy_output_DATA2COMOUT_list = truth_output_file_list
     for truth_file_tuple in truth_output_file_list:
-        if os.path.exists(truth_file_tuple[1]):
+        if check_file_available(truth_file_tuple[1],
+                                report_missing=False):
             truth_output_files_exist_list.append(True)
             truth_copy_output_DATA2COMOUT_list.remove(truth_file_tuple)
         else:
@@ -3684,7 +3816,7 @@ def check_days6_10_truth_files(job_dict):
     else:
         truth_input_files_exist_list = []
         for truth_file in truth_input_file_list:
-            if os.path.exists(truth_file):
+            if check_file_available(truth_file):
                 truth_input_files_exist_list.append(True)
             else:
                 truth_input_files_exist_list.append(False)
@@ -3824,7 +3956,8 @@ def check_weeks3_4_truth_files(job_dict):
     truth_output_files_exist_list = []
     truth_copy_output_DATA2COMOUT_list = truth_output_file_list
     for truth_file_tuple in truth_output_file_list:
-        if os.path.exists(truth_file_tuple[1]):
+        if check_file_available(truth_file_tuple[1],
+                                report_missing=False):
             truth_output_files_exist_list.append(True)
             # Copy restart files from COMOUT to DATA dir
             copy_file(truth_file_tuple[1], truth_file_tuple[0])
@@ -3837,7 +3970,7 @@ def check_weeks3_4_truth_files(job_dict):
     else:
         truth_input_files_exist_list = []
         for truth_file in truth_input_file_list:
-            if os.path.exists(truth_file):
+            if check_file_available(truth_file):
                 truth_input_files_exist_list.append(True)
             else:
                 truth_input_files_exist_list.append(False)
@@ -4036,7 +4169,7 @@ def check_truth_files(job_dict):
                 truth_file_list.append(pb2nc_file)
     truth_files_exist_list = []
     for truth_file in truth_file_list:
-        if os.path.exists(truth_file):
+        if check_file_available(truth_file):
             truth_files_exist_list.append(True)
         else:
             truth_files_exist_list.append(False)
@@ -4070,6 +4203,73 @@ def check_stat_files(job_dict):
         stat_files_exist = False
     return stat_files_exist
 
+def create_mpr_station_avg_df(mpr_file_list, mpr_column_list, min_count,
+                              avg_fhr_end, avg_valid_end, var_suffix,
+                              avg_climo_mean):
+    """! Average MET MPR lines over the files for each station
+
+         Args:
+             mpr_file_list   - MET .stat files with MPR lines (strings)
+             mpr_column_list - MET MPR column names (strings)
+             min_count       - minimum number of lines needed for
+                               a station average (integer)
+             avg_fhr_end     - forecast hour at end of
+                               averaging period (integer)
+             avg_valid_end   - valid time at end of
+                               averaging period (datetime)
+             var_suffix      - suffix to add to FCST_VAR
+                               and OBS_VAR (string)
+             avg_climo_mean  - average CLIMO_MEAN or not (boolean)
+
+         Returns:
+             avg_df - MPR lines of the averages for each
+                      OBTYPE, OBS_SID, VX_MASK (dataframe)
+    """
+    mpr_file_df_list = []
+    for mpr_file in mpr_file_list:
+        mpr_file_df_list.append(
+            pd.read_csv(mpr_file, sep=" ", skiprows=1,
+                        skipinitialspace=True, header=None,
+                        names=mpr_column_list, na_filter=False, dtype=str)
+        )
+    all_df = pd.concat(mpr_file_df_list, ignore_index=True)
+    avg_cols = ['FCST', 'OBS']
+    if avg_climo_mean:
+        avg_cols.append('CLIMO_MEAN')
+    group_cols = ['OBTYPE', 'OBS_SID', 'VX_MASK']
+    value_df = all_df[avg_cols].astype(float)
+    value_df['ROW'] = np.arange(len(all_df))
+    for group_col in group_cols:
+        value_df[group_col] = all_df[group_col]
+    grouped = value_df.groupby(group_cols, sort=False)
+    group_df = grouped[avg_cols].mean()
+    group_df['COUNT'] = grouped.size()
+    group_df['ROW'] = grouped['ROW'].min()
+    # Keep the order of nested loops over OBTYPE, then OBS_SID,
+    # then VX_MASK in order of first appearance
+    group_df['OBTYPE_ROW'] = (
+        value_df.groupby('OBTYPE', sort=False)['ROW'].min()\
+        .reindex(group_df.index.get_level_values('OBTYPE')).values
+    )
+    group_df['OBTYPE_SID_ROW'] = (
+        value_df.groupby(['OBTYPE', 'OBS_SID'], sort=False)['ROW'].min()\
+        .reindex(group_df.index.droplevel('VX_MASK')).values
+    )
+    group_df = group_df[group_df['COUNT'] >= min_count].sort_values(
+        by=['OBTYPE_ROW', 'OBTYPE_SID_ROW', 'ROW']
+    )
+    avg_df = all_df.iloc[group_df['ROW'].values].reset_index(drop=True)
+    avg_valid_end_str = avg_valid_end.strftime('%Y%m%d_%H%M%S')
+    avg_df['FCST_LEAD'] = str(avg_fhr_end).zfill(2)+'0000'
+    for valid_col in ['FCST_VALID_BEG', 'FCST_VALID_END',
+                      'OBS_VALID_BEG', 'OBS_VALID_END']:
+        avg_df[valid_col] = avg_valid_end_str
+    avg_df['FCST_VAR'] = avg_df['FCST_VAR']+var_suffix
+    avg_df['OBS_VAR'] = avg_df['OBS_VAR']+var_suffix
+    for avg_col in avg_cols:
+        avg_df[avg_col] = [str(val) for val in group_df[avg_col].values]
+    return avg_df
+
 def get_obs_valid_hrs(obs):
     """! This returns the valid hour start, end, and increment
          information for a given observation
@@ -4475,6 +4675,133 @@ def condense_model_stat_files(logger, input_dir, output_file, model, obs,
             with open(output_file, 'w') as f:
                 f.write(met_header_cols+all_grep_output)
 
+def align_valid_dates(logger, model_stat_file_df, model_num_df_index,
+                      model_stat_file):
+    """! Align a model's stat file lines to the model's valid dates,
+         using the first line for valid dates with multiple lines
+
+         Args:
+             logger             - logger object
+             model_stat_file_df - dataframe of the model's
+                                  stat file lines
+             model_num_df_index - index of model and valid dates
+                                  (MultiIndex)
+             model_stat_file    - path to model's stat file (string)
+
+         Returns:
+             model_num_df - dataframe of the stat file lines on
+                            model_num_df_index, NaN for valid
+                            dates with no lines
+    """
+    nlines = len(model_stat_file_df)
+    model_stat_file_df = model_stat_file_df.drop_duplicates(
+        subset='FCST_VALID_BEG', keep='first'
+    )
+    if len(model_stat_file_df) != nlines:
+        logger.debug(f"Multiple lines matching valid dates in "
+                     +f"{model_stat_file} using first one")
+    valid_dates = model_num_df_index.get_level_values('valid_dates')
+    model_num_df = model_stat_file_df.set_index(
+        'FCST_VALID_BEG', drop=False
+    ).reindex(valid_dates)
+    model_num_df.index = model_num_df_index
+    missing_valid_dates = valid_dates[
+        ~valid_dates.isin(model_stat_file_df['FCST_VALID_BEG'])
+    ]
+    if len(missing_valid_dates) != 0:
+        logger.debug("No data matching valid dates "
+                     +f"{', '.join(missing_valid_dates)} in "
+                     +f"{model_stat_file}")
+    return model_num_df
+
+def get_binary_stat_file(stat_file):
+    """! Get the path of the Parquet copy of a condensed or
+         parsed stat file
+
+         Args:
+             stat_file - path to stat file (string)
+
+         Returns:
+             binary_stat_file - path to Parquet copy of
+                                stat file (string)
+    """
+    return os.path.splitext(stat_file)[0]+'.parquet'
+
+# Parquet copies of stat files need pyarrow, check for it once and
+# only warn about it missing once per process
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+_PYARROW_WARNING_SET = set()
+
+def write_binary_stat_df(logger, stat_df, stat_file):
+    """! Write a Parquet copy of a condensed or parsed stat file
+         for later jobs to read, the header columns are written as
+         strings and the line type columns as floats. Only done when
+         intermediate_stat_format is parquet and pyarrow is available,
+         the stat file is still what is copied to COMOUT
+
+         Args:
+             logger    - logger object
+             stat_df   - dataframe of the stat file
+             stat_file - path to stat file (string)
+
+         Returns:
+    """
+    if os.environ.get('intermediate_stat_format', 'stat').lower() \
+            != 'parquet':
+        return
+    if not _HAS_PYARROW:
+        if not _PYARROW_WARNING_SET:
+            logger.warning("intermediate_stat_format is parquet but "
+                           +"pyarrow is not available, not writing "
+                           +"Parquet copies of stat files")
+            _PYARROW_WARNING_SET.add('pyarrow')
+        return
+    binary_stat_file = get_binary_stat_file(stat_file)
+    col_list = stat_df.columns.tolist()
+    float_idx = col_list.index('TOTAL')
+    binary_stat_df = stat_df.astype(
+        {col: str for col in col_list[:float_idx]}
+    ).reset_index(drop=True)
+    binary_stat_df[col_list[float_idx:]] = (
+        binary_stat_df[col_list[float_idx:]].apply(
+            pd.to_numeric, errors='coerce'
+        ).astype(np.float64)
+    )
+    tmp_binary_stat_file = f"{binary_stat_file}.{os.getpid()}.tmp"
+    binary_stat_df.to_parquet(tmp_binary_stat_file, index=False,
+                              compression='zstd')
+    os.replace(tmp_binary_stat_file, binary_stat_file)
+    logger.debug(f"Wrote {binary_stat_file}")
+
+def read_binary_stat_df(logger, stat_file, col_list):
+    """! Read the Parquet copy of a condensed or parsed stat file,
+         if there is one that is not older than the stat file and
+         has the requested columns
+
+         Args:
+             logger    - logger object
+             stat_file - path to stat file (string)
+             col_list  - MET line type columns (strings)
+
+         Returns:
+             stat_df - dataframe of the stat file, None if there
+                       is no Parquet copy to use
+    """
+    if not _HAS_PYARROW:
+        return None
+    binary_stat_file = get_binary_stat_file(stat_file)
+    if not os.path.exists(binary_stat_file) \
+            or os.path.getmtime(binary_stat_file) \
+            < os.path.getmtime(stat_file):
+        return None
+    stat_df = pd.read_parquet(binary_stat_file)
+    if stat_df.columns.tolist() != col_list:
+        logger.debug(f"{binary_stat_file} columns do not match "
+                     +f"{stat_file}, not using it")
+        return None
+    logger.debug(f"Reading {binary_stat_file}")
+    return stat_df
+
 def build_df(logger, input_dir, output_dir, model_info_dict,
              met_info_dict, fcst_var_name, fcst_var_level, fcst_var_thresh,
              obs_var_name, obs_var_level, obs_var_thresh, line_type,
@@ -4512,6 +4839,7 @@ def build_df(logger, input_dir, output_dir, model_info_dict,
     met_version_line_type_col_list = get_met_line_type_cols(
         logger, met_info_dict['root'], met_info_dict['version'], line_type
     )
+    model_num_df_list = []
     for model_num in list(model_info_dict.keys()):
         model_num_name = (
             model_num+'/'+model_info_dict[model_num]['name']
@@ -4606,11 +4934,19 @@ def build_df(logger, input_dir, output_dir, model_info_dict,
                 obs_vat_thresh_letter = obs_var_thresh
             if os.path.exists(condensed_model_file):
                 logger.debug(f"Parsing file {condensed_model_file}")
-                condensed_model_df = pd.read_csv(
-                    condensed_model_file, sep=" ", skiprows=1,
-                    skipinitialspace=True, names=met_version_line_type_col_list,
-                    keep_default_na=False, dtype='str', header=None
+                condensed_model_df = read_binary_stat_df(
+                    logger, condensed_model_file,
+                    met_version_line_type_col_list
                 )
+                if condensed_model_df is None:
+                    condensed_model_df = pd.read_csv(
+                        condensed_model_file, sep=" ", skiprows=1,
+                        skipinitialspace=True,
+                        names=met_version_line_type_col_list,
+                        keep_default_na=False, dtype='str', header=None
+                    )
+                    write_binary_stat_df(logger, condensed_model_df,
+                                         condensed_model_file)
                 parsed_model_df = condensed_model_df[
                     (condensed_model_df['MODEL'] == model_dict['name'])
                      & (condensed_model_df['DESC'] == grid)
@@ -4650,8 +4986,10 @@ def build_df(logger, input_dir, output_dir, model_info_dict,
                 )
                 parsed_model_df.to_csv(
                     parsed_model_stat_file, header=met_version_line_type_col_list,
-                    index=None, sep=' ', mode='w'
+                    index=None, sep=' ', mode='w', na_rep='NA'
                 )
+                write_binary_stat_df(logger, parsed_model_df,
+                                     parsed_model_stat_file)
             if os.path.exists(parsed_model_stat_file):
                 logger.debug(f"Parsed {model_dict['name']} file "
                              +f"at {parsed_model_stat_file}")
@@ -4663,51 +5001,36 @@ def build_df(logger, input_dir, output_dir, model_info_dict,
             if os.path.exists(parsed_model_stat_file):
                 logger.debug(f"Reading {parsed_model_stat_file} for "
                              +f"{model_dict['name']}")
-                model_stat_file_df = pd.read_csv(
-                    parsed_model_stat_file, sep=" ", skiprows=1,
-                    skipinitialspace=True, names=met_version_line_type_col_list,
-                    na_values=['NA'], header=None
+                model_stat_file_df = read_binary_stat_df(
+                    logger, parsed_model_stat_file,
+                    met_version_line_type_col_list
                 )
-                df_dtype_dict = {}
-                float_idx = met_version_line_type_col_list.index('TOTAL')
-                for col in met_version_line_type_col_list:
-                    col_idx = met_version_line_type_col_list.index(col)
-                    if col_idx < float_idx:
-                        df_dtype_dict[col] = str
-                    else:
-                        df_dtype_dict[col] = np.float64
-                model_stat_file_df = model_stat_file_df.astype(df_dtype_dict)
-                for valid_date in met_format_valid_dates:
-                    model_stat_file_df_valid_date_idx_list = (
-                        model_stat_file_df.index[
-                            model_stat_file_df['FCST_VALID_BEG'] == valid_date
-                        ]
-                    ).tolist()
-                    if len(model_stat_file_df_valid_date_idx_list) == 0:
-                        logger.debug("No data matching valid date "
-                                     +f"{valid_date} in"
-                                     +f"{parsed_model_stat_file}")
-                        continue
-                    elif len(model_stat_file_df_valid_date_idx_list) > 1:
-                        logger.debug(f"Multiple lines matching valid date "
-                                     +f"{valid_date} in "
-                                     +f"{parsed_model_stat_file} "
-                                     +f"using first one")
-                    else:
-                        logger.debug(f"One line matching valid date "
-                                     +f"{valid_date} in "
-                                     +f"{parsed_model_stat_file}")
-                    model_num_df.loc[(model_num_name, valid_date)] = (
-                        model_stat_file_df.loc\
-                        [model_stat_file_df_valid_date_idx_list[0]]\
-                        [:]
+                if model_stat_file_df is None:
+                    model_stat_file_df = pd.read_csv(
+                        parsed_model_stat_file, sep=" ", skiprows=1,
+                        skipinitialspace=True,
+                        names=met_version_line_type_col_list,
+                        na_values=['NA'], header=None
+                    )
+                    df_dtype_dict = {}
+                    float_idx = met_version_line_type_col_list.index('TOTAL')
+                    for col in met_version_line_type_col_list:
+                        col_idx = met_version_line_type_col_list.index(col)
+                        if col_idx < float_idx:
+                            df_dtype_dict[col] = str
+                        else:
+                            df_dtype_dict[col] = np.float64
+                    model_stat_file_df = model_stat_file_df.astype(
+                        df_dtype_dict
                     )
+                model_num_df = align_valid_dates(
+                    logger, model_stat_file_df, model_num_df_index,
+                    parsed_model_stat_file
+                )
             else:
                 logger.warning(f"{parsed_model_stat_file} does not exist")
-        if model_num == 'model1':
-            all_model_df = model_num_df
-        else:
-            all_model_df = pd.concat([all_model_df, model_num_df])
+        model_num_df_list.append(model_num_df)
+    all_model_df = pd.concat(model_num_df_list)
     return all_model_df
 
 def calculate_stat(logger, data_df, line_type, stat):
@@ -6,10 +6,14 @@
 # Contact(s):    Marcel Caron
 # Developed:     Dec. 2, 2021 by Marcel Caron
 # Last Modified: Apr. 22, 2022 by Marcel Caron
-# Abstract:      Collection of functions that initialize and filter dataframes
+# Abstract:      Collection of functions that initialize and filter dataframes.
+#                The stat files of the period are read once per process into
+#                a typed dataframe indexed on level and threshold, and each
+#                plot slices what it needs from that dataframe.
 #
 ###############################################################################
 
+import io
 import os
 import sys
 import shutil
@@ -20,9 +24,14 @@ from datetime import timedelta as td
 
 SETTINGS_DIR = os.environ['USH_DIR']
 sys.path.insert(0, os.path.abspath(SETTINGS_DIR))
-from evs_wafs_atmos_plot_prune_stat_files import prune_data
+from evs_wafs_atmos_plot_prune_stat_files import (
+    prune_data, daterange, expand_met_stat_files
+)
 import evs_wafs_atmos_plot_util as plot_util
 
+# Typed dataframes of the stat files already read, by stat file list, line
+# type and MET version
+_STAT_DF_CACHE = {}
 
 # =================== FUNCTIONS =========================
 
@@ -175,6 +184,147 @@ def create_df(logger, stats_dir, pruned_data_dir, line_type, date_range,
         )
         return None
 
+def get_stat_file_list(logger, stats_dir, output_base_template, verif_case,
+                       verif_type, line_type, valid_range, eval_period,
+                       var_name, model_list, domain):
+    # Check for stat files, and list those matching the template for the
+    # valid range
+    if os.path.isdir(stats_dir):
+        if not len(os.listdir(stats_dir)):
+            e1 = f"{stats_dir} exists but is empty."
+            e2 = f"Populate {stats_dir} and retry."
+            logger.error(e1)
+            logger.error(e2)
+            raise OSError(e1+"\n"+e2)
+    else:
+        e1 = f"{stats_dir} does not exist."
+        e2 = f"Create and populate {stats_dir} and retry."
+        logger.error(e1)
+        logger.error(e2)
+        raise OSError(e1+"\n"+e2)
+    logger.info(f"Looking for stat files in {stats_dir} using the"
+                + f" template: {output_base_template}")
+    stat_file_list = []
+    for model in model_list:
+        for valid in daterange(valid_range[0], valid_range[1], td(days=1)):
+            stat_file_list = expand_met_stat_files(
+                stat_file_list, stats_dir, output_base_template,
+                str(verif_case).lower(), str(verif_type).lower(),
+                str(line_type).upper(), str(domain), str(var_name).upper(),
+                str(model), str(eval_period).upper(), valid
+            )
+    return sorted(set(stat_file_list))
+
+def read_stat_file(fpath, line_type, df_colnames, stat_colnames):
+    # Keep only the lines of the line type; the other line types have a
+    # different number of columns
+    line_type_idx = list(df_colnames).index('LINE_TYPE')
+    lines = []
+    with open(fpath, 'r') as sf:
+        sf.readline()
+        for line in sf:
+            line_cols = line.split(None, line_type_idx+1)
+            if (len(line_cols) > line_type_idx
+                    and line_cols[line_type_idx] == line_type):
+                lines.append(line)
+    if not lines:
+        return None
+    # Header columns stay strings ('NA' included), stat columns are floats
+    return pd.read_csv(
+        io.StringIO(''.join(lines)), sep=r'\s+', header=None,
+        names=df_colnames, keep_default_na=False,
+        na_values={col_name: ['NA', ''] for col_name in stat_colnames},
+        dtype={
+            col_name: (float if col_name in stat_colnames else str)
+            for col_name in df_colnames
+        }
+    )
+
+def format_thresh_columns(df):
+    # format_thresh() once per threshold rather than once per line
+    thresh_dict = {}
+    for thresh in df['FCST_THRESH'].unique():
+        if any(opt in thresh for opt in ['>', '<', '=', 'gt', 'ge', 'lt',
+                                         'le', 'eq', 'ne']):
+            thresh_symbol, thresh_letter = plot_util.format_thresh(thresh)
+            thresh_dict[thresh] = (thresh_symbol, str(thresh_letter)[2:])
+        else:
+            thresh_dict[thresh] = (thresh, thresh)
+    df['FCST_THRESH_SYMBOL'] = df['FCST_THRESH'].map(
+        {thresh: item[0] for thresh, item in thresh_dict.items()}
+    )
+    df['FCST_THRESH_VALUE'] = df['FCST_THRESH'].map(
+        {thresh: item[1] for thresh, item in thresh_dict.items()}
+    )
+    return df
+
+def get_stat_df(logger, stat_file_list, line_type, met_version):
+    line_type = str(line_type).upper()
+    cache_key = (tuple(stat_file_list), line_type, str(met_version))
+    if cache_key in _STAT_DF_CACHE:
+        return _STAT_DF_CACHE[cache_key]
+    df_og_colnames = plot_util.get_stat_file_base_columns(met_version)
+    df_line_type_colnames = plot_util.get_stat_file_line_type_columns(
+        logger, met_version, line_type
+    )
+    df_colnames = np.concatenate((df_og_colnames, df_line_type_colnames))
+    df_list = []
+    for fpath in stat_file_list:
+        logger.debug(f"Reading {line_type} lines from {fpath}")
+        try:
+            df_tmp = read_stat_file(
+                fpath, line_type, df_colnames, df_line_type_colnames
+            )
+        except (pd.errors.ParserError, ValueError, OSError) as e:
+            logger.warning(e)
+            logger.warning(f"The file in question:")
+            logger.warning(f"{fpath}")
+            logger.warning("Continuing ...")
+            continue
+        if df_tmp is not None:
+            df_list.append(df_tmp)
+    if df_list:
+        df = pd.concat(df_list, ignore_index=True)
+        df['LEAD_HOURS'] = df['FCST_LEAD'].str[:-4].astype(int)
+        df['VALID'] = pd.to_datetime(
+            df['FCST_VALID_END'], format='%Y%m%d_%H%M%S'
+        )
+        df['INIT'] = df['VALID'] - pd.to_timedelta(df['LEAD_HOURS'], unit='h')
+        df = format_thresh_columns(df)
+        df = df.set_index(
+            ['FCST_LEV', 'FCST_THRESH_SYMBOL'], drop=False
+        ).sort_index()
+        logger.info(f"Read {len(df)} {line_type} lines from"
+                    + f" {len(stat_file_list)} stat files")
+    else:
+        df = None
+    _STAT_DF_CACHE[cache_key] = df
+    return df
+
+def slice_stat_df(df, logger, model_list, fcst_level=None, fcst_thresh=None):
+    if df is None:
+        return None
+    if fcst_level is not None:
+        try:
+            df = df.loc[[str(fcst_level)]]
+        except KeyError:
+            df = df.iloc[0:0]
+    if fcst_thresh:
+        thresh_symbol_list = [
+            plot_util.format_thresh(thresh)[0] for thresh in fcst_thresh
+        ]
+        df = df[
+            df.index.get_level_values('FCST_THRESH_SYMBOL')
+            .isin(thresh_symbol_list)
+        ]
+    df = df[df['MODEL'].isin([str(model) for model in model_list])]
+    # The plots add columns, so give them their own copy
+    df = df.reset_index(drop=True)
+    if check_empty(df, logger, 'slice_stat_df'):
+        return None
+    else:
+        return df
+
 def filter_by_level_type(df, logger, verif_type):
     if df is None:
         return None
@@ -270,7 +420,7 @@ def filter_by_date_range(df, logger, date_type, date_range):
 def filter_by_hour(df, logger, date_type, date_hours):
     if df is None:
         return None
-    df = df.loc[[x in date_hours for x in df[str(date_type).upper()].dt.hour]]
+    df = df.loc[df[str(date_type).upper()].dt.hour.isin(date_hours)]
     if check_empty(df, logger, 'filter_by_hour'):
         return None
     else:
@@ -280,27 +430,21 @@ def get_preprocessed_data(logger, stats_dir, prune_dir, output_base_template,
                           verif_case, verif_type, line_type, date_type, 
                           date_range, eval_period, date_hours, fleads, 
                           var_name, fcst_var_names, obs_var_names, model_list, 
-                          domain, interp, met_version, clear_prune_dir):
+                          domain, interp, met_version, clear_prune_dir,
+                          fcst_level=None, fcst_thresh=None):
     valid_range = get_valid_range(
         logger, date_type, date_range, date_hours, fleads
     )
-    pruned_data_dir = run_prune_data(
-        logger, stats_dir, prune_dir, output_base_template, verif_case, verif_type, 
-        line_type, valid_range, eval_period, var_name, fcst_var_names, model_list, 
-        domain
-    )
-    df = create_df(
-        logger, stats_dir, pruned_data_dir, line_type, date_range, model_list,
-        met_version, clear_prune_dir
+    stat_file_list = get_stat_file_list(
+        logger, stats_dir, output_base_template, verif_case, verif_type,
+        line_type, valid_range, eval_period, var_name, model_list, domain
     )
+    df = get_stat_df(logger, stat_file_list, line_type, met_version)
+    df = slice_stat_df(df, logger, model_list, fcst_level, fcst_thresh)
     df = filter_by_level_type(df, logger, verif_type)
     df = filter_by_var_name(df, logger, fcst_var_names, obs_var_names)
     df = filter_by_interp(df, logger, interp)
     df = filter_by_domain(df, logger, domain)
-    df = create_lead_hours(df, logger)
-    df = create_valid_datetime(df, logger)
-    df = create_init_datetime(df, logger)
     df = filter_by_date_range(df, logger, date_type, date_range)
     df = filter_by_hour(df, logger, date_type, date_hours)
     return df
-
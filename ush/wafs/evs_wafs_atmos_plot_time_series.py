@@ -166,11 +166,7 @@ def plot_time_series(df: pd.DataFrame, logger: logging.Logger,
             logger.error(e)
             logger.error("Quitting ...")
             raise ValueError(e+"\nQuitting ...")
-        df_thresh_symbol, df_thresh_letter = list(
-            zip(*[plot_util.format_thresh(t) for t in df['FCST_THRESH']])
-        )
-        df['FCST_THRESH_SYMBOL'] = df_thresh_symbol
-        df['FCST_THRESH_VALUE'] = [str(item)[2:] for item in df_thresh_letter]
+        # FCST_THRESH_SYMBOL and FCST_THRESH_VALUE come with the preprocessed df
         requested_thresh_value = [
             str(item)[2:] for item in requested_thresh_letter
         ]
@@ -1132,7 +1128,7 @@ def main():
                         VERIF_TYPE, LINE_TYPE, DATE_TYPE, date_range, EVAL_PERIOD, 
                         date_hours, [flead], requested_var, fcst_var_names, 
                         obs_var_names, MODELS, domain, INTERP, MET_VERSION, 
-                        clear_prune_dir
+                        clear_prune_dir, fcst_level=fcst_level
                     )
                     if df is None:
                         continue